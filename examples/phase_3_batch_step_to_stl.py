@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+"""
+Phase 3 Extension: Parallel Batch STEP -> STL Converter
+# 第三阶段扩展：并行批量 STEP -> STL 转换器
+
+`process_step_to_stl` in `phase_3_interoperability.py` converts exactly one
+file, serially. This script turns the same read -> mesh -> write chain into a
+command-line batch converter:
+# `phase_3_interoperability.py` 中的 `process_step_to_stl` 只能串行地转换一个文件。
+# 本脚本把同样的 读取 -> 网格化 -> 写入 流程改造为一个命令行批量转换器：
+
+1.  Inputs can be files, directories (searched recursively) or glob patterns.
+    # 1. 输入可以是文件、目录（递归搜索）或通配符模式。
+2.  Files are converted in a configurable process pool.
+    # 2. 文件在可配置大小的进程池中转换。
+3.  Outputs newer than their input are skipped.
+    # 3. 比输入文件更新的输出会被跳过。
+4.  Failing inputs are retried, then optionally moved to a quarantine directory.
+    A worker crash is pinned on a file by re-running it alone first.
+    # 4. 失败的输入会被重试，之后可选择移动到隔离目录。
+    #    工作进程崩溃时，先单独重新运行相关文件，以确定是哪个文件导致了崩溃。
+5.  Per-file timings and a summary throughput figure are printed.
+    # 5. 打印每个文件的耗时以及总体吞吐量。
+
+Usage / 用法:
+    python examples/phase_3_batch_step_to_stl.py vendor/ "incoming/**/*.stp" -o stl_out -j 8
+
+Run without arguments to convert a few generated demo files.
+# 不带参数运行时，会转换几个自动生成的演示文件。
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.STEPControl import STEPControl_Reader
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.ShapeFix import ShapeFix_Shape
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.StlAPI import StlAPI_Writer
+
+from phase_3_interoperability import create_source_step_file
+
+STEP_SUFFIXES = (".step", ".stp")
+
+def _glob_root(pattern):
+    """
+    Returns the leading directory of a glob pattern that contains no wildcards.
+    # 返回通配符模式中不含通配符的前导目录。
+    """
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    else:
+        # A plain file name: its directory is the root.
+        # # 普通文件名：其所在目录就是根目录。
+        parts = parts[:-1]
+    return os.path.abspath(os.sep.join(parts) or (os.sep if pattern.startswith(os.sep) else "."))
+
+def collect_inputs(patterns):
+    """
+    Expands files, directories and glob patterns into `(path, relative_path)` pairs.
+    # 将文件、目录和通配符模式展开为 `(路径, 相对路径)` 对。
+
+    The relative path is taken from the common root of all directory inputs
+    and non-wildcard glob prefixes, so `a/part.step` and `b/part.step` keep
+    their directories. It is used to mirror the input tree in the output and
+    quarantine directories.
+    # 相对路径以所有目录输入和通配符模式中不含通配符的前缀的公共根目录为起点，
+    # 因此 `a/part.step` 和 `b/part.step` 会保留各自的目录。它用于在输出目录和隔离目录中复刻输入目录结构。
+    """
+    paths, roots = set(), []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            roots.append(os.path.abspath(pattern))
+            for root, _, files in os.walk(pattern):
+                for name in files:
+                    if name.lower().endswith(STEP_SUFFIXES):
+                        paths.add(os.path.abspath(os.path.join(root, name)))
+        else:
+            matches = [os.path.abspath(path) for path in glob.glob(pattern, recursive=True)
+                       if os.path.isfile(path) and path.lower().endswith(STEP_SUFFIXES)]
+            if matches:
+                roots.append(_glob_root(pattern))
+                paths.update(matches)
+    if not paths:
+        return []
+    common_root = os.path.commonpath(roots)
+    return sorted((path, os.path.relpath(path, common_root)) for path in paths)
+
+def is_up_to_date(in_path, out_path):
+    """
+    Returns True if `out_path` exists and is newer than `in_path`.
+    # 如果 `out_path` 存在且比 `in_path` 新，则返回 True。
+    """
+    return os.path.exists(out_path) and os.path.getmtime(out_path) >= os.path.getmtime(in_path)
+
+def convert_step_to_stl(in_step_path, out_stl_path, linear_deflection=1.0, angular_deflection=0.5,
+                        heal=False, on_stage=None):
+    """
+    Worker: reads, meshes and writes one file and returns its timings.
+    # 工作进程：读取、网格化并写出一个文件，返回各阶段耗时。
+
+    Raises `RuntimeError` on failure. The STL is written to a temporary name
+    first, so an interrupted run never leaves a file that looks up to date.
+    With `heal=True` the shape goes through `ShapeFix_Shape` before meshing.
+    `on_stage`, if given, is called with the stage name ("read", "heal",
+    "mesh" or "write") before each stage; the conversion service uses it
+    for progress and cancellation.
+    # 失败时抛出 `RuntimeError`。STL会先写入一个临时文件名，因此被中断的运行不会留下看似最新的文件。
+    # `heal=True` 时，形状在网格化之前会经过 `ShapeFix_Shape` 修复。如果给出了 `on_stage`，
+    # 每个阶段开始之前都会以阶段名（"read"、"heal"、"mesh" 或 "write"）调用它；转换服务用它来报告进度和取消任务。
+    """
+    def begin(stage):
+        if on_stage is not None:
+            on_stage(stage)
+        return time.perf_counter()
+
+    timings = {}
+    start = begin("read")
+    step_reader = STEPControl_Reader()
+    if step_reader.ReadFile(in_step_path) != IFSelect_RetDone:
+        raise RuntimeError("could not read STEP file")
+    step_reader.TransferRoots()
+    shape = step_reader.OneShape()
+    if shape.IsNull():
+        raise RuntimeError("no shape transferred")
+    timings["read_s"] = time.perf_counter() - start
+
+    if heal:
+        start = begin("heal")
+        fixer = ShapeFix_Shape(shape)
+        fixer.Perform()
+        shape = fixer.Shape()
+        timings["heal_s"] = time.perf_counter() - start
+
+    start = begin("mesh")
+    BRepMesh_IncrementalMesh(shape, linear_deflection, False, angular_deflection, False)
+    timings["mesh_s"] = time.perf_counter() - start
+
+    start = begin("write")
+    os.makedirs(os.path.dirname(out_stl_path) or ".", exist_ok=True)
+    partial_path = out_stl_path + ".part"
+    stl_writer = StlAPI_Writer()
+    stl_writer.SetASCIIMode(False)
+    if not stl_writer.Write(shape, partial_path):
+        raise RuntimeError("could not write STL file")
+    os.replace(partial_path, out_stl_path)
+    timings["write_s"] = time.perf_counter() - start
+    return timings
+
+def run_batch(jobs, workers, linear_deflection, angular_deflection, retries):
+    """
+    Converts `jobs` (`(in_path, out_path)` pairs) in a process pool.
+    # 在进程池中转换 `jobs`（`(输入路径, 输出路径)` 对）。
+
+    A worker that crashes inside OCCT breaks the whole pool, so every
+    unfinished file fails with `BrokenProcessPool`. Those files are re-run
+    alone, each in its own single-worker pool (`workers` pools at a time),
+    and only a file that crashes on its own is reported. Files that raise
+    an ordinary exception are retried up to `retries` times, every round in
+    a fresh pool. Returns `(results, failures)` keyed by input path.
+    # 在OCCT内部崩溃的工作进程会使整个进程池失效，所有未完成的文件都会以 `BrokenProcessPool` 失败。
+    # 这些文件会被单独重新运行，每个都在自己的单工作进程池中（同时最多 `workers` 个进程池），
+    # 只有单独运行时仍然崩溃的文件才会被报告。抛出普通异常的文件最多重试 `retries` 次，
+    # 每一轮都使用新的进程池。返回以输入路径为键的 `(results, failures)`。
+    """
+    results, failures = {}, {}
+    max_pools = workers or os.cpu_count() or 1
+
+    def record(in_path, future):
+        """
+        Stores the outcome of one future; returns False when the file must be retried.
+        # 记录一个future的结果；当文件需要重试时返回 False。
+        """
+        try:
+            timings = future.result()
+        except Exception as error:
+            failures[in_path] = f"{type(error).__name__}: {error}"
+            print(f"  FAIL {in_path}: {failures[in_path]}")
+            return False
+        failures.pop(in_path, None)
+        results[in_path] = timings
+        print(f"  OK   {in_path} (read {timings['read_s']:.2f} s, mesh {timings['mesh_s']:.2f} s, "
+              f"write {timings['write_s']:.2f} s)")
+        #   成功 {输入} (读取 ... 秒, 网格化 ... 秒, 写入 ... 秒)
+        return True
+
+    pending = list(jobs)
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        if attempt:
+            print(f"\n--- Retry round {attempt}: {len(pending)} file(s) ---")
+            # --- 第 {attempt} 轮重试：... 个文件 ---
+        failed, suspects = [], []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(convert_step_to_stl, in_path, out_path, linear_deflection, angular_deflection): (in_path, out_path)
+                for in_path, out_path in pending
+            }
+            for future in as_completed(futures):
+                in_path, out_path = futures[future]
+                if isinstance(future.exception(), BrokenProcessPool):
+                    # Any unfinished file may have killed the pool: not a failure yet.
+                    # # 任何未完成的文件都可能导致了进程池失效：暂不算作失败。
+                    suspects.append((in_path, out_path))
+                elif not record(in_path, future):
+                    failed.append((in_path, out_path))
+
+        # Re-run each suspect alone, so only the file that crashes again is blamed.
+        # # 单独重新运行每个嫌疑文件，只有再次崩溃的文件才会被认定为罪魁祸首。
+        for start in range(0, len(suspects), max_pools):
+            batch = suspects[start:start + max_pools]
+            pools = [ProcessPoolExecutor(max_workers=1) for _ in batch]
+            try:
+                futures = [(job, pool.submit(convert_step_to_stl, job[0], job[1], linear_deflection, angular_deflection))
+                           for job, pool in zip(batch, pools)]
+                for (in_path, out_path), future in futures:
+                    crashed = isinstance(future.exception(), BrokenProcessPool)
+                    if not record(in_path, future) and not crashed:
+                        # A crash on its own is deterministic; ordinary errors get the next round.
+                        # # 单独运行时的崩溃是确定性的；普通错误进入下一轮重试。
+                        failed.append((in_path, out_path))
+            finally:
+                for pool in pools:
+                    pool.shutdown()
+        pending = failed
+    return results, failures
+
+def quarantine(inputs, quarantine_dir):
+    """
+    Moves failing inputs out of the way so the next nightly run skips them.
+    # 将失败的输入移走，使下一次夜间运行跳过它们。
+
+    `inputs` are `(path, relative_path)` pairs; the input tree is mirrored so
+    files with the same name in different directories do not collide.
+    # `inputs` 是 `(路径, 相对路径)` 对；隔离目录会复刻输入目录结构，因此不同目录中的同名文件不会冲突。
+    """
+    for path, rel_path in inputs:
+        target = os.path.join(quarantine_dir, rel_path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(path, target)
+        print(f"  Quarantined: {path} -> {target}")
+        # 已隔离：{path} -> {target}
+
+def parse_args(argv=None):
+    """
+    Parses the command-line options.
+    # 解析命令行参数。
+    """
+    parser = argparse.ArgumentParser(description="Batch STEP -> STL converter.")
+    parser.add_argument("inputs", nargs="*", help="STEP files, directories or glob patterns")
+    parser.add_argument("-o", "--output-dir", default="stl_output", help="directory for the STL files")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("-d", "--deflection", type=float, default=1.0, help="linear deflection")
+    parser.add_argument("-a", "--angular-deflection", type=float, default=0.5, help="angular deflection (radians)")
+    parser.add_argument("--retries", type=int, default=1, help="retry rounds for failing files")
+    parser.add_argument("--quarantine-dir", help="move inputs that still fail here")
+    parser.add_argument("--force", action="store_true", help="convert even if the output is up to date")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Runs the batch conversion and prints a summary.
+    # 运行批量转换并打印汇总。
+    """
+    args = parse_args(argv)
+    demo_dir = None
+    if not args.inputs:
+        # No inputs: generate a few demo STEP files to convert.
+        # # 没有输入：生成几个演示用的STEP文件进行转换。
+        demo_dir = tempfile.mkdtemp(prefix="batch_step_demo_")
+        for i in range(4):
+            create_source_step_file(os.path.join(demo_dir, f"part_{i}.step"))
+        args.inputs = [demo_dir]
+        args.output_dir = os.path.join(demo_dir, "stl")
+
+    print("\n--- Batch STEP -> STL ---")
+    # --- 批量 STEP -> STL ---
+    jobs, skipped = [], 0
+    inputs = collect_inputs(args.inputs)
+    for in_path, rel_path in inputs:
+        out_path = os.path.join(args.output_dir, os.path.splitext(rel_path)[0] + ".stl")
+        if not args.force and is_up_to_date(in_path, out_path):
+            skipped += 1
+            continue
+        jobs.append((in_path, out_path))
+    print(f"{len(jobs)} file(s) to convert, {skipped} up to date, {args.workers} worker(s).")
+    # 需要转换 ... 个文件，... 个已是最新，... 个工作进程。
+
+    start = time.perf_counter()
+    results, failures = run_batch(jobs, args.workers, args.deflection, args.angular_deflection, args.retries)
+    elapsed = time.perf_counter() - start
+
+    if failures and args.quarantine_dir:
+        quarantine([(in_path, rel_path) for in_path, rel_path in inputs if in_path in failures],
+                   args.quarantine_dir)
+
+    # Summary throughput
+    # # 总体吞吐量
+    print("\n--- Summary ---")
+    # --- 汇总 ---
+    print(f"Converted: {len(results)}, failed: {len(failures)}, skipped: {skipped}")
+    # 已转换：...，失败：...，跳过：...
+    if elapsed > 0:
+        print(f"Wall time: {elapsed:.2f} s, throughput: {len(results) / elapsed:.2f} files/s")
+        # 总耗时：... 秒，吞吐量：... 文件/秒
+
+    if demo_dir:
+        shutil.rmtree(demo_dir)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,454 @@
+# -*- coding: utf-8 -*-
+
+"""
+Phase 3 Extension: Asyncio STEP -> STL Conversion Service
+# 第三阶段扩展：基于 asyncio 的 STEP -> STL 转换服务
+
+`phase_3_batch_step_to_stl.py` converts a fixed list of files and exits. This
+script runs the same read -> heal -> mesh -> write chain as a local service
+that clients submit jobs to over HTTP on localhost (or a Unix socket):
+# `phase_3_batch_step_to_stl.py` 转换一个固定的文件列表后就退出。本脚本把同样的
+# 读取 -> 修复 -> 网格化 -> 写入 流程作为一个本地服务运行，客户端通过 localhost 上的HTTP（或Unix套接字）提交任务：
+
+1.  Jobs wait in a bounded `asyncio.Queue`. When it is full, new submissions
+    are rejected with `429 Too Many Requests` and a `Retry-After` header, so
+    a flood of clients cannot make the service take on unbounded work.
+    # 1. 任务在一个有界的 `asyncio.Queue` 中等待。队列满时，新的提交会被 `429 Too Many Requests`
+    #    和 `Retry-After` 头拒绝，因此大量涌入的客户端无法让服务承担无限的工作量。
+2.  One dispatcher task per worker takes jobs from the queue and runs them in
+    a `ProcessPoolExecutor`, so at most `workers` conversions run at once.
+    # 2. 每个工作进程对应一个分发任务，它从队列中取出任务并在 `ProcessPoolExecutor` 中运行，
+    #    因此同时运行的转换最多为 `workers` 个。
+3.  Workers report the stage they are in through a manager queue; each job
+    has a status, a stage, a progress fraction and timings.
+    # 3. 工作进程通过一个管理器队列报告当前所处的阶段；每个任务都有状态、阶段、进度比例和耗时。
+4.  Queued jobs are cancelled immediately; running jobs stop at the next
+    stage boundary (OCCT calls cannot be interrupted from outside). Stopping
+    the service cancels every job that has not finished.
+    # 4. 排队中的任务会被立即取消；运行中的任务会在下一个阶段边界处停止（OCCT调用无法从外部中断）。
+    #    停止服务时，所有尚未结束的任务都会被取消。
+5.  When a worker crashes inside OCCT the whole pool breaks, so every job in
+    flight is rerun alone in a one-worker pool; only a job that crashes on
+    its own is marked failed. These reruns count against `workers` too, and
+    stopping the service shuts their pools down.
+    # 5. 某个工作进程在OCCT内部崩溃时，整个进程池都会失效，因此所有正在运行的任务都会在单工作进程的进程池中
+    #    单独重新运行；只有单独运行时仍然崩溃的任务才会被标记为失败。这些重新运行同样计入 `workers`，
+    #    停止服务时也会关闭它们的进程池。
+6.  Only the latest `max_finished` finished jobs are kept for status queries.
+    # 6. 只保留最近 `max_finished` 个已结束的任务以供状态查询。
+
+HTTP API / HTTP 接口:
+    POST   /jobs        {"input": "a.step", "output": "a.stl"}  -> 202 job | 400 | 429
+    GET    /jobs                                                -> 200 [job, ...]
+    GET    /jobs/<id>                                           -> 200 job | 404
+    DELETE /jobs/<id>                                           -> 202 job | 404 | 409
+    Other methods on /jobs or /jobs/<id>                        -> 405 with `Allow`
+
+Usage / 用法:
+    python examples/phase_3_conversion_service.py --serve --port 8765 -j 4
+    python examples/phase_3_conversion_service.py --serve --unix /tmp/convert.sock
+
+Run without arguments for a demo that floods the service with jobs.
+# 不带参数运行时，会执行一个向服务大量提交任务的演示。
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import shutil
+import asyncio
+import argparse
+import tempfile
+import multiprocessing
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# --- Imports ---
+# --- 导入 ---
+from phase_3_interoperability import create_source_step_file
+from phase_3_batch_step_to_stl import convert_step_to_stl
+
+STAGES = ("read", "heal", "mesh", "write")
+FINAL_STATES = ("done", "failed", "cancelled")
+REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 409: "Conflict", 429: "Too Many Requests"}
+
+class JobCancelled(Exception):
+    """
+    Raised inside a worker when its job was cancelled while running.
+    # 任务在运行期间被取消时，在工作进程中抛出。
+    """
+
+def convert_job(job_id, in_step_path, out_stl_path, linear_deflection, angular_deflection, progress, cancelled):
+    """
+    Worker: runs `convert_step_to_stl` with healing and returns its timings.
+    # 工作进程：以修复模式运行 `convert_step_to_stl`，返回各阶段耗时。
+
+    Before each stage the worker reports `(job_id, stage, fraction)` on the
+    `progress` queue and checks the shared `cancelled` dict.
+    # 在每个阶段开始之前，工作进程都会在 `progress` 队列上报告 `(job_id, stage, fraction)`，
+    # 并检查共享的 `cancelled` 字典。
+    """
+    def begin(stage):
+        if job_id in cancelled:
+            raise JobCancelled(f"cancelled before {stage}")
+        progress.put((job_id, stage, STAGES.index(stage) / len(STAGES)))
+
+    return convert_step_to_stl(in_step_path, out_stl_path, linear_deflection, angular_deflection,
+                               heal=True, on_stage=begin)
+
+class ConversionService:
+    """
+    Bounded job queue in front of a process pool, with status and cancellation.
+    # 位于进程池前面的有界任务队列，支持状态查询和取消。
+    """
+
+    def __init__(self, workers=2, max_queued=8, linear_deflection=1.0, angular_deflection=0.5, max_finished=1000):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.linear_deflection = linear_deflection
+        self.angular_deflection = angular_deflection
+        self.jobs = {}
+
+    async def start(self):
+        """
+        Starts the process pool, the dispatcher tasks and the progress relay.
+        # 启动进程池、分发任务和进度转发任务。
+        """
+        # Spawned workers do not inherit the client sockets of the event loop;
+        # forked ones would keep connections open after the server closes them.
+        # # 以 spawn 方式启动的工作进程不会继承事件循环中的客户端套接字；
+        # # 而以 fork 方式启动的进程会在服务器关闭连接之后仍然让连接保持打开。
+        self._context = multiprocessing.get_context("spawn")
+        self.queue = asyncio.Queue(maxsize=self.max_queued)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._context)
+        self.manager = self._context.Manager()
+        self.progress = self.manager.Queue()
+        self.cancelled = self.manager.dict()
+        # Every conversion, including a crash rerun in its own pool, holds one slot.
+        # # 每个转换（包括在单独进程池中的崩溃重跑）都占用一个名额。
+        self._slots = asyncio.Semaphore(self.workers)
+        self._retry_pools = set()
+        self._stopping = False
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        self._relay = asyncio.create_task(self._relay_progress())
+
+    async def stop(self):
+        """
+        Cancels every unfinished job, waits for the workers to stop and shuts down.
+        # 取消所有尚未结束的任务，等待工作进程停止，然后关闭。
+
+        Running conversions stop at their next stage boundary, including those
+        rerun in a one-worker pool.
+        # 正在运行的转换会在下一个阶段边界处停止，包括在单工作进程的进程池中重新运行的转换。
+        """
+        self._stopping = True
+        for job in self.jobs.values():
+            if job["state"] in ("queued", "running", "cancelling"):
+                if job["state"] != "queued":
+                    self.cancelled[job["id"]] = True
+                job.update(state="cancelled", error="service stopped")
+        for task in self._dispatchers:
+            task.cancel()
+        await asyncio.gather(*self._dispatchers, return_exceptions=True)
+        loop = asyncio.get_running_loop()
+        for pool in [self.pool, *self._retry_pools]:
+            await loop.run_in_executor(None, partial(pool.shutdown, wait=True, cancel_futures=True))
+        self._retry_pools.clear()
+        self.progress.put(None)
+        await self._relay
+        self.manager.shutdown()
+
+    def submit(self, in_path, out_path):
+        """
+        Queues a job and returns it; raises `asyncio.QueueFull` when saturated.
+        # 将任务加入队列并返回它；队列已满时抛出 `asyncio.QueueFull`。
+        """
+        job = {"id": uuid.uuid4().hex[:12], "input": in_path, "output": out_path, "state": "queued",
+               "stage": None, "progress": 0.0, "timings": {}, "error": None, "retried": False,
+               "submitted_at": time.time()}
+        self.queue.put_nowait(job["id"])
+        self.jobs[job["id"]] = job
+        self._forget_finished()
+        return job
+
+    def _forget_finished(self):
+        """
+        Drops the oldest finished jobs beyond `max_finished`.
+        # 丢弃超出 `max_finished` 的最早的已结束任务。
+        """
+        finished = [job_id for job_id, job in self.jobs.items() if job["state"] in FINAL_STATES]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    def cancel(self, job_id):
+        """
+        Cancels a queued job at once, or a running one at its next stage.
+        # 立即取消排队中的任务，或在下一个阶段取消运行中的任务。
+        """
+        job = self.jobs[job_id]
+        if job["state"] == "queued":
+            job["state"] = "cancelled"
+        elif job["state"] == "running":
+            self.cancelled[job_id] = True
+            job["state"] = "cancelling"
+        return job
+
+    async def _convert(self, pool, job):
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(
+                pool, convert_job, job["id"], job["input"], job["output"],
+                self.linear_deflection, self.angular_deflection, self.progress, self.cancelled)
+
+    async def _dispatch(self):
+        while True:
+            job_id = await self.queue.get()
+            # A job cancelled while queued may already have been forgotten.
+            # # 在排队时被取消的任务可能已经被丢弃。
+            job = self.jobs.get(job_id)
+            try:
+                if job is None or job["state"] == "cancelled":
+                    continue
+                job["state"] = "running"
+                pool = self.pool
+                try:
+                    try:
+                        job["timings"] = await self._convert(pool, job)
+                    except BrokenProcessPool:
+                        # A worker crashed inside OCCT; replace the pool once for all dispatchers.
+                        # # 某个工作进程在OCCT内部崩溃；为所有分发任务只替换一次进程池。
+                        if pool is self.pool:
+                            self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._context)
+                            pool.shutdown(wait=False)
+                        # Any job in flight may have caused the crash, so rerun this one alone.
+                        # # 任何正在运行的任务都可能是崩溃的原因，因此单独重新运行这个任务。
+                        job["retried"] = True
+                        isolated = ProcessPoolExecutor(max_workers=1, mp_context=self._context)
+                        self._retry_pools.add(isolated)
+                        try:
+                            job["timings"] = await self._convert(isolated, job)
+                        finally:
+                            # While stopping, `stop()` waits for the pools still tracked.
+                            # # 停止服务时，由 `stop()` 等待仍被跟踪的进程池结束。
+                            if not self._stopping:
+                                self._retry_pools.discard(isolated)
+                                isolated.shutdown(wait=False)
+                    job.update(state="done", stage=None, progress=1.0)
+                except JobCancelled:
+                    job["state"] = "cancelled"
+                except BrokenProcessPool:
+                    job.update(state="failed", error="worker process crashed")
+                except Exception as error:
+                    job.update(state="failed", error=f"{type(error).__name__}: {error}")
+            finally:
+                self.queue.task_done()
+
+    async def _relay_progress(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self.progress.get)
+            if item is None:
+                return
+            job_id, stage, fraction = item
+            job = self.jobs.get(job_id)
+            if job and job["state"] in ("running", "cancelling"):
+                job["stage"], job["progress"] = stage, fraction
+
+    def route(self, method, target, body):
+        """
+        Maps one HTTP request to `(status, payload, extra_headers)`.
+        # 将一个HTTP请求映射为 `(status, payload, extra_headers)`。
+        """
+        parts = [part for part in target.split("?")[0].split("/") if part]
+        if parts == ["jobs"] and method == "GET":
+            return 200, list(self.jobs.values()), {}
+        if parts == ["jobs"] and method == "POST":
+            request = json.loads(body or b"{}")
+            if not isinstance(request, dict) or not all(isinstance(request.get(key), str)
+                                                        for key in ("input", "output")):
+                return 400, {"error": "body must be an object with string 'input' and 'output'"}, {}
+            try:
+                return 202, self.submit(request["input"], request["output"]), {}
+            except asyncio.QueueFull:
+                return 429, {"error": "queue full", "queued": self.queue.qsize()}, {"Retry-After": "1"}
+        if parts == ["jobs"]:
+            return 405, {"error": "method not allowed"}, {"Allow": "GET, POST"}
+        if len(parts) == 2 and parts[0] == "jobs":
+            if parts[1] not in self.jobs:
+                return 404, {"error": "unknown job"}, {}
+            if method == "GET":
+                return 200, self.jobs[parts[1]], {}
+            if method == "DELETE":
+                job = self.jobs[parts[1]]
+                if job["state"] in FINAL_STATES:
+                    return 409, {"error": f"job already {job['state']}"}, {}
+                return 202, self.cancel(parts[1]), {}
+            return 405, {"error": "method not allowed"}, {"Allow": "GET, DELETE"}
+        return 404, {"error": "not found"}, {}
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves one HTTP/1.1 request per connection.
+        # 每个连接处理一个 HTTP/1.1 请求。
+        """
+        try:
+            request_line = (await reader.readline()).decode("latin-1")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            status, payload, extra_headers = self.route(method.upper(), target, body)
+        except (ValueError, asyncio.IncompleteReadError) as error:
+            status, payload, extra_headers = 400, {"error": str(error)}, {}
+
+        data = json.dumps(payload).encode("utf-8")
+        head = [f"HTTP/1.1 {status} {REASONS[status]}", "Content-Type: application/json",
+                f"Content-Length: {len(data)}", "Connection: close"]
+        head += [f"{name}: {value}" for name, value in extra_headers.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + data)
+        await writer.drain()
+        writer.close()
+
+async def http_request(host, port, method, path, payload=None):
+    """
+    Minimal client: sends one JSON request and returns `(status, payload)`.
+    # 最简客户端：发送一个JSON请求，返回 `(status, payload)`。
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+async def serve(args):
+    """
+    Runs the service until interrupted.
+    # 运行服务直到被中断。
+    """
+    service = ConversionService(args.workers, args.max_queued, args.deflection, args.angular_deflection,
+                                args.max_finished)
+    await service.start()
+    if args.unix:
+        server = await asyncio.start_unix_server(service.handle_connection, path=args.unix)
+        print(f"Serving on unix:{args.unix}")
+    else:
+        server = await asyncio.start_server(service.handle_connection, args.host, args.port)
+        print(f"Serving on http://{args.host}:{args.port}")
+    # 正在提供服务：...
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+async def run_demo(workers, max_queued):
+    """
+    Floods a service with jobs and shows backpressure, progress and cancellation.
+    # 向服务大量提交任务，展示背压、进度和取消。
+    """
+    print("\n--- Asyncio Conversion Service Demo ---")
+    # --- asyncio 转换服务演示 ---
+    demo_dir = tempfile.mkdtemp(prefix="convert_service_demo_")
+    step_path = os.path.join(demo_dir, "part.step")
+    create_source_step_file(step_path)
+
+    service = ConversionService(workers=workers, max_queued=max_queued)
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    try:
+        # 1. Submit more jobs than the queue can hold; the surplus is rejected.
+        # 1. 提交超过队列容量的任务；多出的部分会被拒绝。
+        accepted, rejected = [], 0
+        for i in range(max_queued + workers + 6):
+            status, job = await http_request("127.0.0.1", port, "POST", "/jobs",
+                                             {"input": step_path, "output": os.path.join(demo_dir, f"part_{i}.stl")})
+            if status == 202:
+                accepted.append(job["id"])
+            else:
+                rejected += 1
+        print(f"Accepted {len(accepted)} job(s), rejected {rejected} with 429.")
+        # 接受了 ... 个任务，以 429 拒绝了 ... 个。
+
+        # 2. Cancel the last accepted job, which is still queued.
+        # 2. 取消最后一个被接受的任务，它仍在排队。
+        status, job = await http_request("127.0.0.1", port, "DELETE", f"/jobs/{accepted[-1]}")
+        print(f"Cancel {accepted[-1]}: {status} -> {job['state']}")
+        # 取消 ...：... -> ...
+        bad_body_status, _ = await http_request("127.0.0.1", port, "POST", "/jobs", [])
+        wrong_method_status, _ = await http_request("127.0.0.1", port, "DELETE", "/jobs")
+        print(f"POST /jobs with a list body: {bad_body_status}, DELETE /jobs: {wrong_method_status}")
+        # 以列表作为请求体 POST /jobs：...，DELETE /jobs：...
+
+        # 3. Poll until every job has finished.
+        # 3. 轮询直到所有任务都结束。
+        while True:
+            status, jobs = await http_request("127.0.0.1", port, "GET", "/jobs")
+            states = [job["state"] for job in jobs]
+            running = [f"{job['id']}:{job['stage']}" for job in jobs if job["state"] == "running"]
+            print(f"  queued={states.count('queued')} running={running} done={states.count('done')}")
+            if not any(state in ("queued", "running", "cancelling") for state in states):
+                break
+            await asyncio.sleep(0.5)
+    finally:
+        server.close()
+        await server.wait_closed()
+        await service.stop()
+
+    # 4. Verification
+    # 4. 验证
+    assert rejected > 0
+    assert bad_body_status == 400 and wrong_method_status == 405
+    assert states.count("cancelled") == 1 and states.count("done") == len(accepted) - 1
+    print("Verification successful: the queue stayed bounded and all accepted jobs finished.")
+    # 验证成功：队列保持有界，所有被接受的任务都已结束。
+    shutil.rmtree(demo_dir)
+
+def parse_args(argv=None):
+    """
+    Parses the command-line options.
+    # 解析命令行参数。
+    """
+    parser = argparse.ArgumentParser(description="Asyncio STEP -> STL conversion service.")
+    parser.add_argument("--serve", action="store_true", help="run the service instead of the demo")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("-j", "--workers", type=int, default=2, help="number of worker processes")
+    parser.add_argument("-q", "--max-queued", type=int, default=8, help="jobs that may wait before 429")
+    parser.add_argument("--max-finished", type=int, default=1000, help="finished jobs kept for status queries")
+    parser.add_argument("-d", "--deflection", type=float, default=1.0, help="linear deflection")
+    parser.add_argument("-a", "--angular-deflection", type=float, default=0.5, help="angular deflection (radians)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Runs the service or the demo.
+    # 运行服务或演示。
+    """
+    args = parse_args(argv)
+    try:
+        if args.serve:
+            asyncio.run(serve(args))
+        else:
+            asyncio.run(run_demo(args.workers, args.max_queued))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
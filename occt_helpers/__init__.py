@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+"""
+Helpers shared by the examples of several OCCT packages.
+# 多个OCCT包的示例共用的辅助函数。
+
+- `occt_helpers.blobs`: shapes as `BinTools` binary blobs,
+  # `occt_helpers.blobs`：以 `BinTools` 二进制数据块表示形状，
+- `occt_helpers.pickling`: `copyreg` reducers for shapes and triangulations,
+  # `occt_helpers.pickling`：形状和三角化数据的 `copyreg` 归约函数，
+- `occt_helpers.mesh`: face triangulations as NumPy arrays, chunked and welded meshes,
+  # `occt_helpers.mesh`：以 NumPy 数组表示面的三角化，以及分块网格和焊接网格，
+- `occt_helpers.instances`: repeated-part detection for instanced exports.
+  # `occt_helpers.instances`：用于实例化导出的重复零件检测。
+
+Install the repository with `pip install -e .` so the examples can import
+this package from any directory.
+# 使用 `pip install -e .` 安装本仓库后，示例可以在任何目录下导入本包。
+"""
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shapes as `BinTools` binary blobs (BinTools example 1).
+# 以 `BinTools` 二进制数据块表示形状（BinTools 示例 1）。
+
+A `bytes` object can be sent to another process, stored in a cache or written
+to a database, which a `TopoDS_Shape` itself cannot.
+# `bytes` 对象可以发送到其他进程、存入缓存或写入数据库，而 `TopoDS_Shape` 本身做不到这些。
+"""
+
+import os
+import tempfile
+
+from OCC.Core.BinTools import bintools, BinTools_FormatVersion_CURRENT
+from OCC.Core.TopoDS import TopoDS_Shape
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_FACE
+
+def shape_to_bytes(shape, with_triangles=False):
+    """
+    Serializes a shape to bytes in the BinTools binary BRep format.
+    # 将形状以 BinTools 二进制BRep格式序列化为字节。
+
+    When `with_triangles` is True the face triangulations are stored too, so a
+    meshed shape stays meshed after the round trip.
+    # 当 `with_triangles` 为 True 时，面的三角化数据也会被保存，网格化后的形状在往返后仍保持网格化。
+    """
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    os.close(fd)
+    try:
+        if not bintools.Write(shape, path, with_triangles, False, BinTools_FormatVersion_CURRENT):
+            raise RuntimeError("BinTools failed to write the shape")
+        with open(path, "rb") as blob_file:
+            return blob_file.read()
+    finally:
+        os.remove(path)
+
+def shape_from_bytes(blob):
+    """
+    Rebuilds a shape from bytes produced by `shape_to_bytes`.
+    # 从 `shape_to_bytes` 生成的字节重建形状。
+    """
+    fd, path = tempfile.mkstemp(suffix=".bin")
+    try:
+        with os.fdopen(fd, "wb") as blob_file:
+            blob_file.write(blob)
+        shape = TopoDS_Shape()
+        if not bintools.Read(shape, path):
+            raise RuntimeError("BinTools failed to read the shape")
+        return shape
+    finally:
+        os.remove(path)
+
+def count_faces(shape):
+    """
+    Counts the faces of a shape.
+    # 统计形状中面的数量。
+    """
+    count = 0
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        count += 1
+        explorer.Next()
+    return count
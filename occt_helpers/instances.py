@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+"""
+Repeated-part detection shared by the GLB and STEP writers (RWGltf example 1).
+# GLB 和 STEP 写入器共用的重复零件检测（RWGltf 示例 1）。
+"""
+
+from OCC.Core.gp import gp_Vec, gp_Trsf, gp_Pnt, gp_Ax2, gp_Dir
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeCone
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+
+from occt_helpers.mesh import split_solids
+
+def find_instances(shape):
+    """
+    Groups the parts of `shape` by shared `TShape` and orientation.
+    # 按共享的 `TShape` 和方向对 `shape` 中的零件进行分组。
+
+    The parts are those of `split_solids`: the solids plus any shell, face,
+    wire, edge or vertex placed next to them. Returns `(parts, placements)`:
+    the location-free shape of every unique part, and one
+    `(part_index, TopLoc_Location)` pair per occurrence. A reversed part is
+    a different part, since its faces point the other way.
+    # 零件即 `split_solids` 返回的形状：所有实体，以及与它们并列的壳、面、线框、边或顶点。
+    # 返回 `(parts, placements)`：每个唯一零件的无位置形状，以及每次出现对应的 `(零件编号, TopLoc_Location)` 对。
+    # 反向的零件是不同的零件，因为它的面朝向相反。
+    """
+    tshape_map = TopTools_IndexedMapOfShape()
+    part_index = {}
+    parts, placements = [], []
+    for occurrence in split_solids(shape):
+        part = occurrence.Located(TopLoc_Location())
+        # `Add` returns the existing index for a shape with the same TShape and location.
+        # # 对于 TShape 和位置都相同的形状，`Add` 返回已有的编号。
+        key = (tshape_map.Add(part), occurrence.Orientation())
+        if key not in part_index:
+            part_index[key] = len(parts)
+            parts.append(part)
+        placements.append((part_index[key], occurrence.Location()))
+    return parts, placements
+
+def create_bolt_assembly(rows=10, cols=10):
+    """
+    Creates a compound of identical bolts that all share one `TShape`.
+    # 创建一个由完全相同的螺栓组成的组合体，所有螺栓共享同一个 `TShape`。
+    """
+    shank = BRepPrimAPI_MakeCylinder(3.0, 20.0).Shape()
+    head = BRepPrimAPI_MakeCone(gp_Ax2(gp_Pnt(0, 0, 20), gp_Dir(0, 0, 1)), 6.0, 4.0, 4.0).Shape()
+    bolt = BRepAlgoAPI_Fuse(shank, head).Shape()
+
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for i in range(rows):
+        for j in range(cols):
+            trsf = gp_Trsf()
+            trsf.SetTranslation(gp_Vec(i * 15.0, j * 15.0, 0.0))
+            builder.Add(compound, bolt.Located(TopLoc_Location(trsf)))
+    return compound
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+
+"""
+Mesh helpers shared by the BRepMesh, BRepGProp, StlAPI and RWGltf examples.
+# BRepMesh、BRepGProp、StlAPI 和 RWGltf 示例共用的网格辅助函数。
+
+- `indexed_faces`, `triangulation_to_arrays`, `collect_mesh_arrays`: face
+  triangulations as NumPy arrays (BRepMesh example 2),
+  # `indexed_faces`、`triangulation_to_arrays`、`collect_mesh_arrays`：以 NumPy 数组表示面的三角化（BRepMesh 示例 2），
+- `split_solids`, `arrays_to_triangulation`: process-pool meshing (BRepMesh example 3),
+  # `split_solids`、`arrays_to_triangulation`：进程池网格化（BRepMesh 示例 3），
+- `face_neighbours`, `iter_mesh_chunks`: streaming face chunks (BRepMesh example 5),
+  # `face_neighbours`、`iter_mesh_chunks`：按面分块的流式网格（BRepMesh 示例 5），
+- `build_welded_mesh`, `is_watertight`: welded indexed meshes (BRepMesh example 6).
+  # `build_welded_mesh`、`is_watertight`：焊接顶点的索引网格（BRepMesh 示例 6）。
+"""
+
+import numpy as np
+
+from OCC.Core.gp import gp_Pnt
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.Poly import Poly_Triangulation, Poly_Triangle
+from OCC.Core.TopAbs import (TopAbs_EDGE, TopAbs_FACE, TopAbs_VERTEX, TopAbs_COMPOUND, TopAbs_COMPSOLID,
+                             TopAbs_FORWARD, TopAbs_REVERSED)
+from OCC.Core.TopExp import TopExp_Explorer, topexp
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Iterator, topods
+from OCC.Core.TopTools import (TopTools_IndexedMapOfShape, TopTools_IndexedDataMapOfShapeListOfShape,
+                               TopTools_ListIteratorOfListOfShape)
+
+def indexed_faces(shape):
+    """
+    Returns the faces of a shape as a list whose position is a stable face id.
+    # 以列表形式返回形状的所有面，列表中的位置即为稳定的面编号。
+    """
+    face_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_FACE, face_map)
+    return [topods.Face(face_map.FindKey(i)) for i in range(1, face_map.Size() + 1)]
+
+def triangulation_to_arrays(face, triangulation, location):
+    """
+    Converts the `Poly_Triangulation` of one face into NumPy arrays.
+    # 将一个面的 `Poly_Triangulation` 转换为 NumPy 数组。
+
+    Returns `(vertices, triangles)`: an (N, 3) float64 array of node
+    coordinates in global space and an (M, 3) int64 array of zero-based node
+    indices, wound consistently with the face orientation.
+    # 返回 `(vertices, triangles)`：全局坐标下的 (N, 3) float64 节点数组，
+    # 以及与面方向一致的 (M, 3) int64 零起始节点索引数组。
+    """
+    nb_nodes = triangulation.NbNodes()
+    vertices = np.empty((nb_nodes, 3), dtype=np.float64)
+    for i in range(1, nb_nodes + 1):
+        p = triangulation.Node(i)
+        vertices[i - 1] = (p.X(), p.Y(), p.Z())
+
+    # Apply the face location once, as a matrix, instead of per node.
+    # # 以矩阵形式一次性应用面的位置变换，而不是逐个节点变换。
+    if not location.IsIdentity():
+        trsf = location.Transformation()
+        rotation = np.array([[trsf.Value(r, c) for c in range(1, 4)] for r in range(1, 4)])
+        translation = np.array([trsf.Value(r, 4) for r in range(1, 4)])
+        vertices = vertices @ rotation.T + translation
+
+    nb_triangles = triangulation.NbTriangles()
+    triangles = np.empty((nb_triangles, 3), dtype=np.int64)
+    for i in range(1, nb_triangles + 1):
+        triangles[i - 1] = triangulation.Triangle(i).Get()
+    triangles -= 1
+
+    # Reversed faces must flip the winding so that normals point outwards.
+    # # 反向的面需要翻转三角形绕向，使法向朝外。
+    if face.Orientation() == TopAbs_REVERSED:
+        triangles = triangles[:, [0, 2, 1]]
+    return vertices, triangles
+
+def collect_mesh_arrays(faces):
+    """
+    Concatenates the active triangulation of every face into one mesh.
+    # 将每个面当前激活的三角化数据拼接为一个网格。
+
+    Returns a dict with `vertices`, `triangles` (indices into `vertices`) and
+    `face_ids` (index of the source face for every triangle), plus the
+    `Poly_Triangulation` handle of every face (None for unmeshed faces).
+    # 返回一个字典，包含 `vertices`、`triangles`（指向 `vertices` 的索引）和
+    # `face_ids`（每个三角形所属面的编号），以及每个面的 `Poly_Triangulation` 句柄（未网格化的面为 None）。
+    """
+    all_vertices, all_triangles, all_face_ids, handles = [], [], [], []
+    offset = 0
+    for face_id, face in enumerate(faces):
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation(face, location)
+        handles.append(triangulation)
+        if triangulation is None:
+            continue
+        vertices, triangles = triangulation_to_arrays(face, triangulation, location)
+        all_vertices.append(vertices)
+        all_triangles.append(triangles + offset)
+        all_face_ids.append(np.full(len(triangles), face_id, dtype=np.int32))
+        offset += len(vertices)
+
+    return {
+        "vertices": np.concatenate(all_vertices) if all_vertices else np.empty((0, 3)),
+        "triangles": np.concatenate(all_triangles) if all_triangles else np.empty((0, 3), dtype=np.int64),
+        "face_ids": np.concatenate(all_face_ids) if all_face_ids else np.empty(0, dtype=np.int32),
+        "handles": handles,
+    }
+
+def _collect_parts(shape, parts):
+    """
+    Appends the non-compound sub-shapes of `shape` to `parts`, recursively.
+    # 递归地把 `shape` 中不是组合体的子形状追加到 `parts` 中。
+    """
+    if shape.ShapeType() not in (TopAbs_COMPOUND, TopAbs_COMPSOLID):
+        parts.append(shape)
+        return
+    # The iterator composes the locations and orientations of the children.
+    # # 迭代器会把子形状的位置和方向累积起来。
+    iterator = TopoDS_Iterator(shape)
+    while iterator.More():
+        _collect_parts(iterator.Value(), parts)
+        iterator.Next()
+
+def split_solids(shape):
+    """
+    Returns the solids of a shape, plus every shape that sits next to them.
+    # 返回形状中的所有实体，以及与它们并列的其他形状。
+
+    Compounds and compsolids are opened recursively. A shell, face, wire,
+    edge or vertex placed directly in a compound is returned as its own
+    part, so nothing outside the solids is dropped. A shape that is not a
+    compound, or an empty compound, is returned as is.
+    # 组合体和复合实体会被递归展开。直接放在组合体中的壳、面、线框、边或顶点会作为独立的零件返回，
+    # 因此实体之外的内容不会丢失。不是组合体的形状或空组合体会原样返回。
+    """
+    parts = []
+    if not shape.IsNull():
+        _collect_parts(shape, parts)
+    return parts or [shape]
+
+def arrays_to_triangulation(nodes, triangles):
+    """
+    Builds a `Poly_Triangulation` from local nodes and one-based triangles.
+    # 由局部节点和从1开始的三角形索引构建 `Poly_Triangulation`。
+    """
+    triangulation = Poly_Triangulation(len(nodes), len(triangles), False)
+    for i, (x, y, z) in enumerate(nodes, start=1):
+        triangulation.SetNode(i, gp_Pnt(float(x), float(y), float(z)))
+    for i, (n1, n2, n3) in enumerate(triangles, start=1):
+        triangulation.SetTriangle(i, Poly_Triangle(int(n1), int(n2), int(n3)))
+    return triangulation
+
+def face_neighbours(shape):
+    """
+    Returns the faces of `shape` and, for each, the set of ids of the faces sharing an edge with it.
+    # 返回 `shape` 的所有面，以及每个面与之共享边的其他面的编号集合。
+    """
+    face_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_FACE, face_map)
+    faces = [topods.Face(face_map.FindKey(i)) for i in range(1, face_map.Size() + 1)]
+    edge_faces = TopTools_IndexedDataMapOfShapeListOfShape()
+    topexp.MapShapesAndAncestors(shape, TopAbs_EDGE, TopAbs_FACE, edge_faces)
+
+    neighbours = [set() for _ in faces]
+    for i in range(1, edge_faces.Size() + 1):
+        face_ids = set()
+        iterator = TopTools_ListIteratorOfListOfShape(edge_faces.FindFromIndex(i))
+        while iterator.More():
+            face_ids.add(face_map.FindIndex(iterator.Value()) - 1)
+            iterator.Next()
+        for face_id in face_ids:
+            neighbours[face_id] |= face_ids - {face_id}
+    return faces, neighbours
+
+def _make_chunk(parts):
+    """
+    Concatenates `(face_id, vertices, triangles)` parts into one chunk.
+    # 将若干 `(face_id, vertices, triangles)` 片段拼接为一个数据块。
+    """
+    offsets = np.cumsum([0] + [len(vertices) for _, vertices, _ in parts[:-1]])
+    return {
+        "vertices": np.concatenate([vertices for _, vertices, _ in parts]),
+        "triangles": np.concatenate([triangles + offset for (_, _, triangles), offset in zip(parts, offsets)]),
+        "face_ids": np.concatenate([np.full(len(triangles), face_id, dtype=np.int32) for face_id, _, triangles in parts]),
+    }
+
+def iter_mesh_chunks(shape, deflection, max_triangles=100000, angular_deflection=0.5, release=False):
+    """
+    Meshes `shape` face by face and yields chunks of about `max_triangles`.
+    # 逐面网格化 `shape`，并以大约 `max_triangles` 个三角形为一块产出结果。
+
+    Each chunk is a dict with `vertices` (N, 3), `triangles` (M, 3, indices
+    local to the chunk) and `face_ids` (M,). A face is never split, so a chunk
+    only exceeds `max_triangles` when a single face does.
+    # 每个数据块是一个字典，包含 `vertices` (N, 3)、`triangles`（M, 3，索引仅在本块内有效）和 `face_ids` (M,)。
+    # 单个面不会被拆分，因此只有当一个面本身超过 `max_triangles` 时，数据块才会超过该上限。
+    """
+    faces, neighbours = face_neighbours(shape)
+    meshed, released = [False] * len(faces), [False] * len(faces)
+    builder = BRep_Builder()
+    parts, chunk_triangles = [], 0
+    for face_id, face in enumerate(faces):
+        # Mesh the face with its meshed neighbours; their triangulations are
+        # up to date, so only the new face is meshed, reusing the shared edges.
+        # # 将该面与已网格化的相邻面一起网格化；相邻面的三角化是最新的，
+        # # 因此只有新面会被网格化，并复用共享边的离散结果。
+        compound = TopoDS_Compound()
+        builder.MakeCompound(compound)
+        builder.Add(compound, face)
+        for other in neighbours[face_id]:
+            if meshed[other] and not released[other]:
+                builder.Add(compound, faces[other])
+        BRepMesh_IncrementalMesh(compound, deflection, False, angular_deflection, False)
+        meshed[face_id] = True
+
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation(face, location)
+        if triangulation is not None:
+            vertices, triangles = triangulation_to_arrays(face, triangulation, location)
+            del triangulation
+
+            # Flush before this face would push the chunk over the limit.
+            # # 在当前面将使数据块超出上限之前先输出已有的数据。
+            if parts and chunk_triangles + len(triangles) > max_triangles:
+                yield _make_chunk(parts)
+                parts, chunk_triangles = [], 0
+
+            parts.append((face_id, vertices, triangles))
+            chunk_triangles += len(triangles)
+
+        # Drop the face triangulations that no later face needs. Only the face
+        # triangulation is removed; the edges keep their polygons.
+        # # 删除后续的面不再需要的面三角化数据。只删除面的三角化，边上的多边形保持不变。
+        if release:
+            for other in neighbours[face_id] | {face_id}:
+                if meshed[other] and not released[other] and all(meshed[n] for n in neighbours[other]):
+                    builder.UpdateFace(faces[other], None)
+                    released[other] = True
+
+    if parts:
+        yield _make_chunk(parts)
+
+def _edge_node_keys(edge, polygon, edge_index, vertex_map):
+    """
+    Returns `(local_node_index, weld_key)` pairs for the nodes of one edge.
+    # 返回一条边上各节点的 `(局部节点索引, 焊接键)` 对。
+
+    Nodes are ranked by their parameter on the edge, so both faces that share
+    the edge produce the same keys whatever the edge orientation in each face.
+    # 节点按其在边上的参数排序，因此无论边在各个面中的方向如何，共享该边的两个面都会得到相同的键。
+    """
+    nb_nodes = polygon.NbNodes()
+    nodes = [polygon.Node(i) for i in range(1, nb_nodes + 1)]
+    if polygon.HasParameters():
+        order = np.argsort([polygon.Parameter(i) for i in range(1, nb_nodes + 1)], kind="stable")
+        nodes = [nodes[i] for i in order]
+
+    forward = topods.Edge(edge.Oriented(TopAbs_FORWARD))
+    first_key = ("v", vertex_map.FindIndex(topexp.FirstVertex(forward)))
+    last_key = ("v", vertex_map.FindIndex(topexp.LastVertex(forward)))
+
+    # A degenerated edge (e.g. a sphere pole) collapses onto its vertex.
+    # # 退化边（例如球的极点）整体收缩到其顶点上。
+    if BRep_Tool.Degenerated(edge):
+        return [(node, first_key) for node in nodes]
+
+    keys = [(nodes[0], first_key), (nodes[-1], last_key)]
+    keys += [(node, ("e", edge_index, rank)) for rank, node in enumerate(nodes[1:-1], start=1)]
+    return keys
+
+def build_welded_mesh(shape):
+    """
+    Builds an indexed mesh of a meshed shape, welding nodes by topology.
+    # 为已网格化的形状构建索引网格，按拓扑关系焊接节点。
+
+    Returns a dict with `vertices` (N, 3), `triangles` (M, 3) and `face_ids`
+    (M,). Triangles that collapse because two of their corners were welded
+    together (around degenerated edges) are dropped.
+    # 返回一个字典，包含 `vertices` (N, 3)、`triangles` (M, 3) 和 `face_ids` (M,)。
+    # 因两个角点被焊接到一起而退化的三角形（位于退化边附近）会被丢弃。
+    """
+    edge_map = TopTools_IndexedMapOfShape()
+    vertex_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_EDGE, edge_map)
+    topexp.MapShapes(shape, TopAbs_VERTEX, vertex_map)
+
+    weld_index = {}
+    all_vertices, all_triangles, all_face_ids = [], [], []
+    nb_vertices = 0
+
+    for face_id, face in enumerate(indexed_faces(shape)):
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation(face, location)
+        if triangulation is None:
+            continue
+        vertices, triangles = triangulation_to_arrays(face, triangulation, location)
+
+        # Map every local node to a global vertex; boundary nodes are shared.
+        # # 将每个局部节点映射为全局顶点；边界节点是共享的。
+        local_to_global = np.full(len(vertices), -1, dtype=np.int64)
+        explorer = TopExp_Explorer(face, TopAbs_EDGE)
+        while explorer.More():
+            edge = topods.Edge(explorer.Current())
+            polygon = BRep_Tool.PolygonOnTriangulation(edge, triangulation, location)
+            if polygon is not None:
+                edge_index = edge_map.FindIndex(edge)
+                for node, key in _edge_node_keys(edge, polygon, edge_index, vertex_map):
+                    if key not in weld_index:
+                        weld_index[key] = nb_vertices
+                        all_vertices.append(vertices[node - 1:node])
+                        nb_vertices += 1
+                    local_to_global[node - 1] = weld_index[key]
+            explorer.Next()
+
+        interior = np.flatnonzero(local_to_global < 0)
+        local_to_global[interior] = np.arange(nb_vertices, nb_vertices + len(interior))
+        all_vertices.append(vertices[interior])
+        nb_vertices += len(interior)
+
+        all_triangles.append(local_to_global[triangles])
+        all_face_ids.append(np.full(len(triangles), face_id, dtype=np.int32))
+
+    if not all_triangles:
+        return {"vertices": np.empty((0, 3)), "triangles": np.empty((0, 3), dtype=np.int64),
+                "face_ids": np.empty(0, dtype=np.int32)}
+    triangles = np.concatenate(all_triangles)
+    face_ids = np.concatenate(all_face_ids)
+    valid = ((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+             & (triangles[:, 2] != triangles[:, 0]))
+    return {
+        "vertices": np.concatenate(all_vertices),
+        "triangles": triangles[valid],
+        "face_ids": face_ids[valid],
+    }
+
+def is_watertight(triangles):
+    """
+    Checks that every undirected edge is used by exactly two triangles.
+    # 检查每条无向边是否恰好被两个三角形使用。
+    """
+    edges = np.concatenate([triangles[:, [0, 1]], triangles[:, [1, 2]], triangles[:, [2, 0]]])
+    edges.sort(axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return bool(np.all(counts == 2))
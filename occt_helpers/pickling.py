@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Picklable shapes and triangulations (BinTools example 2).
+# 可pickle的形状和三角化数据（BinTools 示例 2）。
+
+Registers `copyreg` reducers for `TopoDS_Shape` and all its subclasses
+(pickled as `BinTools` binary BRep) and for `Poly_Triangulation` (pickled as
+NumPy arrays). Importing this module is enough to register them; because the
+rebuild functions live in an importable package, worker processes can always
+unpickle the shapes.
+# 为 `TopoDS_Shape` 及其所有子类（以 `BinTools` 二进制BRep格式pickle）和 `Poly_Triangulation`
+# （以 NumPy 数组形式pickle）注册 `copyreg` 归约函数。只需导入本模块即可完成注册；
+# 由于重建函数位于可导入的包中，工作进程总能反序列化这些形状。
+"""
+
+import copyreg
+
+import numpy as np
+
+from OCC.Core.gp import gp_Pnt, gp_Pnt2d
+from OCC.Core.Poly import Poly_Triangulation, Poly_Triangle
+from OCC.Core.TopoDS import (TopoDS_Shape, TopoDS_Vertex, TopoDS_Edge, TopoDS_Wire, TopoDS_Face,
+                             TopoDS_Shell, TopoDS_Solid, TopoDS_CompSolid, TopoDS_Compound, topods)
+
+from occt_helpers.blobs import shape_to_bytes, shape_from_bytes
+
+# Downcasts that restore the Python class of a pickled shape.
+# # 用于恢复被pickle形状的Python类的向下转换函数。
+SHAPE_CLASSES = {
+    TopoDS_Shape: None,
+    TopoDS_Vertex: topods.Vertex,
+    TopoDS_Edge: topods.Edge,
+    TopoDS_Wire: topods.Wire,
+    TopoDS_Face: topods.Face,
+    TopoDS_Shell: topods.Shell,
+    TopoDS_Solid: topods.Solid,
+    TopoDS_CompSolid: topods.CompSolid,
+    TopoDS_Compound: topods.Compound,
+}
+_DOWNCASTS = {shape_class.__name__: downcast for shape_class, downcast in SHAPE_CLASSES.items()}
+
+def _rebuild_shape(blob, class_name):
+    shape = shape_from_bytes(blob)
+    downcast = _DOWNCASTS[class_name]
+    return downcast(shape) if downcast is not None and not shape.IsNull() else shape
+
+def register_shape_pickling(with_triangles=False):
+    """
+    Registers (or re-registers) the `copyreg` reducers for all `TopoDS` classes.
+    # 为所有 `TopoDS` 类注册（或重新注册）`copyreg` 归约函数。
+
+    With `with_triangles=True` the face triangulations travel with the shape,
+    so a shape meshed in a worker arrives meshed. The setting applies to the
+    process that pickles, so workers that return meshed shapes must call it
+    too.
+    # 当 `with_triangles=True` 时，面的三角化数据会随形状一起传输，因此在工作进程中网格化的形状到达时仍是网格化的。
+    # 该设置作用于执行pickle的进程，因此返回网格化形状的工作进程也必须调用它。
+    """
+    def reduce_shape(shape):
+        return _rebuild_shape, (shape_to_bytes(shape, with_triangles), type(shape).__name__)
+
+    for shape_class in SHAPE_CLASSES:
+        copyreg.pickle(shape_class, reduce_shape)
+
+def _rebuild_triangulation(nodes, triangles, uv_nodes, deflection):
+    triangulation = Poly_Triangulation(len(nodes), len(triangles), uv_nodes is not None)
+    for i, (x, y, z) in enumerate(nodes.tolist(), start=1):
+        triangulation.SetNode(i, gp_Pnt(x, y, z))
+    if uv_nodes is not None:
+        for i, (u, v) in enumerate(uv_nodes.tolist(), start=1):
+            triangulation.SetUVNode(i, gp_Pnt2d(u, v))
+    for i, (n1, n2, n3) in enumerate(triangles.tolist(), start=1):
+        triangulation.SetTriangle(i, Poly_Triangle(n1, n2, n3))
+    triangulation.Deflection(deflection)
+    return triangulation
+
+def _reduce_triangulation(triangulation):
+    nb_nodes, nb_triangles = triangulation.NbNodes(), triangulation.NbTriangles()
+    nodes = np.empty((nb_nodes, 3), dtype=np.float64)
+    for i in range(1, nb_nodes + 1):
+        p = triangulation.Node(i)
+        nodes[i - 1] = (p.X(), p.Y(), p.Z())
+    triangles = np.empty((nb_triangles, 3), dtype=np.int32)
+    for i in range(1, nb_triangles + 1):
+        triangles[i - 1] = triangulation.Triangle(i).Get()
+    uv_nodes = None
+    if triangulation.HasUVNodes():
+        uv_nodes = np.empty((nb_nodes, 2), dtype=np.float64)
+        for i in range(1, nb_nodes + 1):
+            uv = triangulation.UVNode(i)
+            uv_nodes[i - 1] = (uv.X(), uv.Y())
+    return _rebuild_triangulation, (nodes, triangles, uv_nodes, triangulation.Deflection())
+
+# A `copyreg` entry takes precedence over any `__reduce__` of the wrapper classes.
+# # `copyreg` 中的条目优先于包装类自身的任何 `__reduce__`。
+register_shape_pickling()
+copyreg.pickle(Poly_Triangulation, _reduce_triangulation)
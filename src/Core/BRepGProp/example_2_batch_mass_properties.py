@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepGProp Example 2: Batch Mass Properties with NumPy Output
+# BRepGProp 示例 2：以 NumPy 数组输出的批量质量属性计算
+
+`calculate_properties` in `example.py` handles one shape at a time. For a
+whole catalog, `mass_properties_batch` computes the properties of many shapes
+and returns them as NumPy arrays, one row per shape:
+# `example.py` 中的 `calculate_properties` 一次只处理一个形状。对于整个目录，
+# `mass_properties_batch` 计算多个形状的属性，并以 NumPy 数组的形式返回，每个形状一行：
+
+- `"volume"`: `volume` (n,), `volume_center` (n, 3), `inertia` (n, 3, 3)
+  about the center of mass,
+  # `"volume"`：`volume` (n,)、`volume_center` (n, 3)，以及相对于重心的 `inertia` (n, 3, 3)，
+- `"area"`: `area` (n,), `area_center` (n, 3).
+  # `"area"`：`area` (n,)、`area_center` (n, 3)。
+
+Shapes are sent to worker processes by pickling, using the reducers from
+`occt_helpers.pickling`. A thread pool avoids that cost, but
+only helps when the wrappers release the GIL during the integration.
+# 形状通过pickle发送给工作进程，使用的是 `occt_helpers.pickling` 中的归约函数。
+# 线程池可以避免这部分开销，但只有在包装层在积分期间释放GIL时才能带来加速。
+"""
+
+import os
+import time
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.gp import gp_Pnt, gp_Dir, gp_Ax2
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+
+# Importing the module registers the pickle reducers for TopoDS shapes.
+# # 导入该模块即会为 TopoDS 形状注册pickle归约函数。
+import occt_helpers.pickling  # noqa: F401
+
+KINDS = ("volume", "area")
+
+def _properties_row(shape, kinds):
+    """
+    Worker: returns the requested properties of one shape as a flat list of floats.
+    # 工作函数：以浮点数扁平列表的形式返回一个形状的所需属性。
+
+    Per kind, `volume` gives mass, center (3) and inertia (9); `area` gives
+    mass and center (3). A null shape gives NaNs.
+    # 对于每种属性，`volume` 给出质量、重心（3个）和惯性矩阵（9个）；`area` 给出质量和重心（3个）。空形状返回NaN。
+    """
+    row = []
+    for kind in kinds:
+        size = 13 if kind == "volume" else 4
+        if shape.IsNull():
+            row += [float("nan")] * size
+            continue
+        props = GProp_GProps()
+        if kind == "volume":
+            brepgprop.VolumeProperties(shape, props)
+        else:
+            brepgprop.SurfaceProperties(shape, props)
+        center = props.CentreOfMass()
+        row += [props.Mass(), center.X(), center.Y(), center.Z()]
+        if kind == "volume":
+            matrix = props.MatrixOfInertia()
+            row += [matrix.Value(i, j) for i in (1, 2, 3) for j in (1, 2, 3)]
+    return row
+
+def mass_properties_batch(shapes, kinds=KINDS, workers=None, executor="process"):
+    """
+    Computes mass properties for many shapes and returns a dict of NumPy arrays.
+    # 计算多个形状的质量属性，并返回一个 NumPy 数组字典。
+
+    `workers=None` uses all CPUs; `workers=1` runs in the calling thread.
+    `executor` is `"process"` or `"thread"`.
+    # `workers=None` 使用所有CPU；`workers=1` 在调用线程中运行。`executor` 为 `"process"` 或 `"thread"`。
+    """
+    kinds = tuple(kinds)
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        raise ValueError(f"unknown property kinds: {sorted(unknown)}")
+    if executor not in ("process", "thread"):
+        raise ValueError(f"executor must be 'process' or 'thread', not {executor!r}")
+    shapes = list(shapes)
+    workers = workers or os.cpu_count() or 1
+    worker = partial(_properties_row, kinds=kinds)
+
+    if workers == 1 or len(shapes) < 2:
+        rows = [worker(shape) for shape in shapes]
+    else:
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        # A few chunks per worker keeps the load balanced without a round trip per shape.
+        # # 每个工作者分配几个块，既能平衡负载，又不必为每个形状往返一次。
+        chunksize = max(1, len(shapes) // (workers * 4))
+        with pool_class(max_workers=workers) as pool:
+            rows = list(pool.map(worker, shapes, chunksize=chunksize))
+
+    width = sum(13 if kind == "volume" else 4 for kind in kinds)
+    table = np.array(rows, dtype=np.float64).reshape(len(shapes), width)
+    result, column = {}, 0
+    for kind in kinds:
+        if kind == "volume":
+            result["volume"] = table[:, column]
+            result["volume_center"] = table[:, column + 1:column + 4]
+            result["inertia"] = table[:, column + 4:column + 13].reshape(-1, 3, 3)
+            column += 13
+        else:
+            result["area"] = table[:, column]
+            result["area_center"] = table[:, column + 1:column + 4]
+            column += 4
+    return result
+
+def create_catalog(count=200):
+    """
+    Creates `count` blocks of different sizes, each with a through hole.
+    # 创建 `count` 个尺寸各不相同、各带一个通孔的方块。
+    """
+    shapes = []
+    for i in range(count):
+        length, width, height = 40.0 + i % 17, 30.0 + i % 11, 10.0 + i % 5
+        x = i * 100.0
+        block = BRepPrimAPI_MakeBox(gp_Pnt(x, 0, 0), length, width, height).Shape()
+        axis = gp_Ax2(gp_Pnt(x + length / 2, width / 2, 0), gp_Dir(0, 0, 1))
+        hole = BRepPrimAPI_MakeCylinder(axis, 5.0 + i % 3, height).Shape()
+        shapes.append(BRepAlgoAPI_Cut(block, hole).Shape())
+    return shapes
+
+def run_batch_example():
+    """
+    Computes the properties of a catalog serially, with threads and with processes.
+    # 分别以串行、线程和进程的方式计算一个目录的属性。
+    """
+    print("--- Batch Mass Properties ---")
+    # --- 批量质量属性 ---
+
+    # 1. A catalog of 200 parts.
+    # 1. 一个包含200个零件的目录。
+    shapes = create_catalog()
+
+    # 2. Serial, thread pool and process pool.
+    # 2. 串行、线程池和进程池。
+    results = {}
+    for label, workers, executor in (("serial", 1, "process"), ("threads", None, "thread"),
+                                     ("processes", None, "process")):
+        start = time.perf_counter()
+        results[label] = mass_properties_batch(shapes, workers=workers, executor=executor)
+        print(f"  {label:<10} {time.perf_counter() - start:.3f} s")
+        #   {方式} ... 秒
+
+    volumes = results["processes"]["volume"]
+    print(f"Total volume: {volumes.sum():.1f} mm^3, largest part: #{int(volumes.argmax())}")
+    # 总体积：... mm^3，最大的零件：#...
+
+    # 3. Verification
+    # 3. 验证
+    for label in ("threads", "processes"):
+        for key, values in results["serial"].items():
+            assert np.allclose(values, results[label][key])
+    assert results["serial"]["inertia"].shape == (len(shapes), 3, 3)
+    assert np.allclose(results["serial"]["inertia"], results["serial"]["inertia"].transpose(0, 2, 1))
+    assert (volumes > 0).all()
+    assert abs(volumes[0] - (40 * 30 * 10 - np.pi * 5 ** 2 * 10)) < 1e-6 * volumes[0]
+    print("Verification successful: all executors return the same arrays.")
+    # 验证成功：所有执行方式返回的数组都相同。
+
+if __name__ == '__main__':
+    run_batch_example()
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepGProp Example 3: Approximate Volume and Area from the Triangulation
+# BRepGProp 示例 3：基于三角化网格的近似体积和面积
+
+`brepgprop.VolumeProperties` integrates over the exact surfaces, which can take
+seconds on filleted freeform parts. When 0.1% is accurate enough, the same
+quantities can be summed over the face triangulations with NumPy:
+# `brepgprop.VolumeProperties` 在精确曲面上进行积分，对于带圆角的自由曲面零件可能需要数秒。
+# 如果 0.1% 的精度已经足够，可以用 NumPy 在面的三角化网格上对同样的量求和：
+
+- area: the sum of the triangle areas,
+  # 面积：所有三角形面积之和，
+- volume and center of mass: the sum of the signed tetrahedra spanned by the
+  origin and every triangle (divergence theorem).
+  # 体积和重心：由原点和每个三角形构成的带符号四面体之和（散度定理）。
+
+The triangulation stored on the faces acts as the cache: `BRepMesh` keeps it
+as long as it is at least as fine as requested, so repeated calls only pay for
+the sums.
+# 存储在面上的三角化数据起到缓存作用：只要它至少和要求的一样精细，`BRepMesh` 就会保留它，
+# 因此重复调用只需支付求和的开销。
+"""
+
+import time
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeFillet
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_EDGE
+from OCC.Core.TopoDS import topods
+
+from occt_helpers.mesh import indexed_faces, collect_mesh_arrays
+
+def mesh_properties(vertices, triangles):
+    """
+    Returns `(volume, area, center)` of a closed, outward-oriented triangle mesh.
+    # 返回一个封闭且法向朝外的三角网格的 `(volume, area, center)`。
+    """
+    a, b, c = (vertices[triangles[:, k]] for k in range(3))
+    cross = np.cross(b - a, c - a)
+    area = 0.5 * np.linalg.norm(cross, axis=1).sum()
+    # Six times the signed volume of the tetrahedron (origin, a, b, c).
+    # # 四面体 (原点, a, b, c) 带符号体积的六倍。
+    tetra = np.einsum("ij,ij->i", a, cross)
+    volume = tetra.sum() / 6.0
+    center = (tetra @ (a + b + c)) / (24.0 * volume) if volume else np.full(3, np.nan)
+    return volume, area, center
+
+def mesh_error_estimates(vertices, triangles, area, deflection, angular_deflection):
+    """
+    Returns `(volume_bound, area_estimate)` for a mesh with the given deflections.
+    # 返回给定挠度下网格的 `(volume_bound, area_estimate)`。
+
+    Every mesh point lies within `deflection` of the surface, so the volume
+    between mesh and surface is at most `deflection * area`: this is a bound.
+    The area error is only an estimate: a triangle whose longest edge `L`
+    spans a sag of `deflection` is assumed to be tilted by about
+    `min(4 * deflection / L, angular_deflection)` from the surface, and its
+    area to differ by the factor `1 / cos(tilt)`. Triangles that are not
+    arcs of a single curvature can exceed it.
+    # 每个网格点与曲面的距离都在 `deflection` 以内，因此网格与曲面之间的体积至多为 `deflection * area`：这是一个上界。
+    # 面积误差只是估计值：假设最长边为 `L`、弦高为 `deflection` 的三角形相对于曲面的倾角约为
+    # `min(4 * deflection / L, angular_deflection)`，其面积相差 `1 / cos(tilt)` 倍。
+    # 不是单一曲率圆弧的三角形可能超过这个估计。
+    """
+    a, b, c = (vertices[triangles[:, k]] for k in range(3))
+    longest = np.sqrt(np.max([((b - a) ** 2).sum(1), ((c - b) ** 2).sum(1), ((a - c) ** 2).sum(1)], axis=0))
+    tilt = np.minimum(4.0 * deflection / np.maximum(longest, 1e-300), angular_deflection)
+    triangle_areas = 0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    area_estimate = (triangle_areas * (1.0 / np.cos(tilt) - 1.0)).sum()
+    return deflection * area, area_estimate
+
+def exact_properties(shape):
+    """
+    Returns `(volume, area, center)` from the exact `brepgprop` integration.
+    # 返回由精确的 `brepgprop` 积分得到的 `(volume, area, center)`。
+    """
+    volume_props, surface_props = GProp_GProps(), GProp_GProps()
+    brepgprop.VolumeProperties(shape, volume_props)
+    brepgprop.SurfaceProperties(shape, surface_props)
+    center = volume_props.CentreOfMass()
+    return volume_props.Mass(), surface_props.Mass(), np.array([center.X(), center.Y(), center.Z()])
+
+def approximate_properties(shape, deflection=None, angular_deflection=0.5, tolerance=None):
+    """
+    Computes volume, area and center of mass from the triangulation of `shape`.
+    # 根据 `shape` 的三角化网格计算体积、面积和重心。
+
+    `deflection` defaults to 1/1000 of the bounding box diagonal. The result
+    holds `volume`, `area`, `center`, the absolute volume bound
+    `volume_error`, the absolute area estimate `area_error_estimate`, the
+    achieved `deflection` and `mode` (`"mesh"`). When `tolerance` is given
+    and either relative error exceeds it, the exact values are returned
+    instead, with `mode="exact"` and the errors set to None. A low area
+    estimate therefore never skips the exact fallback the volume bound asks for.
+    # `deflection` 默认为包围盒对角线的 1/1000。结果包含 `volume`、`area`、`center`、体积的绝对误差上界
+    # `volume_error`、面积的绝对误差估计 `area_error_estimate`、实际达到的 `deflection` 以及 `mode`（`"mesh"`）。
+    # 如果给出了 `tolerance` 且任一相对误差超过了它，则改为返回精确值，此时 `mode="exact"`，误差为 None。
+    # 因此面积估计偏低时，也不会跳过体积上界所要求的精确回退。
+    """
+    start = time.perf_counter()
+    if deflection is None:
+        box = Bnd_Box()
+        brepbndlib.Add(shape, box)
+        xmin, ymin, zmin, xmax, ymax, zmax = box.Get()
+        deflection = 1e-3 * float(np.linalg.norm([xmax - xmin, ymax - ymin, zmax - zmin]))
+
+    # Keeps the existing triangulation when it is already fine enough.
+    # # 如果已有的三角化足够精细，则保留它。
+    BRepMesh_IncrementalMesh(shape, deflection, False, angular_deflection, True)
+    mesh = collect_mesh_arrays(indexed_faces(shape))
+    handles = [handle for handle in mesh["handles"] if handle is not None]
+    result = {"mode": "mesh", "nb_triangles": len(mesh["triangles"])}
+
+    volume, area, center = mesh_properties(mesh["vertices"], mesh["triangles"])
+    if len(handles) < len(mesh["handles"]):
+        # Unmeshed faces: the sums are incomplete and nothing can be bounded.
+        # # 存在未网格化的面：求和不完整，无法给出误差上界。
+        volume_error = area_error_estimate = np.inf
+    else:
+        achieved = max([handle.Deflection() for handle in handles] + [0.0]) or deflection
+        deflection = achieved
+        volume_error, area_error_estimate = mesh_error_estimates(mesh["vertices"], mesh["triangles"], area,
+                                                                 achieved, angular_deflection)
+    result.update({"volume": volume, "area": area, "center": center, "deflection": deflection,
+                   "volume_error": volume_error, "area_error_estimate": area_error_estimate})
+
+    if tolerance is not None:
+        relative = max(volume_error / abs(volume) if volume else np.inf,
+                       area_error_estimate / area if area else np.inf)
+        if relative > tolerance:
+            volume, area, center = exact_properties(shape)
+            result.update({"mode": "exact", "volume": volume, "area": area, "center": center,
+                           "volume_error": None, "area_error_estimate": None})
+    result["time_s"] = time.perf_counter() - start
+    return result
+
+def run_mesh_properties_example():
+    """
+    Compares the mesh-based and the exact properties of a filleted part.
+    # 比较一个带圆角零件基于网格的属性和精确属性。
+    """
+    print("--- Approximate Mass Properties from the Mesh ---")
+    # --- 基于网格的近似质量属性 ---
+
+    # 1. A box fused with a sphere, all edges filleted.
+    # 1. 与球体融合的盒子，所有边都倒圆角。
+    shape = BRepAlgoAPI_Fuse(BRepPrimAPI_MakeBox(100, 100, 100).Shape(),
+                             BRepPrimAPI_MakeSphere(75).Shape()).Shape()
+    fillet = BRepFilletAPI_MakeFillet(shape)
+    explorer = TopExp_Explorer(shape, TopAbs_EDGE)
+    while explorer.More():
+        fillet.Add(5.0, topods.Edge(explorer.Current()))
+        explorer.Next()
+    shape = fillet.Shape()
+
+    # 2. Exact integration.
+    # 2. 精确积分。
+    start = time.perf_counter()
+    volume, area, center = exact_properties(shape)
+    exact_time = time.perf_counter() - start
+    print(f"  exact        volume={volume:.1f} area={area:.1f} ({exact_time * 1000:.1f} ms)")
+    #   精确         体积=... 面积=... （... 毫秒）
+
+    # 3. Mesh-based, first call (meshing) and second call (cached triangulation).
+    # 3. 基于网格：第一次调用（网格化）和第二次调用（使用缓存的三角化）。
+    results = []
+    for label in ("mesh (first)", "mesh (cached)"):
+        result = approximate_properties(shape)
+        results.append(result)
+        print(f"  {label:<12} volume={result['volume']:.1f} ± {result['volume_error']:.1f} "
+              f"area={result['area']:.1f} (estimated ± {result['area_error_estimate']:.1f}) "
+              f"({result['time_s'] * 1000:.1f} ms, {result['nb_triangles']} triangles)")
+        #   {调用} 体积=... ± ... 面积=... （估计 ± ...） （... 毫秒，... 个三角形）
+
+    # 4. A tolerance tighter than the errors falls back to the exact values.
+    # 4. 比误差更严格的容差会回退到精确值。
+    strict = approximate_properties(shape, tolerance=1e-7)
+    print(f"  tolerance 1e-7 -> mode={strict['mode']}")
+    # 容差 1e-7 -> 模式=...
+
+    # 5. Verification
+    # 5. 验证
+    mesh_result = results[-1]
+    assert abs(mesh_result["volume"] - volume) <= mesh_result["volume_error"]
+    # The area error is only an estimate: check the accuracy, not the estimate.
+    # # 面积误差只是估计值：这里检查精度，而不是检查估计值。
+    print(f"  area error {abs(mesh_result['area'] - area):.2f}, estimated {mesh_result['area_error_estimate']:.2f}")
+    # 面积误差 ...，估计值 ...
+    assert abs(mesh_result["area"] - area) / area < 1e-3
+    assert abs(mesh_result["volume"] - volume) / volume < 1e-3
+    assert np.allclose(mesh_result["center"], center, atol=0.1)
+    assert strict["mode"] == "exact" and strict["volume"] == volume
+    print("Verification successful: the exact volume lies within the reported bound.")
+    # 验证成功：精确体积位于报告的误差上界之内。
+
+if __name__ == '__main__':
+    run_mesh_properties_example()
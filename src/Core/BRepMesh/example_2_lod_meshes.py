@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepMesh Example 2: Multi-level LOD Meshes
+# BRepMesh 示例 2：多级LOD网格
+
+This file demonstrates how to build a level-of-detail (LOD) pyramid of meshes
+(coarse, medium, fine) for one shape in a single pass.
+# 本文件演示了如何在一次流程中为一个形状构建多级细节（LOD）网格金字塔（粗、中、细）。
+
+Running `BRepMesh_IncrementalMesh` three times normally replaces the previous
+triangulation of every face. Since OCCT 7.6 a face can store a *list* of
+triangulations, so we mesh from the coarsest to the finest deflection, keep a
+handle to each level and finally attach all levels to the faces with
+`BRep_Builder.UpdateFace`. A finer deflection makes `BRepMesh_IncrementalMesh`
+rebuild the face triangulations, so each level costs a full meshing pass; the
+handles kept from the coarser passes stay valid because they are only replaced
+on the face, not destroyed.
+# 通常连续运行三次 `BRepMesh_IncrementalMesh` 会覆盖每个面之前的三角化数据。
+# 从 OCCT 7.6 开始，一个面可以存储一个三角化*列表*，因此我们从最粗到最细的挠度依次网格化，
+# 保留每一级的句柄，最后用 `BRep_Builder.UpdateFace` 把所有级别挂到面上。
+# 更细的挠度会使 `BRepMesh_IncrementalMesh` 重新构建面的三角化，因此每一级都需要一次完整的网格化；
+# 之前较粗级别保留的句柄仍然有效，因为它们只是在面上被替换，并没有被销毁。
+
+The array helpers `indexed_faces`, `triangulation_to_arrays` and
+`collect_mesh_arrays` live in `occt_helpers.mesh`.
+# 数组辅助函数 `indexed_faces`、`triangulation_to_arrays` 和 `collect_mesh_arrays` 位于 `occt_helpers.mesh` 中。
+"""
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.Poly import Poly_ListOfTriangulation
+from OCC.Core.TopLoc import TopLoc_Location
+
+from occt_helpers.mesh import indexed_faces, collect_mesh_arrays
+
+def mesh_lod_levels(shape, deflections, angular_deflection=0.5, attach=True):
+    """
+    Meshes `shape` once per linear deflection and returns one entry per level.
+    # 对 `shape` 按每个线性挠度各网格化一次，并为每一级返回一个结果。
+
+    Levels are computed from the coarsest to the finest deflection. Each entry
+    holds the `deflection`, the mesh arrays (`vertices`, `triangles`,
+    `face_ids`) and the sizes `nb_nodes` / `nb_triangles`. When `attach` is
+    True every face keeps all levels in its triangulation list, with the
+    finest one active.
+    # 各级别按挠度从粗到细计算。每个结果包含 `deflection`、网格数组（`vertices`、`triangles`、`face_ids`）
+    # 以及规模 `nb_nodes` / `nb_triangles`。当 `attach` 为 True 时，每个面会在其三角化列表中保留所有级别，
+    # 并以最细的一级作为激活的三角化。
+    """
+    faces = indexed_faces(shape)
+    levels = []
+    for deflection in sorted(deflections, reverse=True):
+        # A finer deflection rebuilds the triangulation of every face from scratch.
+        # # 更细的挠度会从头重新构建每个面的三角化。
+        BRepMesh_IncrementalMesh(shape, deflection, False, angular_deflection, True)
+        mesh = collect_mesh_arrays(faces)
+        levels.append({
+            "deflection": deflection,
+            "vertices": mesh["vertices"],
+            "triangles": mesh["triangles"],
+            "face_ids": mesh["face_ids"],
+            "nb_nodes": len(mesh["vertices"]),
+            "nb_triangles": len(mesh["triangles"]),
+            "handles": mesh["handles"],
+        })
+
+    if attach:
+        builder = BRep_Builder()
+        for face_id, face in enumerate(faces):
+            triangulations = Poly_ListOfTriangulation()
+            for level in levels:
+                if level["handles"][face_id] is not None:
+                    triangulations.Append(level["handles"][face_id])
+            finest = levels[-1]["handles"][face_id]
+            if finest is not None:
+                builder.UpdateFace(face, triangulations, finest)
+
+    for level in levels:
+        del level["handles"]
+    return levels
+
+def run_lod_example():
+    """
+    Builds a three-level LOD pyramid for a composite shape and reports its sizes.
+    # 为一个复合形状构建三级LOD金字塔并报告其规模。
+    """
+    print("--- Multi-level LOD Meshing ---")
+    # --- 多级LOD网格化 ---
+
+    # 1. Create the B-Rep shape.
+    # 1. 创建B-Rep形状。
+    box = BRepPrimAPI_MakeBox(100, 100, 100).Shape()
+    sphere = BRepPrimAPI_MakeSphere(75).Shape()
+    shape = BRepAlgoAPI_Fuse(box, sphere).Shape()
+
+    # 2. Mesh all LOD levels in one call.
+    # 2. 一次调用完成所有LOD级别的网格化。
+    deflections = [0.1, 1.0, 5.0]
+    levels = mesh_lod_levels(shape, deflections)
+
+    print("\n--- LOD Pyramid ---")
+    # --- LOD 金字塔 ---
+    for level in levels:
+        print(f"  deflection={level['deflection']:<5} nodes={level['nb_nodes']:<7} triangles={level['nb_triangles']}")
+        #   挠度=... 节点数=... 三角形数=...
+
+    # 3. Every face now carries all levels; the finest one is active.
+    # 3. 现在每个面都携带所有级别；最细的一级处于激活状态。
+    first_face = indexed_faces(shape)[0]
+    stored = BRep_Tool.Triangulations(first_face, TopLoc_Location())
+    print(f"\nTriangulations stored on the first face: {stored.Size()}")
+    # 第一个面上存储的三角化数量：{stored.Size()}
+
+    # 4. Verification
+    # 4. 验证
+    triangle_counts = [level["nb_triangles"] for level in levels]
+    assert triangle_counts == sorted(triangle_counts)
+    assert triangle_counts[0] > 0
+    print("Verification successful: finer levels contain more triangles.")
+    # 验证成功：越精细的级别包含越多的三角形。
+
+if __name__ == '__main__':
+    run_lod_example()
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepMesh Example 3: Process-pool Meshing of Assemblies
+# BRepMesh 示例 3：使用进程池对装配体进行网格化
+
+`BRepMesh_IncrementalMesh(shape, deflection, False, angle, True)` can already
+mesh faces in parallel threads, but on assemblies made of many small parts the
+threads spend most of their time waiting on each other. This file shows how to
+mesh every solid in a separate worker process instead:
+# `BRepMesh_IncrementalMesh(shape, deflection, False, angle, True)` 已经可以用多线程并行网格化各个面，
+# 但在由大量小零件组成的装配体上，线程大部分时间都在相互等待。本文件演示如何改为在独立的工作进程中网格化每个实体：
+
+1.  Each solid is sent to a worker as a `BinTools` binary blob; shells and
+    faces next to the solids are sent the same way.
+    # 1. 每个实体以 `BinTools` 二进制数据块的形式发送到工作进程；与实体并列的壳和面也以同样方式发送。
+2.  The worker meshes it and sends back plain NumPy triangulation arrays.
+    # 2. 工作进程对其网格化，并返回纯 NumPy 三角化数组。
+3.  The parent either re-attaches the triangulations to its own faces (so
+    `StlAPI_Writer` etc. can use them) or merges the arrays into one mesh.
+    # 3. 父进程要么将三角化数据重新挂到自己的面上（以便 `StlAPI_Writer` 等工具使用），要么将数组合并为一个网格。
+
+`split_solids` and `arrays_to_triangulation` live in `occt_helpers.mesh`.
+# `split_solids` 和 `arrays_to_triangulation` 位于 `occt_helpers.mesh` 中。
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.gp import gp_Vec, gp_Trsf
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRep import BRep_Tool, BRep_Builder
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.TopAbs import TopAbs_FACE
+from OCC.Core.TopExp import topexp
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+
+from occt_helpers.blobs import shape_to_bytes, shape_from_bytes
+from occt_helpers.mesh import indexed_faces, collect_mesh_arrays, split_solids, arrays_to_triangulation
+
+def _mesh_blob(job):
+    """
+    Worker: rebuilds a shape from its blob, meshes it and returns arrays.
+    # 工作进程：从数据块重建形状，进行网格化并返回数组。
+
+    Besides the merged mesh, the raw per-face triangulations (local node
+    coordinates and one-based triangles) are returned so the parent can
+    re-attach them to its own faces.
+    # 除了合并后的网格，还会返回每个面的原始三角化数据（局部节点坐标和从1开始的三角形索引），
+    # 以便父进程将其重新挂到自己的面上。
+    """
+    blob, deflection, angular_deflection = job
+    shape = shape_from_bytes(blob)
+    BRepMesh_IncrementalMesh(shape, deflection, False, angular_deflection, False)
+
+    faces = indexed_faces(shape)
+    mesh = collect_mesh_arrays(faces)
+    raw_faces = []
+    for triangulation in mesh.pop("handles"):
+        if triangulation is None:
+            raw_faces.append(None)
+            continue
+        nodes = np.array([triangulation.Node(i).Coord() for i in range(1, triangulation.NbNodes() + 1)])
+        triangles = np.array([triangulation.Triangle(i).Get() for i in range(1, triangulation.NbTriangles() + 1)])
+        raw_faces.append((nodes, triangles))
+    mesh["raw_faces"] = raw_faces
+    return mesh
+
+def mesh_solids_in_pool(shape, deflection, angular_deflection=0.5, workers=None, attach=True):
+    """
+    Meshes every solid of `shape` in a process pool.
+    # 在进程池中对 `shape` 的每个实体进行网格化。
+
+    Returns a merged mesh dict (`vertices`, `triangles`, `face_ids`) where
+    `face_ids` index the faces of `shape` as given by `indexed_faces`. When
+    `attach` is True the triangulations are also stored on the faces of
+    `shape`, exactly as if it had been meshed in-process.
+    # 返回合并后的网格字典（`vertices`、`triangles`、`face_ids`），其中 `face_ids`
+    # 是 `indexed_faces` 给出的 `shape` 面编号。当 `attach` 为 True 时，三角化数据也会存储到
+    # `shape` 的面上，效果与在本进程中网格化完全相同。
+    """
+    solids = split_solids(shape)
+    jobs = [(shape_to_bytes(solid), deflection, angular_deflection) for solid in solids]
+
+    # Many small parts: hand them out in batches to limit IPC overhead.
+    # # 零件多而小：分批分发以减少进程间通信开销。
+    workers = workers or os.cpu_count()
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_mesh_blob, jobs, chunksize=chunksize))
+
+    face_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, TopAbs_FACE, face_map)
+    builder = BRep_Builder()
+
+    all_vertices, all_triangles, all_face_ids = [], [], []
+    offset = 0
+    for solid, result in zip(solids, results):
+        solid_faces = indexed_faces(solid)
+        global_ids = np.array([face_map.FindIndex(face) - 1 for face in solid_faces], dtype=np.int32)
+
+        if attach:
+            for face, raw in zip(solid_faces, result["raw_faces"]):
+                if raw is not None:
+                    builder.UpdateFace(face, arrays_to_triangulation(*raw))
+
+        all_vertices.append(result["vertices"])
+        all_triangles.append(result["triangles"] + offset)
+        if len(global_ids):
+            all_face_ids.append(global_ids[result["face_ids"]])
+        offset += len(result["vertices"])
+
+    return {
+        "vertices": np.concatenate(all_vertices),
+        "triangles": np.concatenate(all_triangles),
+        "face_ids": np.concatenate(all_face_ids) if all_face_ids else np.empty(0, dtype=np.int32),
+    }
+
+def create_assembly(count=6):
+    """
+    Creates a compound of `count` x `count` small, separate solids.
+    # 创建一个由 `count` x `count` 个独立小实体组成的组合体。
+    """
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for i in range(count):
+        for j in range(count):
+            part = BRepPrimAPI_MakeSphere(4.0).Shape() if (i + j) % 2 else BRepPrimAPI_MakeBox(6.0, 6.0, 6.0).Shape()
+            trsf = gp_Trsf()
+            trsf.SetTranslation(gp_Vec(i * 10.0, j * 10.0, 0.0))
+            builder.Add(compound, BRepBuilderAPI_Transform(part, trsf, True).Shape())
+    return compound
+
+def run_pool_meshing_example():
+    """
+    Reads a multi-solid STEP file and meshes it in a process pool.
+    # 读取一个多实体STEP文件，并在进程池中对其进行网格化。
+    """
+    print("--- Process-pool Meshing ---")
+    # --- 进程池网格化 ---
+    step_file = "assembly_model.step"
+
+    # 1. Write and read back a multi-solid STEP file.
+    # 1. 写出并读回一个多实体STEP文件。
+    step_writer = STEPControl_Writer()
+    step_writer.Transfer(create_assembly(), STEPControl_AsIs)
+    assert step_writer.Write(step_file) == IFSelect_RetDone
+
+    step_reader = STEPControl_Reader()
+    assert step_reader.ReadFile(step_file) == IFSelect_RetDone
+    step_reader.TransferRoots()
+    assembly = step_reader.OneShape()
+    print(f"Read {len(split_solids(assembly))} solids from {step_file}.")
+    # 从 {step_file} 读取了 ... 个实体。
+
+    # 2. Mesh in a process pool.
+    # 2. 在进程池中网格化。
+    start = time.perf_counter()
+    mesh = mesh_solids_in_pool(assembly, 0.1)
+    elapsed = time.perf_counter() - start
+    print(f"Pool meshing: {len(mesh['triangles'])} triangles in {elapsed:.2f} s.")
+    # 进程池网格化：... 个三角形，用时 ... 秒。
+
+    # 3. Verification: the parent's faces now carry the triangulations.
+    # 3. 验证：父进程中的面现在携带了三角化数据。
+    attached = sum(
+        BRep_Tool.Triangulation(face, TopLoc_Location()).NbTriangles()
+        for face in indexed_faces(assembly)
+    )
+    assert attached == len(mesh["triangles"]) > 0
+    print("Verification successful: triangulations were re-attached to the faces.")
+    # 验证成功：三角化数据已重新挂到面上。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(step_file):
+        os.remove(step_file)
+
+if __name__ == '__main__':
+    run_pool_meshing_example()
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepMesh Example 4: Meshing Throughput Metrics and Slow-face Report
+# BRepMesh 示例 4：网格化吞吐量指标与慢面报告
+
+Some parts take a hundred times longer to mesh than others of similar size.
+This file times the mesher call from `example.py` (`mesh_a_shape`), inspects
+the resulting triangulations and produces a structured, JSON-serializable
+report:
+# 有些零件的网格化时间是同等规模零件的上百倍。本文件对 `example.py`（`mesh_a_shape`）中的网格化调用计时，
+# 检查生成的三角化数据，并生成一份结构化、可JSON序列化的报告：
+
+- total time and triangles per second,
+  # 总耗时和每秒三角形数，
+- the worst N faces by triangle count and by isolated meshing time, with
+  their surface type,
+  # 按三角形数量和按单独网格化耗时排名最差的N个面，及其曲面类型，
+- the status flags of `BRepMesh_IncrementalMesh.GetStatusFlags()`.
+  # `BRepMesh_IncrementalMesh.GetStatusFlags()` 的状态标志。
+
+Reports of many shapes can be merged with `aggregate_reports` for a batch.
+# 多个形状的报告可以用 `aggregate_reports` 合并，用于批处理统计。
+"""
+
+import json
+import time
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere, BRepPrimAPI_MakeTorus
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
+from OCC.Core.BRep import BRep_Tool
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Copy
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.GeomAbs import (GeomAbs_Plane, GeomAbs_Cylinder, GeomAbs_Cone, GeomAbs_Sphere,
+                              GeomAbs_Torus, GeomAbs_BezierSurface, GeomAbs_BSplineSurface,
+                              GeomAbs_SurfaceOfRevolution, GeomAbs_SurfaceOfExtrusion,
+                              GeomAbs_OffsetSurface, GeomAbs_OtherSurface)
+from OCC.Core.IMeshData import (IMeshData_OpenWire, IMeshData_SelfIntersectingWire, IMeshData_Failure,
+                                IMeshData_ReMesh, IMeshData_UserBreak, IMeshData_Outdated)
+
+from occt_helpers.mesh import indexed_faces
+
+SURFACE_TYPE_NAMES = {
+    GeomAbs_Plane: "Plane",
+    GeomAbs_Cylinder: "Cylinder",
+    GeomAbs_Cone: "Cone",
+    GeomAbs_Sphere: "Sphere",
+    GeomAbs_Torus: "Torus",
+    GeomAbs_BezierSurface: "BezierSurface",
+    GeomAbs_BSplineSurface: "BSplineSurface",
+    GeomAbs_SurfaceOfRevolution: "SurfaceOfRevolution",
+    GeomAbs_SurfaceOfExtrusion: "SurfaceOfExtrusion",
+    GeomAbs_OffsetSurface: "OffsetSurface",
+    GeomAbs_OtherSurface: "OtherSurface",
+}
+
+STATUS_FLAG_NAMES = {
+    IMeshData_OpenWire: "OpenWire",
+    IMeshData_SelfIntersectingWire: "SelfIntersectingWire",
+    IMeshData_Failure: "Failure",
+    IMeshData_ReMesh: "ReMesh",
+    IMeshData_UserBreak: "UserBreak",
+    IMeshData_Outdated: "Outdated",
+}
+
+def decode_status_flags(flags):
+    """
+    Turns a `GetStatusFlags()` bit mask into a list of flag names.
+    # 将 `GetStatusFlags()` 的位掩码转换为标志名称列表。
+    """
+    return [name for bit, name in STATUS_FLAG_NAMES.items() if flags & int(bit)]
+
+def _isolated_face_time(face, linear_deflection, angular_deflection):
+    """
+    Meshes an unmeshed copy of `face` on its own and returns the elapsed time.
+    # 单独网格化 `face` 的一个未网格化副本，并返回耗时。
+    """
+    face_copy = BRepBuilderAPI_Copy(face, True, False).Shape()
+    start = time.perf_counter()
+    BRepMesh_IncrementalMesh(face_copy, linear_deflection, False, angular_deflection, False)
+    return time.perf_counter() - start
+
+def mesh_with_report(shape, linear_deflection, angular_deflection=0.5, worst_n=5, name="",
+                     clean=True, profile_faces=True):
+    """
+    Meshes `shape` with one `BRepMesh_IncrementalMesh` call and returns a metrics report (a plain dict).
+    # 用一次 `BRepMesh_IncrementalMesh` 调用网格化 `shape`，并返回一份指标报告（普通字典）。
+
+    `total_time_s` times exactly that call. The per-face triangle counts,
+    achieved deflections and surface types are read from the resulting
+    triangulations afterwards. With `clean=True` an unmeshed copy of `shape`
+    is meshed and read, so the caller's shape and its triangulation are left
+    untouched; otherwise `shape` itself is meshed and an already meshed shape
+    reports ~0 s (`was_meshed` tells which case applied).
+    # `total_time_s` 只测量这一次调用。每个面的三角形数量、实际挠度和曲面类型在之后从生成的三角化中读取。
+    # 当 `clean=True` 时会网格化并读取 `shape` 的一个未网格化副本，调用者的形状及其三角化保持不变；
+    # 否则会直接网格化 `shape`，已经网格化的形状会报告约 0 秒（`was_meshed` 说明属于哪种情况）。
+
+    The whole-shape mesher has no per-face timer, so with `profile_faces=True`
+    every face is additionally meshed as an isolated copy to rank the faces by
+    `isolated_time_s`. Those timings are diagnostic: they include edges that
+    the whole-shape run discretizes only once and do not add up to the total.
+    # 整体网格化程序没有逐面计时，因此当 `profile_faces=True` 时，每个面还会以独立副本的形式单独网格化，
+    # 以便按 `isolated_time_s` 对面排序。这些时间仅用于诊断：它们包含了整体网格化中只离散一次的边，
+    # 其总和也不等于总耗时。
+    """
+    faces = indexed_faces(shape)
+    was_meshed = any(BRep_Tool.Triangulation(face, TopLoc_Location()) is not None for face in faces)
+    if clean:
+        # Copy the geometry but not the mesh, then mesh the copy.
+        # # 复制几何但不复制网格，然后网格化这个副本。
+        shape = BRepBuilderAPI_Copy(shape, True, False).Shape()
+        faces = indexed_faces(shape)
+
+    start = time.perf_counter()
+    mesher = BRepMesh_IncrementalMesh(shape, linear_deflection, False, angular_deflection, False)
+    total_time = time.perf_counter() - start
+    status_flags = mesher.GetStatusFlags()
+
+    face_stats = []
+    for face_id, face in enumerate(faces):
+        triangulation = BRep_Tool.Triangulation(face, TopLoc_Location())
+        stat = {
+            "face_id": face_id,
+            "surface_type": SURFACE_TYPE_NAMES.get(BRepAdaptor_Surface(face).GetType(), "Unknown"),
+            "nb_triangles": triangulation.NbTriangles() if triangulation is not None else 0,
+            "deflection": triangulation.Deflection() if triangulation is not None else None,
+        }
+        if profile_faces:
+            stat["isolated_time_s"] = _isolated_face_time(face, linear_deflection, angular_deflection)
+        face_stats.append(stat)
+
+    total_triangles = sum(stat["nb_triangles"] for stat in face_stats)
+    report = {
+        "name": name,
+        "linear_deflection": linear_deflection,
+        "angular_deflection": angular_deflection,
+        "was_meshed": was_meshed,
+        "nb_faces": len(faces),
+        "nb_unmeshed_faces": sum(1 for stat in face_stats if stat["nb_triangles"] == 0),
+        "nb_triangles": total_triangles,
+        "total_time_s": total_time,
+        "triangles_per_s": total_triangles / total_time if total_time > 0 else 0.0,
+        "status_flags": decode_status_flags(status_flags),
+        "worst_by_triangles": sorted(face_stats, key=lambda s: s["nb_triangles"], reverse=True)[:worst_n],
+    }
+    if profile_faces:
+        report["worst_by_time"] = sorted(face_stats, key=lambda s: s["isolated_time_s"], reverse=True)[:worst_n]
+    return report
+
+def aggregate_reports(reports, worst_n=5):
+    """
+    Combines the reports of a batch into one summary.
+    # 将一批报告合并为一份汇总。
+    """
+    total_time = sum(r["total_time_s"] for r in reports)
+    total_triangles = sum(r["nb_triangles"] for r in reports)
+    flag_counts = {}
+    for report in reports:
+        for flag in report["status_flags"]:
+            flag_counts[flag] = flag_counts.get(flag, 0) + 1
+    return {
+        "nb_shapes": len(reports),
+        "nb_triangles": total_triangles,
+        "total_time_s": total_time,
+        "triangles_per_s": total_triangles / total_time if total_time > 0 else 0.0,
+        "shapes_with_flags": flag_counts,
+        "slowest_shapes": [
+            {"name": r["name"], "total_time_s": r["total_time_s"], "nb_triangles": r["nb_triangles"]}
+            for r in sorted(reports, key=lambda r: r["total_time_s"], reverse=True)[:worst_n]
+        ],
+    }
+
+def run_metrics_example():
+    """
+    Meshes a few shapes with instrumentation and prints the reports.
+    # 对几个形状进行带测量的网格化，并打印报告。
+    """
+    print("--- Meshing Metrics Report ---")
+    # --- 网格化指标报告 ---
+
+    # 1. Create a small batch of shapes.
+    # 1. 创建一小批形状。
+    shapes = {
+        "sphere": BRepPrimAPI_MakeSphere(50.0).Shape(),
+        "torus": BRepPrimAPI_MakeTorus(40.0, 10.0).Shape(),
+        "box_sphere": BRepAlgoAPI_Fuse(BRepPrimAPI_MakeBox(100, 100, 100).Shape(),
+                                       BRepPrimAPI_MakeSphere(75).Shape()).Shape(),
+    }
+
+    # 2. Mesh each shape and collect its report.
+    # 2. 网格化每个形状并收集其报告。
+    reports = [mesh_with_report(shape, 0.1, worst_n=3, name=name) for name, shape in shapes.items()]
+    for report in reports:
+        print(f"\n{report['name']}: {report['nb_triangles']} triangles in {report['total_time_s']:.3f} s "
+              f"({report['triangles_per_s']:.0f} tri/s), flags={report['status_flags']}")
+        # {名称}: ... 个三角形，用时 ... 秒（... 三角形/秒），标志=...
+        for stat in report["worst_by_time"]:
+            print(f"  - face #{stat['face_id']} ({stat['surface_type']}): "
+                  f"{stat['isolated_time_s'] * 1000:.1f} ms isolated, {stat['nb_triangles']} triangles")
+            #   - 面 #... (曲面类型): ... 毫秒, ... 个三角形
+
+    # 3. Aggregate the batch; the result is ready for `json.dump`.
+    # 3. 汇总整个批次；结果可以直接用于 `json.dump`。
+    summary = aggregate_reports(reports)
+    print("\n--- Batch Summary ---")
+    # --- 批次汇总 ---
+    print(json.dumps(summary, indent=2))
+
+    # 4. A report on an already meshed shape still times a full run and keeps its mesh.
+    # 4. 对已经网格化的形状生成报告，仍然测量的是一次完整的网格化，并且保留其原有网格。
+    BRepMesh_IncrementalMesh(shapes["sphere"], 1.0)
+    coarse = [BRep_Tool.Triangulation(face, TopLoc_Location()).NbTriangles() for face in indexed_faces(shapes["sphere"])]
+    again = mesh_with_report(shapes["sphere"], 0.1, name="sphere", profile_faces=False)
+    kept = [BRep_Tool.Triangulation(face, TopLoc_Location()).NbTriangles() for face in indexed_faces(shapes["sphere"])]
+
+    # 5. Verification
+    # 5. 验证
+    assert summary["nb_triangles"] == sum(r["nb_triangles"] for r in reports) > 0
+    assert again["was_meshed"] and again["nb_triangles"] == reports[0]["nb_triangles"]
+    assert kept == coarse
+    assert all(BRep_Tool.Triangulation(face, TopLoc_Location()) is None for face in indexed_faces(shapes["torus"]))
+    print("\nVerification successful: every shape produced a report.")
+    # 验证成功：每个形状都生成了报告。
+
+if __name__ == '__main__':
+    run_metrics_example()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""
+BRepMesh Example 5: Streaming Face-chunk Mesh Generator
+# BRepMesh 示例 5：按面分块的流式网格生成器
+
+Very large models do not fit in memory once every face is triangulated. This
+file meshes the faces of a shape in groups and yields each group as NumPy
+arrays as soon as it is ready. A writer (STL, GLB, ...) can consume the
+chunks and stream them to disk.
+# 大型模型在所有面都三角化后可能无法装入内存。本文件分组对形状的面进行网格化，每组一准备好就以 NumPy 数组的形式产出。
+# 写入器（STL、GLB 等）可以逐块消费并流式写入磁盘。
+
+Each face is meshed together with its already meshed neighbours, so
+`BRepMesh` reuses their discretization of the shared edges and the chunks
+conform at the seams. With `release=True` a face triangulation is dropped as
+soon as all neighbours of the face are meshed, i.e. when no later face needs
+its edge discretization any more. Only this frontier of faces stays in memory.
+# 每个面都与其已网格化的相邻面一起网格化，因此 `BRepMesh` 会复用相邻面对共享边的离散结果，各数据块在接缝处保持一致。
+# 当 `release=True` 时，一旦某个面的所有相邻面都已网格化（即后续的面不再需要它的边离散结果），就删除该面的三角化数据。
+# 内存中只保留这一“前沿”上的面。
+
+The generator `iter_mesh_chunks` lives in `occt_helpers.mesh`, so writers in
+other packages can import it; this file runs and checks it.
+# 生成器 `iter_mesh_chunks` 位于 `occt_helpers.mesh` 中，以便其他包中的写入器导入；本文件运行并检查它。
+"""
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRep import BRep_Tool
+from OCC.Core.TopLoc import TopLoc_Location
+
+from occt_helpers.mesh import indexed_faces, iter_mesh_chunks, is_watertight
+
+def run_chunks_example():
+    """
+    Streams the mesh of a composite shape in bounded chunks.
+    # 以有界的数据块流式输出一个复合形状的网格。
+    """
+    print("--- Streaming Mesh Chunks ---")
+    # --- 流式网格数据块 ---
+
+    # 1. Create the B-Rep shape.
+    # 1. 创建B-Rep形状。
+    box = BRepPrimAPI_MakeBox(100, 100, 100).Shape()
+    sphere = BRepPrimAPI_MakeSphere(75).Shape()
+    shape = BRepAlgoAPI_Fuse(box, sphere).Shape()
+
+    # 2. Consume the chunks one at a time.
+    # 2. 逐块消费数据。
+    max_triangles = 2000
+    total_triangles, nb_chunks, largest = 0, 0, 0
+    chunks = []
+    for chunk in iter_mesh_chunks(shape, 0.1, max_triangles, release=True):
+        chunks.append(chunk)
+        nb_chunks += 1
+        total_triangles += len(chunk["triangles"])
+        largest = max(largest, len(chunk["triangles"]))
+        print(f"  chunk #{nb_chunks}: {len(chunk['vertices'])} vertices, {len(chunk['triangles'])} triangles, "
+              f"faces {sorted(set(chunk['face_ids'].tolist()))}")
+        #   数据块 #...: ... 个顶点, ... 个三角形, 面 [...]
+
+    print(f"\nStreamed {total_triangles} triangles in {nb_chunks} chunks (largest: {largest}).")
+    # 共以 {nb_chunks} 个数据块流式输出了 {total_triangles} 个三角形（最大块：{largest}）。
+
+    # 3. Weld all chunks by coordinates: the seams must close without gaps.
+    # 3. 按坐标焊接所有数据块：接缝处必须闭合，没有缝隙。
+    offsets = np.cumsum([0] + [len(chunk["vertices"]) for chunk in chunks[:-1]])
+    vertices = np.concatenate([chunk["vertices"] for chunk in chunks])
+    triangles = np.concatenate([chunk["triangles"] + offset for chunk, offset in zip(chunks, offsets)])
+    _, weld = np.unique(vertices, axis=0, return_inverse=True)
+    triangles = weld.reshape(-1)[triangles]
+    triangles = triangles[(triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2])
+                          & (triangles[:, 2] != triangles[:, 0])]
+
+    # 4. Verification: the chunks conform at the seams and the triangulations were released.
+    # 4. 验证：各数据块在接缝处保持一致，并且三角化数据已从形状中释放。
+    assert total_triangles > 0
+    assert is_watertight(triangles)
+    assert all(BRep_Tool.Triangulation(face, TopLoc_Location()) is None for face in indexed_faces(shape))
+    print("Verification successful: the chunks form a watertight mesh and the shape holds no triangulation.")
+    # 验证成功：各数据块组成了水密网格，并且形状中不再保留三角化数据。
+
+if __name__ == '__main__':
+    run_chunks_example()
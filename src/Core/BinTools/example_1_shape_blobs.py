@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+BinTools Example 1: Shapes as Binary Blobs
+# BinTools 示例 1：将形状作为二进制数据块
+
+This file demonstrates how to turn a `TopoDS_Shape` into a compact `bytes`
+object with the `BinTools` binary BRep format, and how to rebuild the shape
+from those bytes. A `bytes` object can be sent to another process, stored in a
+cache or written to a database, which a `TopoDS_Shape` itself cannot.
+# 本文件演示了如何使用 `BinTools` 的二进制BRep格式将 `TopoDS_Shape` 转换为紧凑的 `bytes` 对象，
+# 以及如何从这些字节重建形状。`bytes` 对象可以发送到其他进程、存入缓存或写入数据库，
+# 而 `TopoDS_Shape` 本身做不到这些。
+
+`shape_to_bytes` and `shape_from_bytes` live in `occt_helpers.blobs`, so the
+other examples can import them without path hacks.
+# `shape_to_bytes` 和 `shape_from_bytes` 位于 `occt_helpers.blobs` 中，其他示例无需修改路径即可导入。
+"""
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+
+from occt_helpers.blobs import shape_to_bytes, shape_from_bytes, count_faces
+
+def run_blob_example():
+    """
+    Round-trips a shape through a binary blob and verifies its topology.
+    # 将一个形状通过二进制数据块往返转换，并验证其拓扑结构。
+    """
+    print("--- BinTools Shape Blobs ---")
+    # --- BinTools 形状数据块 ---
+
+    # 1. Create a shape.
+    # 1. 创建一个形状。
+    box = BRepPrimAPI_MakeBox(100, 100, 50).Shape()
+    cyl = BRepPrimAPI_MakeCylinder(25, 50).Shape()
+    shape = BRepAlgoAPI_Cut(box, cyl).Shape()
+
+    # 2. Serialize it to bytes.
+    # 2. 将其序列化为字节。
+    blob = shape_to_bytes(shape)
+    print(f"Serialized shape into {len(blob)} bytes.")
+    # 已将形状序列化为 {len(blob)} 字节。
+
+    # 3. Rebuild the shape from the bytes.
+    # 3. 从字节重建形状。
+    restored = shape_from_bytes(blob)
+
+    # 4. Verification
+    # 4. 验证
+    assert not restored.IsNull()
+    assert count_faces(restored) == count_faces(shape)
+    print("Verification successful: the restored shape has the same faces.")
+    # 验证成功：重建后的形状具有相同的面。
+
+if __name__ == '__main__':
+    run_blob_example()
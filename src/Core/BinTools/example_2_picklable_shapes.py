@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+"""
+BinTools Example 2: Picklable Shapes and Triangulations
+# BinTools 示例 2：可pickle的形状和三角化数据
+
+`shape_to_bytes` in `occt_helpers.blobs` must be called explicitly
+around every process boundary. This file registers a `copyreg` reducer for
+`TopoDS_Shape` and all its subclasses, so shapes can be passed to and returned
+from `multiprocessing` / `concurrent.futures` workers like any other value:
+# `occt_helpers.blobs` 中的 `shape_to_bytes` 必须在每个进程边界处显式调用。
+# 本文件为 `TopoDS_Shape` 及其所有子类注册了 `copyreg` 归约函数，
+# 这样形状就可以像其他值一样传入 `multiprocessing` / `concurrent.futures` 工作进程并从中返回：
+
+- shapes are pickled as `BinTools` binary BRep, optionally with their face
+  triangulations (`register_shape_pickling(with_triangles=True)`),
+  # 形状以 `BinTools` 二进制BRep格式pickle，可以选择同时包含面的三角化数据
+  # （`register_shape_pickling(with_triangles=True)`），
+- a standalone `Poly_Triangulation` is pickled as NumPy arrays of nodes,
+  triangles and (when present) UV nodes.
+  # 独立的 `Poly_Triangulation` 以节点、三角形和（如果存在的）UV节点的 NumPy 数组形式pickle。
+
+The reducers live in `occt_helpers.pickling`; importing it is enough to
+register them, and this file benchmarks and exercises them.
+# 这些归约函数位于 `occt_helpers.pickling` 中；只需导入它即可完成注册，本文件对其进行基准测试和演示。
+"""
+
+import os
+import time
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRepTools import breptools
+from OCC.Core.BRep import BRep_Builder, BRep_Tool
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Solid, topods
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_SOLID
+
+from occt_helpers.blobs import count_faces
+from occt_helpers.pickling import register_shape_pickling
+
+def _volume(shape):
+    """
+    Worker: returns the volume of a shape received through pickling.
+    # 工作进程：返回通过pickle接收到的形状的体积。
+    """
+    props = GProp_GProps()
+    brepgprop.VolumeProperties(shape, props)
+    return props.Mass()
+
+def _text_round_trip(shape):
+    """
+    Writes and reads a shape with the text `BRepTools` format; returns the size.
+    # 使用文本 `BRepTools` 格式写出并读回一个形状；返回文件大小。
+    """
+    fd, path = tempfile.mkstemp(suffix=".brep")
+    os.close(fd)
+    try:
+        breptools.Write(shape, path)
+        restored = TopoDS_Shape()
+        breptools.Read(restored, path, BRep_Builder())
+        return os.path.getsize(path)
+    finally:
+        os.remove(path)
+
+def run_pickling_example():
+    """
+    Pickles shapes and triangulations, benchmarks against text BRep and uses a process pool.
+    # pickle形状和三角化数据，与文本BRep进行基准比较，并使用进程池。
+    """
+    print("--- Picklable Shapes ---")
+    # --- 可pickle的形状 ---
+
+    # 1. Create and mesh a shape.
+    # 1. 创建形状并进行网格化。
+    box = BRepPrimAPI_MakeBox(100, 100, 100).Shape()
+    shape = BRepAlgoAPI_Cut(BRepAlgoAPI_Fuse(box, BRepPrimAPI_MakeSphere(75).Shape()).Shape(),
+                            BRepPrimAPI_MakeCylinder(20, 200).Shape()).Shape()
+    BRepMesh_IncrementalMesh(shape, 0.1)
+
+    # 2. Benchmark: pickle with and without triangles vs. text BRepTools.
+    # 2. 基准测试：包含/不包含三角化数据的pickle 与 文本 BRepTools 的比较。
+    repeats = 10
+    for with_triangles in (False, True):
+        register_shape_pickling(with_triangles)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            restored = pickle.loads(pickle.dumps(shape))
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f"  pickle (triangles={with_triangles!s:<5}): {len(pickle.dumps(shape)):>9} bytes, "
+              f"{elapsed * 1000:.2f} ms per round trip")
+        #   pickle（包含三角化=...）：... 字节，每次往返 ... 毫秒
+    register_shape_pickling()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        text_size = _text_round_trip(shape)
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"  BRepTools text (triangles): {text_size:>9} bytes, {elapsed * 1000:.2f} ms per round trip")
+    #   BRepTools 文本格式（包含三角化）：... 字节，每次往返 ... 毫秒
+
+    # 3. A face triangulation on its own.
+    # 3. 单独的面三角化数据。
+    face = topods.Face(TopExp_Explorer(shape, TopAbs_FACE).Current())
+    triangulation = BRep_Tool.Triangulation(face, TopLoc_Location())
+    restored_triangulation = pickle.loads(pickle.dumps(triangulation))
+
+    # 4. Shapes as plain arguments and results of a process pool.
+    # 4. 形状作为进程池的普通参数和结果。
+    solids = []
+    for size in (10, 20, 30, 40):
+        solids.append(BRepPrimAPI_MakeBox(size, size, size).Solid())
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        volumes = list(pool.map(_volume, solids))
+    print(f"Volumes computed in worker processes: {volumes}")
+    # 在工作进程中计算的体积：...
+
+    # 5. Verification
+    # 5. 验证
+    assert isinstance(pickle.loads(pickle.dumps(solids[0])), TopoDS_Solid)
+    assert count_faces(restored) == count_faces(shape)
+    assert restored_triangulation.NbTriangles() == triangulation.NbTriangles()
+    assert np.allclose(volumes, [size ** 3 for size in (10, 20, 30, 40)])
+    explorer = TopExp_Explorer(restored, TopAbs_SOLID)
+    assert explorer.More()
+    print("Verification successful: shapes and triangulations crossed the process boundary.")
+    # 验证成功：形状和三角化数据跨越了进程边界。
+
+if __name__ == '__main__':
+    run_pickling_example()
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+
+"""
+RWGltf Example 1: Binary glTF (GLB) Export with Shared Buffers and Instancing
+# RWGltf 示例 1：带共享缓冲区和实例化的二进制glTF（GLB）导出
+
+STL has no instancing, no indices and no colors, so web-viewer payloads become
+huge. This file writes a GLB file natively from the meshing path of the
+BRepMesh examples:
+# STL 没有实例化、没有索引也没有颜色，因此Web查看器的数据量非常大。本文件基于 BRepMesh 示例中的网格化流程，
+# 原生地写出一个GLB文件：
+
+1.  Solids that share the same `TShape` (repeated parts placed with different
+    locations) are detected, meshed and stored **once**. Shells and faces
+    placed next to the solids are parts of their own.
+    # 1. 检测出共享同一个 `TShape` 的实体（以不同位置放置的重复零件），只网格化和存储**一次**。
+    #    与实体并列的壳和面各自作为独立的零件。
+2.  Each placement becomes a glTF node that references the shared mesh, with
+    the part location as its matrix.
+    # 2. 每个放置位置都成为一个引用共享网格的glTF节点，其矩阵就是该零件的位置变换。
+3.  Meshes are indexed, with smooth vertex normals per face (or welded along
+    shared edges, without normals), and all arrays live in one binary buffer;
+    positions can optionally be quantized to 16-bit integers
+    (`KHR_mesh_quantization`).
+    # 3. 网格是带索引的，每个面带有平滑的顶点法向（或者沿共享边焊接、不带法向），所有数组都存放在同一个二进制缓冲区中；
+    # 顶点位置还可以选择量化为16位整数（`KHR_mesh_quantization`）。
+
+`RWGltf_CafWriter` can also export GLB, but it needs an XCAF document; the
+native writer here works on a plain `TopoDS_Shape` and gives full control over
+the buffer layout.
+# `RWGltf_CafWriter` 也可以导出GLB，但它需要一个XCAF文档；这里的原生写入器直接作用于普通的 `TopoDS_Shape`，
+# 并可以完全控制缓冲区的布局。
+
+`find_instances` and `create_bolt_assembly` live in `occt_helpers.instances`,
+so the STEP writer can reuse them.
+# `find_instances` 和 `create_bolt_assembly` 位于 `occt_helpers.instances` 中，以便STEP写入器复用。
+"""
+
+import os
+import json
+import struct
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+
+from occt_helpers.mesh import indexed_faces, collect_mesh_arrays, build_welded_mesh
+from occt_helpers.instances import find_instances, create_bolt_assembly
+
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_CHUNK_JSON = 0x4E4F534A  # "JSON"
+GLB_CHUNK_BIN = 0x004E4942  # "BIN\0"
+COMPONENT_SHORT, COMPONENT_USHORT, COMPONENT_UINT, COMPONENT_FLOAT = 5122, 5123, 5125, 5126
+TARGET_ARRAY_BUFFER, TARGET_ELEMENT_ARRAY_BUFFER = 34962, 34963
+
+def vertex_normals(vertices, triangles):
+    """
+    Returns area-weighted, unit-length vertex normals of an indexed mesh.
+    # 返回索引网格按面积加权的单位长度顶点法向。
+    """
+    a, b, c = (vertices[triangles[:, k]] for k in range(3))
+    face_normals = np.cross(b - a, c - a)
+    normals = np.zeros_like(vertices)
+    for k in range(3):
+        np.add.at(normals, triangles[:, k], face_normals)
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+    normals[lengths[:, 0] == 0] = (0.0, 0.0, 1.0)
+    return normals
+
+def location_to_matrix(location):
+    """
+    Converts a `TopLoc_Location` into a 4x4 NumPy matrix.
+    # 将 `TopLoc_Location` 转换为 4x4 的 NumPy 矩阵。
+    """
+    trsf = location.Transformation()
+    matrix = np.eye(4)
+    for row in range(3):
+        for col in range(4):
+            matrix[row, col] = trsf.Value(row + 1, col + 1)
+    return matrix
+
+class _BufferBuilder:
+    """
+    Packs arrays into one binary buffer and creates views and accessors.
+    # 将数组打包进一个二进制缓冲区，并创建对应的视图和访问器。
+    """
+
+    def __init__(self, gltf):
+        self.gltf = gltf
+        self.chunks = []
+        self.size = 0
+
+    def add_accessor(self, array, component_type, accessor_type, target, normalized=False, bounds=None,
+                     byte_stride=None):
+        data = np.ascontiguousarray(array).tobytes()
+        padding = (-self.size) % 4  # glTF requires 4-byte alignment / glTF要求4字节对齐
+        self.chunks.append(b"\0" * padding)
+        self.size += padding
+        view = {"buffer": 0, "byteOffset": self.size, "byteLength": len(data), "target": target}
+        if byte_stride:
+            view["byteStride"] = byte_stride
+        self.gltf["bufferViews"].append(view)
+        self.chunks.append(data)
+        self.size += len(data)
+
+        accessor = {
+            "bufferView": len(self.gltf["bufferViews"]) - 1,
+            "componentType": component_type,
+            "count": len(array),
+            "type": accessor_type,
+        }
+        if normalized:
+            accessor["normalized"] = True
+        if bounds is not None:
+            accessor["min"] = bounds.min(axis=0).tolist()
+            accessor["max"] = bounds.max(axis=0).tolist()
+        self.gltf["accessors"].append(accessor)
+        return len(self.gltf["accessors"]) - 1
+
+    def data(self):
+        return b"".join(self.chunks)
+
+def write_glb(path, shape, linear_deflection=0.1, angular_deflection=0.5, quantize=False, unit_scale=0.001,
+              normals=True):
+    """
+    Writes `shape` as GLB, emitting each repeated part only once.
+    # 将 `shape` 写出为GLB，每个重复零件只写出一次。
+
+    With `normals=True` every face keeps its own vertices and gets smooth
+    `NORMAL`s, so sharp edges between faces stay sharp. With `normals=False`
+    the mesh is welded along shared edges and has no `NORMAL` attribute, which
+    makes viewers flat-shade it. Parts without triangles are skipped.
+    # 当 `normals=True` 时，每个面保留自己的顶点并带有平滑的 `NORMAL`，因此面之间的锐边保持锐利。
+    # 当 `normals=False` 时，网格沿共享边焊接且没有 `NORMAL` 属性，查看器会对其进行平面着色。
+    # 没有三角形的零件会被跳过。
+
+    `unit_scale` converts model units to glTF meters (0.001 for mm), and the
+    root node also turns the CAD Z-up axis into the glTF Y-up axis. Returns a
+    small report with the number of parts, instances and bytes written.
+    # `unit_scale` 将模型单位转换为glTF的米（毫米为0.001），根节点还会把CAD的Z轴向上转换为glTF的Y轴向上。
+    # 返回一份简短的报告，包含零件数、实例数和写出的字节数。
+    """
+    parts, placements = find_instances(shape)
+    gltf = {
+        "asset": {"version": "2.0", "generator": "pyocc GLB writer"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{
+            # Z-up to Y-up rotation combined with the unit scale.
+            # # Z轴向上到Y轴向上的旋转，并结合单位缩放。
+            "matrix": [unit_scale, 0, 0, 0, 0, 0, -unit_scale, 0, 0, unit_scale, 0, 0, 0, 0, 0, 1],
+            "children": [],
+        }],
+        "meshes": [],
+        "accessors": [],
+        "bufferViews": [],
+        "buffers": [],
+    }
+    if quantize:
+        gltf["extensionsUsed"] = gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+    buffers = _BufferBuilder(gltf)
+
+    # 1. Mesh every unique part once, in its own coordinate system.
+    # 1. 在零件自身的坐标系中，对每个唯一零件只网格化一次。
+    part_matrices, mesh_indices = [], []
+    nb_unique_triangles = 0
+    for part in parts:
+        BRepMesh_IncrementalMesh(part, linear_deflection, False, angular_deflection, False)
+        mesh = collect_mesh_arrays(indexed_faces(part)) if normals else build_welded_mesh(part)
+        vertices, triangles = mesh["vertices"], mesh["triangles"]
+        if len(triangles) == 0:
+            mesh_indices.append(None)
+            part_matrices.append(None)
+            continue
+        nb_unique_triangles += len(triangles)
+        attributes = {}
+
+        # Per-part transform applied before the placement (identity unless quantized).
+        # # 在放置变换之前应用的零件变换（除非量化，否则为单位矩阵）。
+        part_matrix = np.eye(4)
+        if quantize:
+            # Map the part bounding box onto the signed 16-bit range.
+            # # 将零件包围盒映射到有符号16位整数范围。
+            center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+            half_extent = np.maximum((vertices.max(axis=0) - vertices.min(axis=0)) / 2, 1e-12)
+            quantized = np.round((vertices - center) / half_extent * 32767).astype(np.int16)
+
+            # Vertex attributes must be 4-byte aligned: pad each 6-byte position to 8.
+            # # 顶点属性必须4字节对齐：将每个6字节的位置填充为8字节。
+            positions = np.zeros((len(quantized), 4), dtype=np.int16)
+            positions[:, :3] = quantized
+            position_accessor = buffers.add_accessor(positions, COMPONENT_SHORT, "VEC3", TARGET_ARRAY_BUFFER,
+                                                     normalized=True, bounds=quantized, byte_stride=8)
+            part_matrix[:3, :3] = np.diag(half_extent)
+            part_matrix[:3, 3] = center
+        else:
+            positions = vertices.astype(np.float32)
+            position_accessor = buffers.add_accessor(positions, COMPONENT_FLOAT, "VEC3", TARGET_ARRAY_BUFFER,
+                                                     bounds=positions)
+        attributes["POSITION"] = position_accessor
+
+        if normals:
+            vertex_normal = vertex_normals(vertices, triangles)
+            if quantize:
+                # Normals live in the scaled space of the quantized positions.
+                # # 法向位于量化位置所在的缩放空间中。
+                vertex_normal = vertex_normal * half_extent
+                vertex_normal /= np.maximum(np.linalg.norm(vertex_normal, axis=1, keepdims=True), 1e-300)
+            attributes["NORMAL"] = buffers.add_accessor(vertex_normal.astype(np.float32), COMPONENT_FLOAT, "VEC3",
+                                                        TARGET_ARRAY_BUFFER)
+
+        # glTF reserves the largest index value (65535) for primitive restart.
+        # # glTF将最大的索引值（65535）保留用于图元重启。
+        if len(vertices) < 65535:
+            indices = triangles.astype(np.uint16).ravel()
+            index_accessor = buffers.add_accessor(indices, COMPONENT_USHORT, "SCALAR", TARGET_ELEMENT_ARRAY_BUFFER)
+        else:
+            indices = triangles.astype(np.uint32).ravel()
+            index_accessor = buffers.add_accessor(indices, COMPONENT_UINT, "SCALAR", TARGET_ELEMENT_ARRAY_BUFFER)
+
+        gltf["meshes"].append({"primitives": [{"attributes": attributes, "indices": index_accessor}]})
+        mesh_indices.append(len(gltf["meshes"]) - 1)
+        part_matrices.append(part_matrix)
+
+    # 2. One node per placement, all referencing the shared mesh. glTF nodes
+    #    may only have one parent, so the mesh (not a node) is what is shared.
+    # 2. 每个放置位置一个节点，全部引用共享的网格。glTF节点只能有一个父节点，
+    #    因此被共享的是网格而不是节点。
+    for part_index, location in placements:
+        if mesh_indices[part_index] is None:
+            continue
+        node = {"mesh": mesh_indices[part_index]}
+        matrix = location_to_matrix(location) @ part_matrices[part_index]
+        if not np.allclose(matrix, np.eye(4)):
+            node["matrix"] = matrix.T.ravel().tolist()  # glTF is column-major / glTF按列存储
+        gltf["nodes"].append(node)
+        gltf["nodes"][0]["children"].append(len(gltf["nodes"]) - 1)
+
+    binary = buffers.data()
+    binary += b"\0" * ((-len(binary)) % 4)
+    gltf["buffers"].append({"byteLength": len(binary)})
+
+    # 3. Assemble the GLB container: header, JSON chunk, BIN chunk.
+    # 3. 组装GLB容器：文件头、JSON数据块、BIN数据块。
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * ((-len(json_chunk)) % 4)
+    total_length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    with open(path, "wb") as glb_file:
+        glb_file.write(struct.pack("<III", GLB_MAGIC, 2, total_length))
+        glb_file.write(struct.pack("<II", len(json_chunk), GLB_CHUNK_JSON))
+        glb_file.write(json_chunk)
+        glb_file.write(struct.pack("<II", len(binary), GLB_CHUNK_BIN))
+        glb_file.write(binary)
+
+    return {
+        "nb_parts": len(gltf["meshes"]),
+        "nb_instances": len(gltf["nodes"]) - 1,
+        "nb_unique_triangles": nb_unique_triangles,
+        "file_size": total_length,
+    }
+
+def run_glb_export_example():
+    """
+    Exports an assembly of repeated bolts to GLB and compares with STL.
+    # 将一个由重复螺栓组成的装配体导出为GLB，并与STL进行比较。
+    """
+    print("--- GLB Export with Instancing ---")
+    # --- 带实例化的GLB导出 ---
+
+    # 1. Create an assembly of 100 identical bolts.
+    # 1. 创建一个由100个相同螺栓组成的装配体。
+    assembly = create_bolt_assembly()
+
+    # 2. Export it, with and without position quantization.
+    # 2. 分别在量化与不量化顶点位置的情况下导出。
+    for quantize in (False, True):
+        glb_file_path = "bolts_quantized.glb" if quantize else "bolts.glb"
+        report = write_glb(glb_file_path, assembly, quantize=quantize)
+        print(f"{glb_file_path}: {report['nb_parts']} part(s), {report['nb_instances']} instances, "
+              f"{report['file_size']} bytes")
+        # {文件}: ... 个零件, ... 个实例, ... 字节
+
+        # An STL of the same assembly stores every triangle of every instance.
+        # # 同一装配体的STL会存储每个实例的每个三角形。
+        stl_size = 84 + 50 * report["nb_unique_triangles"] * report["nb_instances"]
+        print(f"  equivalent binary STL: {stl_size} bytes ({stl_size / report['file_size']:.0f}x larger)")
+        #   等价的二进制STL：... 字节（大 ... 倍）
+
+        # 3. Verification
+        # 3. 验证
+        with open(glb_file_path, "rb") as glb_file:
+            magic, version, length = struct.unpack("<III", glb_file.read(12))
+            json_length, _ = struct.unpack("<II", glb_file.read(8))
+            written = json.loads(glb_file.read(json_length))
+        assert magic == GLB_MAGIC and version == 2 and length == os.path.getsize(glb_file_path)
+        assert report["nb_parts"] == 1 and report["nb_instances"] == 100
+        primitive = written["meshes"][0]["primitives"][0]
+        assert "NORMAL" in primitive["attributes"]
+        index_accessor = written["accessors"][primitive["indices"]]
+        assert index_accessor["componentType"] == COMPONENT_UINT or \
+            written["accessors"][primitive["attributes"]["POSITION"]]["count"] < 65535
+        os.remove(glb_file_path)
+
+    print("\nVerification successful: the repeated part was written only once.")
+    # 验证成功：重复的零件只被写出了一次。
+
+if __name__ == '__main__':
+    run_glb_export_example()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 2: Process-parallel STEP Import
+# STEPControl 示例 2：多进程并行导入STEP
+
+`STEPControl_Reader` in `example.py` reads one file on one thread. STEP parsing
+and transfer are CPU-bound and largely single-threaded inside OCCT, so
+ingesting many files scales best with processes. `read_step_many` parses and
+transfers each file in a worker process and sends the shape back as a
+`BinTools` binary blob, together with per-file status, timings and the
+warnings reported by the reader.
+# `example.py` 中的 `STEPControl_Reader` 在单个线程中读取一个文件。STEP解析和转换都是CPU密集型的，
+# 并且在OCCT内部基本是单线程的，因此导入大量文件时，使用多进程的扩展性最好。
+# `read_step_many` 在工作进程中解析并转换每个文件，然后把形状以 `BinTools` 二进制数据块的形式传回，
+# 同时附带每个文件的状态、耗时以及读取器报告的警告信息。
+"""
+
+import os
+import time
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.gp import gp_Pnt
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.IFSelect import IFSelect_RetDone
+
+from occt_helpers.blobs import shape_to_bytes, shape_from_bytes, count_faces
+
+def collect_messages(check_iterator, limit=100):
+    """
+    Returns the fail and warning messages of an `Interface_CheckIterator`.
+    # 返回 `Interface_CheckIterator` 中的错误和警告信息。
+    """
+    messages = []
+    check_iterator.Start()
+    while check_iterator.More() and len(messages) < limit:
+        check = check_iterator.Value()
+        for i in range(1, check.NbFails() + 1):
+            messages.append(f"FAIL: {check.CFail(i)}")
+        for i in range(1, check.NbWarnings() + 1):
+            messages.append(f"WARNING: {check.CWarning(i)}")
+        check_iterator.Next()
+    return messages[:limit]
+
+def _read_step_worker(path):
+    """
+    Worker: reads and transfers one STEP file and returns a picklable result.
+    # 工作进程：读取并转换一个STEP文件，返回一个可pickle的结果。
+    """
+    result = {"path": path, "status": "error", "blob": None, "nb_roots": 0,
+              "timings": {}, "warnings": [], "error": None}
+    try:
+        step_reader = STEPControl_Reader()
+        start = time.perf_counter()
+        read_status = step_reader.ReadFile(path)
+        result["timings"]["parse_s"] = time.perf_counter() - start
+        result["warnings"] = collect_messages(step_reader.WS().ModelCheckList())
+        if read_status != IFSelect_RetDone:
+            result["error"] = f"ReadFile returned {read_status}"
+            return result
+
+        start = time.perf_counter()
+        result["nb_roots"] = step_reader.TransferRoots()
+        shape = step_reader.OneShape()
+        result["timings"]["transfer_s"] = time.perf_counter() - start
+        result["warnings"] += collect_messages(step_reader.WS().TransferReader().TransientProcess().CheckList(False))
+        if shape.IsNull():
+            result["error"] = "no shape transferred"
+            return result
+
+        start = time.perf_counter()
+        result["blob"] = shape_to_bytes(shape)
+        result["timings"]["serialize_s"] = time.perf_counter() - start
+        result["status"] = "ok"
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+def read_step_many(paths, workers=None, as_blobs=False):
+    """
+    Reads many STEP files in a process pool, one file per task.
+    # 在进程池中读取多个STEP文件，每个任务一个文件。
+
+    Returns one result dict per path, in input order, with `status` ("ok",
+    "error" or "crashed"), `shape` (or `blob` when `as_blobs` is True),
+    `nb_roots`, `timings` and `warnings`. A path listed twice is read once.
+    When a worker crashes inside OCCT, the unfinished files are retried one
+    per process, up to `workers` processes at a time, and only a file that
+    crashes again is marked "crashed".
+    # 按输入顺序为每个路径返回一个结果字典，包含 `status`（"ok"、"error" 或 "crashed"）、
+    # `shape`（当 `as_blobs` 为 True 时为 `blob`）、`nb_roots`、`timings` 和 `warnings`。重复列出的路径只读取一次。
+    # 当工作进程在OCCT内部崩溃时，未完成的文件会每个进程一个地重试，同时最多 `workers` 个进程，
+    # 只有再次崩溃的文件才会被标记为 "crashed"。
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    results, suspects = {}, []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(path, pool.submit(_read_step_worker, path)) for path in unique_paths]
+        for path, future in futures:
+            try:
+                results[path] = future.result()
+            except BrokenProcessPool:
+                # Every unfinished file is a suspect: any of them may have killed the pool.
+                # # 每个未完成的文件都是嫌疑对象：其中任何一个都可能导致了进程池失效。
+                suspects.append(path)
+
+    # Retry each suspect alone, so only the file that crashes again is blamed.
+    # # 单独重试每个嫌疑文件，只有再次崩溃的文件才会被认定为罪魁祸首。
+    max_pools = workers or os.cpu_count() or 1
+    for start in range(0, len(suspects), max_pools):
+        batch = suspects[start:start + max_pools]
+        pools = [ProcessPoolExecutor(max_workers=1) for _ in batch]
+        try:
+            futures = [(path, pool.submit(_read_step_worker, path)) for path, pool in zip(batch, pools)]
+            for path, future in futures:
+                try:
+                    results[path] = future.result()
+                except BrokenProcessPool:
+                    results[path] = {"path": path, "status": "crashed", "blob": None, "nb_roots": 0,
+                                     "timings": {}, "warnings": [], "error": "worker process crashed"}
+        finally:
+            for pool in pools:
+                pool.shutdown()
+
+    if not as_blobs:
+        for result in results.values():
+            blob = result.pop("blob")
+            start = time.perf_counter()
+            result["shape"] = shape_from_bytes(blob) if blob else None
+            result["timings"]["deserialize_s"] = time.perf_counter() - start
+    # Duplicate paths get their own dict, sharing the shape.
+    # # 重复的路径各自得到一个字典，共享同一个形状。
+    return [dict(results[path], timings=dict(results[path]["timings"])) for path in paths]
+
+def run_parallel_import_example():
+    """
+    Writes a few STEP files and imports them in parallel.
+    # 写出几个STEP文件，然后并行导入它们。
+    """
+    print("--- Process-parallel STEP Import ---")
+    # --- 多进程并行导入STEP ---
+
+    # 1. Create a few STEP files, plus one that is not STEP at all.
+    # 1. 创建几个STEP文件，外加一个根本不是STEP的文件。
+    work_dir = tempfile.mkdtemp(prefix="step_many_")
+    paths = []
+    for i in range(6):
+        box = BRepPrimAPI_MakeBox(100 + i, 100, 50).Shape()
+        hole = BRepPrimAPI_MakeCylinder(10 + i, 50).Shape()
+        shape = BRepAlgoAPI_Cut(box, hole).Shape() if i % 2 else BRepPrimAPI_MakeSphere(gp_Pnt(0, 0, 0), 20 + i).Shape()
+        path = os.path.join(work_dir, f"part_{i}.step")
+        step_writer = STEPControl_Writer()
+        step_writer.Transfer(shape, STEPControl_AsIs)
+        assert step_writer.Write(path) == IFSelect_RetDone
+        paths.append(path)
+    broken_path = os.path.join(work_dir, "broken.step")
+    with open(broken_path, "w") as broken_file:
+        broken_file.write("this is not a STEP file\n")
+    paths.append(broken_path)
+
+    # 2. Import them all in parallel.
+    # 2. 并行导入所有文件。
+    start = time.perf_counter()
+    results = read_step_many(paths, workers=4)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        timings = ", ".join(f"{key}={value:.3f}s" for key, value in result["timings"].items())
+        print(f"  {os.path.basename(result['path'])}: {result['status']} ({timings}) "
+              f"warnings={len(result['warnings'])} {result['error'] or ''}")
+        #   {文件名}: {状态} (各阶段耗时) 警告数=... {错误}
+    print(f"Imported {len(paths)} files in {elapsed:.2f} s.")
+    # 用时 ... 秒导入了 ... 个文件。
+
+    # 3. Verification
+    # 3. 验证
+    assert all(r["status"] == "ok" and count_faces(r["shape"]) > 0 for r in results[:-1])
+    assert results[-1]["status"] == "error"
+    print("Verification successful: valid files were imported and the broken one was reported.")
+    # 验证成功：有效文件已导入，损坏的文件已被报告。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    shutil.rmtree(work_dir)
+
+if __name__ == '__main__':
+    run_parallel_import_example()
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 3: Content-addressed STEP Import Cache
+# STEPControl 示例 3：基于内容寻址的STEP导入缓存
+
+Parsing and `TransferRoots` make up almost all of the latency of importing a
+STEP file, and the same supplier files are imported again and again. This
+file caches the *result* of the import:
+# 解析和 `TransferRoots` 几乎占据了导入STEP文件的全部耗时，而同样的供应商文件会被一次又一次地导入。
+# 本文件缓存导入的*结果*：
+
+- the cache key is the SHA-256 of the file content plus the reader settings,
+  so renamed or copied files still hit and changed settings miss,
+  # 缓存键是文件内容的SHA-256加上读取器设置，因此重命名或复制的文件仍然能命中，而设置改变时则不会命中，
+- the transferred shape is stored in the `BinTools` binary format,
+  # 转换后的形状以 `BinTools` 二进制格式存储，
+- part names, colors and length units read through XCAF are stored next to
+  it as JSON.
+  # 通过XCAF读取的零件名称、颜色和长度单位以JSON格式存储在旁边。
+
+On a hit the STEP file is never parsed: OCCT reads the binary file directly.
+# 命中缓存时完全不会解析STEP文件：OCCT直接读取二进制文件。
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.STEPCAFControl import STEPCAFControl_Reader
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.Interface import Interface_Static
+from OCC.Core.BinTools import bintools, BinTools_FormatVersion_CURRENT
+from OCC.Core.TDocStd import TDocStd_Document
+from OCC.Core.TDF import TDF_LabelSequence
+from OCC.Core.XCAFDoc import XCAFDoc_DocumentTool, XCAFDoc_ColorSurf
+from OCC.Core.Quantity import Quantity_Color
+from OCC.Core.TColStd import TColStd_SequenceOfAsciiString
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
+
+CACHE_FORMAT_VERSION = 1
+
+def apply_static_settings(settings):
+    """
+    Applies `Interface_Static` reader settings from a `{name: value}` dict.
+    # 根据 `{名称: 值}` 字典设置 `Interface_Static` 读取器参数。
+    """
+    for name, value in settings.items():
+        if isinstance(value, bool) or isinstance(value, int):
+            ok = Interface_Static.SetIVal(name, int(value))
+        elif isinstance(value, float):
+            ok = Interface_Static.SetRVal(name, value)
+        else:
+            ok = Interface_Static.SetCVal(name, str(value))
+        if not ok:
+            raise ValueError(f"Unknown or invalid Interface_Static setting: {name}={value!r}")
+
+def static_value(name, like):
+    """
+    Reads the current value of a static with the Python type of `like`.
+    # 以 `like` 的Python类型读取某个静态参数的当前值。
+    """
+    if isinstance(like, bool) or isinstance(like, int):
+        return Interface_Static.IVal(name)
+    if isinstance(like, float):
+        return Interface_Static.RVal(name)
+    return Interface_Static.CVal(name)
+
+@contextmanager
+def static_settings(settings):
+    """
+    Applies `Interface_Static` settings for the duration of a `with` block.
+    # 在 `with` 代码块期间应用 `Interface_Static` 设置。
+
+    The statics are process-wide, so the previous values are restored on exit,
+    even when the block raises.
+    # 这些静态参数作用于整个进程，因此退出时会恢复之前的值，即使代码块抛出了异常。
+    """
+    saved = {name: static_value(name, value) for name, value in settings.items()}
+    apply_static_settings(settings)
+    try:
+        yield
+    finally:
+        apply_static_settings(saved)
+
+def file_sha256(path, block_size=1 << 20):
+    """
+    Hashes a file in fixed-size blocks.
+    # 以固定大小的数据块对文件计算哈希。
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as step_file:
+        for block in iter(lambda: step_file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_step_with_metadata(path):
+    """
+    Reads a STEP file through XCAF and returns `(shape, metadata)`.
+    # 通过XCAF读取STEP文件，并返回 `(shape, metadata)`。
+
+    `shape` is a compound of the free (top-level) shapes; `metadata` lists the
+    name and surface color of each of them, in the same order, and the length
+    units declared in the file.
+    # `shape` 是所有自由（顶层）形状组成的组合体；`metadata` 按相同顺序列出每个形状的名称和表面颜色，
+    # 以及文件中声明的长度单位。
+    """
+    doc = TDocStd_Document("pythonocc-doc-step-import")
+    caf_reader = STEPCAFControl_Reader()
+    caf_reader.SetNameMode(True)
+    caf_reader.SetColorMode(True)
+    if caf_reader.ReadFile(path) != IFSelect_RetDone:
+        raise RuntimeError(f"could not read STEP file {path}")
+    if not caf_reader.Transfer(doc):
+        raise RuntimeError(f"could not transfer STEP file {path}")
+
+    shape_tool = XCAFDoc_DocumentTool.ShapeTool(doc.Main())
+    color_tool = XCAFDoc_DocumentTool.ColorTool(doc.Main())
+    labels = TDF_LabelSequence()
+    shape_tool.GetFreeShapes(labels)
+
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    parts = []
+    for i in range(1, labels.Length() + 1):
+        label = labels.Value(i)
+        builder.Add(compound, shape_tool.GetShape(label))
+        color = Quantity_Color()
+        has_color = color_tool.GetColor(label, XCAFDoc_ColorSurf, color)
+        parts.append({
+            "name": label.GetLabelName(),
+            "color": [color.Red(), color.Green(), color.Blue()] if has_color else None,
+        })
+
+    length_units = TColStd_SequenceOfAsciiString()
+    angle_units = TColStd_SequenceOfAsciiString()
+    solid_angle_units = TColStd_SequenceOfAsciiString()
+    caf_reader.ChangeReader().FileUnits(length_units, angle_units, solid_angle_units)
+    metadata = {
+        "parts": parts,
+        "length_units": [length_units.Value(i).ToCString() for i in range(1, length_units.Length() + 1)],
+    }
+    return compound, metadata
+
+class StepImportCache:
+    """
+    A directory of transferred STEP shapes keyed by content hash and settings.
+    # 一个以内容哈希和设置为键、存放已转换STEP形状的目录。
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key_for(self, path, settings=None):
+        """
+        Returns the cache key of a file imported with the given settings.
+        # 返回使用给定设置导入某个文件时的缓存键。
+        """
+        settings_json = json.dumps(settings or {}, sort_keys=True)
+        key_source = f"{file_sha256(path)}|{settings_json}|{CACHE_FORMAT_VERSION}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".bin", base + ".json"
+
+    def load(self, path, settings=None):
+        """
+        Returns `(shape, metadata, hit)`, importing and storing on a miss.
+        # 返回 `(shape, metadata, hit)`；未命中时会导入并存储结果。
+        """
+        key = self.key_for(path, settings)
+        shape_path, metadata_path = self._paths(key)
+
+        if os.path.exists(shape_path) and os.path.exists(metadata_path):
+            shape = TopoDS_Shape()
+            if bintools.Read(shape, shape_path):
+                with open(metadata_path) as metadata_file:
+                    return shape, json.load(metadata_file), True
+
+        # Restoring the statics keeps a later `settings=None` import from
+        # running with these settings and caching the result under the wrong key.
+        # # 恢复静态参数可以避免之后 `settings=None` 的导入沿用这些设置，并把结果缓存在错误的键下。
+        with static_settings(settings or {}):
+            shape, metadata = read_step_with_metadata(path)
+        metadata["settings"] = settings or {}
+        metadata["source"] = os.path.abspath(path)
+
+        # Write to temporary names first so a crash never leaves a half entry.
+        # # 先写入临时文件名，这样即使崩溃也不会留下不完整的缓存项。
+        os.makedirs(os.path.dirname(shape_path), exist_ok=True)
+        if not bintools.Write(shape, shape_path + ".tmp", False, False, BinTools_FormatVersion_CURRENT):
+            raise RuntimeError("BinTools failed to write the cached shape")
+        with open(metadata_path + ".tmp", "w") as metadata_file:
+            json.dump(metadata, metadata_file)
+        os.replace(shape_path + ".tmp", shape_path)
+        os.replace(metadata_path + ".tmp", metadata_path)
+        return shape, metadata, False
+
+def run_cache_example():
+    """
+    Imports a STEP file, then again and as a renamed copy, and shows the cache hits.
+    # 导入一个STEP文件，再次导入它及其改名后的副本，展示缓存命中。
+    """
+    print("--- Content-addressed STEP Import Cache ---")
+    # --- 基于内容寻址的STEP导入缓存 ---
+    work_dir = tempfile.mkdtemp(prefix="step_cache_")
+
+    # 1. Write a STEP file, and a renamed copy of it.
+    # 1. 写出一个STEP文件及其改名后的副本。
+    box = BRepPrimAPI_MakeBox(100, 100, 50).Shape()
+    cyl = BRepPrimAPI_MakeCylinder(25, 50).Shape()
+    step_writer = STEPControl_Writer()
+    step_writer.Transfer(BRepAlgoAPI_Cut(box, cyl).Shape(), STEPControl_AsIs)
+    step_path = os.path.join(work_dir, "supplier_part.step")
+    assert step_writer.Write(step_path) == IFSelect_RetDone
+    copy_path = os.path.join(work_dir, "supplier_part_copy.step")
+    shutil.copy(step_path, copy_path)
+
+    # 2. Import: a miss, then hits (the copy has the same content).
+    # 2. 导入：第一次未命中，之后命中（副本的内容相同）。
+    cache = StepImportCache(os.path.join(work_dir, "cache"))
+    hits = []
+    for path in (step_path, step_path, copy_path):
+        start = time.perf_counter()
+        shape, metadata, hit = cache.load(path)
+        hits.append(hit)
+        print(f"  {os.path.basename(path)}: {'hit ' if hit else 'miss'} in {time.perf_counter() - start:.4f} s, "
+              f"parts={[part['name'] for part in metadata['parts']]}, units={metadata['length_units']}")
+        #   {文件名}: 命中/未命中 用时 ... 秒, 零件=..., 单位=...
+
+    # 3. Custom settings are a separate entry and do not leak into later imports.
+    # 3. 自定义设置对应单独的缓存项，并且不会影响之后的导入。
+    precision_mode = Interface_Static.IVal("read.precision.mode")
+    _, metadata, hit = cache.load(step_path, {"read.precision.mode": 1, "read.precision.val": 0.01})
+    hits.append(hit)
+    print(f"  custom settings: {'hit ' if hit else 'miss'}, settings={metadata['settings']}")
+    #   自定义设置: 命中/未命中, 设置=...
+
+    # 4. Verification
+    # 4. 验证
+    assert hits == [False, True, True, False]
+    assert Interface_Static.IVal("read.precision.mode") == precision_mode
+    assert not shape.IsNull()
+    print("Verification successful: repeated imports were served from the cache.")
+    # 验证成功：重复的导入由缓存提供。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    shutil.rmtree(work_dir)
+
+if __name__ == '__main__':
+    run_cache_example()
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 4: Lazy, Selective Assembly Loading via XCAF
+# STEPControl 示例 4：通过XCAF按需、选择性地加载装配体
+
+`step_reader.Shape(1)` in `example.py` only works after `TransferRoots()`, i.e.
+after the whole file has been converted to B-Rep. For a large plant model
+where the user only wants one subassembly, almost all of that work is wasted.
+`LazyStepAssembly` splits the import in two:
+# `example.py` 中的 `step_reader.Shape(1)` 只有在 `TransferRoots()` 之后才能使用，也就是整个文件都已转换为B-Rep之后。
+# 对于一个大型工厂模型，如果用户只需要其中一个子装配体，那么几乎所有这些工作都被浪费了。
+# `LazyStepAssembly` 把导入分为两步：
+
+1.  `ReadFile` parses the entities, and the product tree is built from the
+    `PRODUCT_DEFINITION` and `NEXT_ASSEMBLY_USAGE_OCCURRENCE` entities of the
+    parsed model. No geometry is transferred.
+    # 1. `ReadFile` 解析实体，然后根据已解析模型中的 `PRODUCT_DEFINITION` 和
+    #    `NEXT_ASSEMBLY_USAGE_OCCURRENCE` 实体构建产品树。此时不转换任何几何。
+2.  `load(product)` transfers only the part products (the leaves) below the
+    requested product, each once, and stores each as a named label of an XCAF
+    document. Assemblies are not transferred: their labels are built from
+    the cached child labels with `AddComponent`, using the placements read
+    from the parsed model. Loading a parent after one of its subassemblies
+    reuses everything already loaded.
+    # 2. `load(product)` 只转换所请求产品下面的零件产品（叶子节点），每个只转换一次，并把每个零件作为XCAF文档中
+    #    一个带名称的标签保存。装配体本身不被转换：它的标签由已缓存的子标签通过 `AddComponent` 构建，
+    #    放置变换直接从已解析的模型中读取。先加载某个子装配体、再加载其父产品时，会复用所有已加载的内容。
+
+Parsing still reads the whole file; what is saved is the transfer to B-Rep,
+which is usually the dominant cost.
+# 解析仍然会读取整个文件；节省下来的是到B-Rep的转换，而它通常是主要的开销。
+"""
+
+import os
+import time
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pnt, gp_Dir, gp_Ax3
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder, BRepPrimAPI_MakeSphere
+from OCC.Core.STEPControl import STEPControl_AsIs
+from OCC.Core.STEPCAFControl import STEPCAFControl_Reader, STEPCAFControl_Writer
+from OCC.Core.StepBasic import StepBasic_ProductDefinition
+from OCC.Core.StepRepr import StepRepr_NextAssemblyUsageOccurrence, StepRepr_RepresentationRelationshipWithTransformation
+from OCC.Core.StepShape import StepShape_ContextDependentShapeRepresentation
+from OCC.Core.StepGeom import StepGeom_Axis2Placement3d
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.TDocStd import TDocStd_Document
+from OCC.Core.TDataStd import TDataStd_Name
+from OCC.Core.XCAFDoc import XCAFDoc_DocumentTool, XCAFDoc_ShapeTool
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_SOLID
+from OCC.Core.TColStd import TColStd_SequenceOfAsciiString
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+
+# Length units as reported by `FileUnits`, in millimetres.
+# # `FileUnits` 报告的长度单位，以毫米计。
+LENGTH_UNITS_MM = {"MM": 1.0, "CM": 10.0, "M": 1000.0, "KM": 1e6, "UM": 1e-3,
+                   "INCH": 25.4, "IN": 25.4, "FT": 304.8, "MI": 1609344.0}
+
+def _product_name(product_definition):
+    """
+    Returns the name of the product a `StepBasic_ProductDefinition` belongs to.
+    # 返回一个 `StepBasic_ProductDefinition` 所属产品的名称。
+    """
+    name = product_definition.Formation().OfProduct().Name()
+    return name.ToCString() if name is not None else ""
+
+def _axis_placement(placement, scale):
+    """
+    Converts a `StepGeom_Axis2Placement3d` into a `gp_Ax3`, scaling its origin.
+    # 把 `StepGeom_Axis2Placement3d` 转换为 `gp_Ax3`，并缩放其原点。
+    """
+    location = placement.Location()
+    origin = gp_Pnt(*(scale * location.CoordinatesValue(i) for i in (1, 2, 3)))
+    z_axis = placement.Axis() if placement.HasAxis() else None
+    x_axis = placement.RefDirection() if placement.HasRefDirection() else None
+    z_dir = gp_Dir(*(z_axis.DirectionRatiosValue(i) for i in (1, 2, 3))) if z_axis else gp_Dir(0, 0, 1)
+    x_dir = gp_Dir(*(x_axis.DirectionRatiosValue(i) for i in (1, 2, 3))) if x_axis else gp_Dir(1, 0, 0)
+    if x_dir.IsParallel(z_dir, 1e-9):
+        x_dir = gp_Dir(0, 0, 1) if not z_dir.IsParallel(gp_Dir(0, 0, 1), 1e-9) else gp_Dir(1, 0, 0)
+    # `gp_Ax3` projects the X direction onto the plane normal to Z.
+    # # `gp_Ax3` 会把X方向投影到垂直于Z的平面上。
+    return gp_Ax3(origin, z_dir, x_dir)
+
+class LazyStepAssembly:
+    """
+    A parsed STEP file whose products are transferred one at a time, on demand.
+    # 一个已解析的STEP文件，其中的产品按需逐个转换。
+
+    Products are identified by the entity number of their product definition
+    in the STEP model. Placements are read assuming the AP214 convention
+    that `TRANSFORM_ITEM_1` is the child's origin and `TRANSFORM_ITEM_2` its
+    position in the parent, as written by OCCT.
+    # 产品通过其产品定义在STEP模型中的实体编号来标识。读取放置变换时假定遵循AP214约定
+    # （与OCCT写出的文件相同）：`TRANSFORM_ITEM_1` 是子产品的原点，`TRANSFORM_ITEM_2` 是它在父产品中的位置。
+
+    A placement that cannot be resolved this way (no transformation found,
+    or one given by a `MAPPED_ITEM`) is replaced by the identity and
+    reported in `warnings`.
+    # 无法按这种方式解析的放置变换（找不到变换，或者变换由 `MAPPED_ITEM` 给出）会被替换为单位变换，
+    # 并记录在 `warnings` 中。
+    """
+
+    def __init__(self, path):
+        self._caf_reader = STEPCAFControl_Reader()
+        start = time.perf_counter()
+        if self._caf_reader.ReadFile(path) != IFSelect_RetDone:
+            raise RuntimeError(f"could not read STEP file {path}")
+        self.parse_time = time.perf_counter() - start
+        self._reader = self._caf_reader.ChangeReader()
+        self._model = self._reader.StepModel()
+
+        # Transferred products live in an XCAF document, one label each.
+        # # 已转换的产品保存在一个XCAF文档中，每个产品一个标签。
+        self.doc = TDocStd_Document("pythonocc-doc-lazy-step")
+        self.shape_tool = XCAFDoc_DocumentTool.ShapeTool(self.doc.Main())
+        self._labels = {}
+        self.transfer_times = {}
+        self.transferred = []
+        self.warnings = []
+
+        # Placements are stored in file units; shapes come back in millimetres.
+        # # 放置变换以文件单位存储；转换得到的形状以毫米为单位。
+        length_units, angle_units, solid_angle_units = (TColStd_SequenceOfAsciiString() for _ in range(3))
+        self._reader.FileUnits(length_units, angle_units, solid_angle_units)
+        unit = length_units.Value(1).ToCString().upper() if length_units.Length() else "MM"
+        self._scale = LENGTH_UNITS_MM.get(unit, 1.0) / self._reader.SystemLengthUnit()
+
+        start = time.perf_counter()
+        self.products = self._build_product_tree()
+        self.tree_time = time.perf_counter() - start
+
+    def _build_product_tree(self):
+        """
+        Returns `{number: {"name", "children", "parents", "usages"}}` for all products.
+        # 返回所有产品的 `{编号: {"name", "children", "parents", "usages"}}`。
+
+        `usages` lists `(child, placement)` pairs, one per placed instance,
+        where `placement` is a `gp_Trsf` from the child into the parent.
+        # `usages` 列出 `(child, placement)` 对，每个放置的实例一对，其中 `placement` 是从子产品到父产品的 `gp_Trsf`。
+        """
+        products = {}
+        usages = []
+        placements = {}
+        for number in range(1, self._model.NbEntities() + 1):
+            entity = self._model.Value(number)
+            if entity.IsKind("StepBasic_ProductDefinition"):
+                product_definition = StepBasic_ProductDefinition.DownCast(entity)
+                products[number] = {"name": _product_name(product_definition), "children": [],
+                                    "parents": [], "usages": []}
+            elif entity.IsKind("StepRepr_NextAssemblyUsageOccurrence"):
+                usages.append((number, StepRepr_NextAssemblyUsageOccurrence.DownCast(entity)))
+            elif entity.IsKind("StepShape_ContextDependentShapeRepresentation"):
+                usage_number, placement = self._read_placement(
+                    StepShape_ContextDependentShapeRepresentation.DownCast(entity))
+                if usage_number:
+                    placements[usage_number] = placement
+
+        # Each usage occurrence is one placed instance of a child in its parent.
+        # # 每个使用实例都表示子产品在其父产品中的一次放置。
+        for number, usage in usages:
+            parent = self._model.Number(usage.RelatingProductDefinition())
+            child = self._model.Number(usage.RelatedProductDefinition())
+            if parent in products and child in products:
+                placement = placements.get(number)
+                if placement is None:
+                    reason = "no transformation found" if number not in placements else "unsupported transformation"
+                    self.warnings.append(f"usage #{number} of '{products[child]['name']}' in "
+                                         f"'{products[parent]['name']}': {reason}, identity placement used")
+                    placement = gp_Trsf()
+                products[parent]["children"].append(child)
+                products[parent]["usages"].append((child, placement))
+                products[child]["parents"].append(parent)
+        return products
+
+    def _read_placement(self, representation):
+        """
+        Returns `(usage number, gp_Trsf)` of a context-dependent shape representation.
+        # 返回一个上下文相关形状表示的 `(使用实例编号, gp_Trsf)`。
+
+        The transformation is None when it is not an item-defined
+        transformation between two axis placements.
+        # 如果变换不是两个轴放置之间的项定义变换，则返回的变换为 None。
+        """
+        usage = representation.RepresentedProductRelation().Definition().ProductDefinitionRelationship()
+        relation = representation.RepresentationRelation()
+        if usage is None or relation is None:
+            return 0, None
+        if relation.IsKind("StepRepr_RepresentationRelationshipWithTransformation"):
+            operator = StepRepr_RepresentationRelationshipWithTransformation.DownCast(relation).TransformationOperator()
+            transformation = operator.ItemDefinedTransformation()
+            if transformation is not None:
+                origin = StepGeom_Axis2Placement3d.DownCast(transformation.TransformItem1())
+                target = StepGeom_Axis2Placement3d.DownCast(transformation.TransformItem2())
+                if origin is not None and target is not None:
+                    trsf = gp_Trsf()
+                    trsf.SetDisplacement(_axis_placement(origin, self._scale), _axis_placement(target, self._scale))
+                    return self._model.Number(usage), trsf
+        return self._model.Number(usage), None
+
+    def roots(self):
+        """
+        Returns the products that are not used inside another product.
+        # 返回没有被其他产品使用的产品。
+        """
+        return [number for number, product in self.products.items() if not product["parents"]]
+
+    def find(self, name):
+        """
+        Returns the products with the given name.
+        # 返回具有给定名称的产品。
+        """
+        return [number for number, product in self.products.items() if product["name"] == name]
+
+    def iter_tree(self, number=None, depth=0):
+        """
+        Yields `(depth, number, name)` for a product and its subtree.
+        # 为一个产品及其子树逐个生成 `(depth, number, name)`。
+        """
+        numbers = self.roots() if number is None else [number]
+        for current in numbers:
+            yield depth, current, self.products[current]["name"]
+            for child in self.products[current]["children"]:
+                yield from self.iter_tree(child, depth + 1)
+
+    def is_loaded(self, number):
+        """
+        Returns True once a product has been transferred.
+        # 产品已被转换时返回 True。
+        """
+        return number in self._labels
+
+    def load(self, number):
+        """
+        Loads one product and returns its XCAF label.
+        # 加载一个产品，并返回它的XCAF标签。
+
+        A part is transferred once and added with `AddShape`. An assembly is
+        built from the labels of its children, loading those first, so no
+        product is ever transferred twice. The shape is in the product's own
+        coordinate system; placements of the product inside its parents are
+        not applied.
+        # 零件只转换一次，并通过 `AddShape` 添加。装配体由其子产品的标签构建（先加载这些子产品），
+        # 因此任何产品都不会被转换两次。形状位于产品自身的坐标系中；不会应用该产品在其父产品中的放置变换。
+        """
+        if number in self._labels:
+            return self._labels[number]
+
+        product = self.products[number]
+        if not product["usages"]:
+            start = time.perf_counter()
+            if not self._reader.TransferEntity(self._model.Value(number)):
+                raise RuntimeError(f"could not transfer product #{number} ({product['name']})")
+            shape = self._reader.Shape(self._reader.NbShapes())
+            label = self.shape_tool.AddShape(shape, False)
+            self.transfer_times[number] = time.perf_counter() - start
+            self.transferred.append(number)
+        else:
+            child_labels = [(self.load(child), placement) for child, placement in product["usages"]]
+            label = self.shape_tool.NewShape()
+            for child_label, placement in child_labels:
+                self.shape_tool.AddComponent(label, child_label, TopLoc_Location(placement))
+            self.shape_tool.UpdateAssemblies()
+        TDataStd_Name.Set(label, product["name"])
+        self._labels[number] = label
+        return label
+
+    def shape(self, number):
+        """
+        Returns the transferred shape of a product, loading it if needed.
+        # 返回一个产品转换后的形状，必要时先加载它。
+        """
+        return XCAFDoc_ShapeTool.GetShape(self.load(number))
+
+def create_plant_step_file(path):
+    """
+    Writes a small plant assembly with two subassemblies through XCAF.
+    # 通过XCAF写出一个包含两个子装配体的小型工厂装配体。
+    """
+    doc = TDocStd_Document("pythonocc-doc-plant")
+    shape_tool = XCAFDoc_DocumentTool.ShapeTool(doc.Main())
+
+    def add_part(shape, name):
+        label = shape_tool.AddShape(shape, False)
+        TDataStd_Name.Set(label, name)
+        return label
+
+    def add_assembly(name, components):
+        label = shape_tool.NewShape()
+        TDataStd_Name.Set(label, name)
+        for component, offset in components:
+            trsf = gp_Trsf()
+            trsf.SetTranslation(gp_Vec(*offset))
+            shape_tool.AddComponent(label, component, TopLoc_Location(trsf))
+        return label
+
+    frame = add_part(BRepPrimAPI_MakeBox(400, 200, 20).Shape(), "frame")
+    pump = add_part(BRepPrimAPI_MakeCylinder(40, 120).Shape(), "pump")
+    tank = add_part(BRepPrimAPI_MakeSphere(gp_Pnt(0, 0, 0), 150).Shape(), "tank")
+    skid = add_assembly("pump_skid", [(frame, (0, 0, 0)), (pump, (100, 100, 20)), (pump, (300, 100, 20))])
+    storage = add_assembly("storage", [(tank, (0, 0, 150)), (tank, (400, 0, 150))])
+    add_assembly("plant", [(skid, (0, 0, 0)), (storage, (0, 600, 0))])
+    shape_tool.UpdateAssemblies()
+
+    writer = STEPCAFControl_Writer()
+    writer.SetNameMode(True)
+    assert writer.Transfer(doc, STEPControl_AsIs)
+    assert writer.Write(path) == IFSelect_RetDone
+
+def run_lazy_loading_example():
+    """
+    Builds the product tree of an assembly and loads a single subassembly.
+    # 构建装配体的产品树，并只加载其中一个子装配体。
+    """
+    print("--- Lazy, Selective Assembly Loading ---")
+    # --- 按需、选择性地加载装配体 ---
+
+    # 1. Write the assembly file.
+    # 1. 写出装配体文件。
+    step_file_path = "lazy_plant.step"
+    create_plant_step_file(step_file_path)
+
+    # 2. Parse it and print the product tree; no geometry is transferred yet.
+    # 2. 解析文件并打印产品树；此时还没有转换任何几何。
+    assembly = LazyStepAssembly(step_file_path)
+    print(f"Parsed in {assembly.parse_time:.4f} s, product tree built in {assembly.tree_time:.4f} s:")
+    # 解析用时 ... 秒，产品树构建用时 ... 秒：
+    for depth, number, name in assembly.iter_tree():
+        print(f"  {'  ' * depth}#{number} {name}")
+
+    # 3. Load only the pump skid, twice.
+    # 3. 只加载泵撬，加载两次。
+    skid = assembly.find("pump_skid")[0]
+    first_label = assembly.load(skid)
+    second_label = assembly.load(skid)
+    skid_parts = list(assembly.transferred)
+    print(f"Loaded 'pump_skid' by transferring {[assembly.products[n]['name'] for n in skid_parts]} "
+          f"in {sum(assembly.transfer_times.values()):.4f} s; second request served from the cache.")
+    # 加载 'pump_skid' 时转换了 [...]，用时 ... 秒；第二次请求由缓存提供。
+    storage_loaded = any(assembly.is_loaded(number) for number in assembly.find("storage"))
+
+    # 4. Load the whole plant: only the tank is still transferred.
+    # 4. 加载整个工厂：只有储罐还需要转换。
+    plant = assembly.roots()[0]
+    plant_shape = assembly.shape(plant)
+    print(f"Loaded 'plant', transferring only {[assembly.products[n]['name'] for n in assembly.transferred[len(skid_parts):]]}.")
+    # 加载 'plant'，只转换了 [...]。
+
+    # 5. Reference: the plant transferred in one piece by a fresh reader.
+    # 5. 参考：由一个新的读取器一次性转换整个工厂。
+    reference = LazyStepAssembly(step_file_path)
+    assert reference._reader.TransferEntity(reference._model.Value(plant))
+    reference_shape = reference._reader.Shape(reference._reader.NbShapes())
+
+    # 6. Verification
+    # 6. 验证
+    def count_solids(shape):
+        explorer = TopExp_Explorer(shape, TopAbs_SOLID)
+        count = 0
+        while explorer.More():
+            count += 1
+            explorer.Next()
+        return count
+
+    def bounds(shape):
+        box = Bnd_Box()
+        brepbndlib.Add(shape, box)
+        return box.Get()
+
+    nb_solids = count_solids(assembly.shape(skid))
+    assert first_label.IsEqual(second_label)
+    assert not assembly.warnings
+    assert nb_solids == 3
+    assert not storage_loaded
+    assert sorted(assembly.products[n]["name"] for n in assembly.transferred) == ["frame", "pump", "tank"]
+    assert count_solids(plant_shape) == count_solids(reference_shape) == 5
+    assert all(abs(a - b) < 1e-3 for a, b in zip(bounds(plant_shape), bounds(reference_shape)))
+    print(f"Verification successful: the skid has {nb_solids} solids, 'storage' was not transferred with it, "
+          "and every part was transferred once.")
+    # 验证成功：泵撬有 ... 个实体，'storage' 没有随之转换，并且每个零件只转换了一次。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(step_file_path):
+        os.remove(step_file_path)
+
+if __name__ == '__main__':
+    run_lazy_loading_example()
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 5: STEP Import Instrumentation
+# STEPControl 示例 5：STEP导入的性能测量
+
+`run_step_example` only checks that `ReadFile` returned `IFSelect_RetDone`.
+To spot outlier files in a large import job we need structured metrics for
+every file. `read_step_with_metrics` returns the shape together with:
+# `run_step_example` 只检查 `ReadFile` 是否返回了 `IFSelect_RetDone`。
+# 为了在大型导入任务中找出异常文件，我们需要每个文件的结构化指标。`read_step_with_metrics` 在返回形状的同时返回：
+
+- `ReadFile` (parse) and `TransferRoots` times,
+  # `ReadFile`（解析）和 `TransferRoots` 的耗时，
+- the number of roots and of entities, per entity type,
+  # 根实体的数量，以及按类型统计的实体数量，
+- the number of transferred shapes, solids and faces,
+  # 转换得到的形状、实体和面的数量，
+- the peak resident memory reached during the import, above the baseline,
+  # 导入期间常驻内存相对于基线的峰值增量，
+- the fail and warning messages of the parse and transfer steps.
+  # 解析和转换阶段的错误和警告信息。
+
+`flag_outliers` then compares a metric across many files.
+# 之后可以用 `flag_outliers` 在多个文件之间比较某项指标。
+"""
+
+import os
+import sys
+import time
+import statistics
+from collections import Counter
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.gp import gp_Trsf, gp_Vec
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeFillet
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.TopTools import TopTools_IndexedMapOfShape
+from OCC.Core.TopExp import topexp, TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_SOLID, TopAbs_FACE, TopAbs_EDGE
+
+from example_2_parallel_step_import import collect_messages
+
+def _reset_peak_rss():
+    """
+    Resets the kernel's peak-RSS counter (Linux); returns False if unsupported.
+    # 重置内核的峰值常驻内存计数器（Linux）；不支持时返回 False。
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+def _peak_rss_mb():
+    """
+    Returns the peak resident memory of this process in MB, or None where it
+    cannot be measured (Windows).
+    # 返回当前进程的峰值常驻内存（MB）；无法测量时（Windows）返回 None。
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # `ru_maxrss` is in bytes on macOS and in kilobytes elsewhere.
+    # # `ru_maxrss` 在macOS上以字节为单位，在其他平台上以千字节为单位。
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+def _rss_delta(baseline):
+    """
+    Returns the growth of the peak RSS since `baseline`, or None if unmeasured.
+    # 返回峰值常驻内存相对于 `baseline` 的增长；无法测量时返回 None。
+    """
+    peak = _peak_rss_mb()
+    return peak - baseline if peak is not None and baseline is not None else None
+
+def _count_subshapes(shape, shape_type):
+    """
+    Returns the number of distinct sub-shapes of a type.
+    # 返回某种类型的不同子形状的数量。
+    """
+    shape_map = TopTools_IndexedMapOfShape()
+    topexp.MapShapes(shape, shape_type, shape_map)
+    return shape_map.Size()
+
+def read_step_with_metrics(path):
+    """
+    Reads and transfers a STEP file and returns `(shape, metrics)`.
+    # 读取并转换一个STEP文件，返回 `(shape, metrics)`。
+
+    `shape` is None when the file could not be read. On Linux the peak RSS
+    counter is reset first, so `peak_rss_delta_mb` is the true high-water
+    mark of this import; elsewhere it only grows when this import exceeds
+    the previous peak of the process. It is None where the peak cannot be
+    measured.
+    # 文件无法读取时 `shape` 为 None。在Linux上会先重置峰值常驻内存计数器，
+    # 因此 `peak_rss_delta_mb` 是本次导入真实的最高水位；在其他平台上，
+    # 只有当本次导入超过进程之前的峰值时它才会增长。无法测量峰值时它为 None。
+    """
+    metrics = {"path": path, "file_size_mb": os.path.getsize(path) / 2**20, "status": "error",
+               "parse_s": 0.0, "transfer_s": 0.0, "nb_roots": 0, "nb_entities": 0, "entities_by_type": {},
+               "nb_shapes": 0, "nb_solids": 0, "nb_faces": 0, "peak_rss_delta_mb": None, "warnings": []}
+    _reset_peak_rss()
+    rss_baseline = _peak_rss_mb()
+
+    step_reader = STEPControl_Reader()
+    start = time.perf_counter()
+    read_status = step_reader.ReadFile(path)
+    metrics["parse_s"] = time.perf_counter() - start
+    metrics["warnings"] = collect_messages(step_reader.WS().ModelCheckList())
+    if read_status != IFSelect_RetDone:
+        metrics["peak_rss_delta_mb"] = _rss_delta(rss_baseline)
+        return None, metrics
+
+    model = step_reader.StepModel()
+    metrics["nb_entities"] = model.NbEntities()
+    entity_types = Counter(model.Value(i).DynamicType().Name() for i in range(1, model.NbEntities() + 1))
+    metrics["entities_by_type"] = dict(entity_types.most_common())
+    metrics["nb_roots"] = step_reader.NbRootsForTransfer()
+
+    start = time.perf_counter()
+    step_reader.TransferRoots()
+    shape = step_reader.OneShape()
+    metrics["transfer_s"] = time.perf_counter() - start
+    metrics["peak_rss_delta_mb"] = _rss_delta(rss_baseline)
+    metrics["warnings"] += collect_messages(step_reader.WS().TransferReader().TransientProcess().CheckList(False))
+
+    metrics["nb_shapes"] = step_reader.NbShapes()
+    if not shape.IsNull():
+        metrics["status"] = "ok"
+        metrics["nb_solids"] = _count_subshapes(shape, TopAbs_SOLID)
+        metrics["nb_faces"] = _count_subshapes(shape, TopAbs_FACE)
+    return shape, metrics
+
+def flag_outliers(records, key, threshold=3.5, min_relative_spread=0.05, min_spread=1e-9):
+    """
+    Returns the records whose `key` is far above the median of all records.
+    # 返回 `key` 远高于所有记录中位数的记录。
+
+    Uses the median absolute deviation, so a few huge files do not hide each
+    other the way they would with a mean and standard deviation. When most
+    values are identical the deviation is zero, so the spread is floored at
+    `min_relative_spread` times the median and at `min_spread`; otherwise
+    any value a hair above the median would be flagged.
+    # 使用中位数绝对偏差，这样少数超大文件不会像使用均值和标准差时那样相互掩盖。
+    # 当大多数值相同时，偏差为零，因此离散度的下限取中位数的 `min_relative_spread` 倍和 `min_spread`；
+    # 否则任何略高于中位数的值都会被标记出来。
+    """
+    values = [record[key] for record in records]
+    if len(values) < 3:
+        return []
+    median = statistics.median(values)
+    deviation = statistics.median(abs(value - median) for value in values)
+    spread = max(1.4826 * deviation, min_relative_spread * abs(median), min_spread)
+    return [record for record in records if (record[key] - median) / spread > threshold]
+
+def run_metrics_example():
+    """
+    Imports a few STEP files and prints their metrics.
+    # 导入几个STEP文件并打印它们的指标。
+    """
+    print("--- STEP Import Instrumentation ---")
+    # --- STEP导入的性能测量 ---
+
+    # 1. Write files of growing complexity: more holes, then fillets.
+    # 1. 写出复杂度逐渐增加的文件：更多的孔，然后加上圆角。
+    def translation(x, y):
+        trsf = gp_Trsf()
+        trsf.SetTranslation(gp_Vec(x, y, 0))
+        return TopLoc_Location(trsf)
+
+    paths = []
+    for nb_holes in (1, 4, 16):
+        shape = BRepPrimAPI_MakeBox(200, 200, 20).Shape()
+        for i in range(nb_holes):
+            hole = BRepPrimAPI_MakeCylinder(4, 20).Shape().Moved(translation(20 + 40 * (i % 4), 20 + 40 * (i // 4)))
+            shape = BRepAlgoAPI_Cut(shape, hole).Shape()
+        if nb_holes == 16:
+            fillet = BRepFilletAPI_MakeFillet(shape)
+            explorer = TopExp_Explorer(shape, TopAbs_EDGE)
+            while explorer.More():
+                fillet.Add(1.0, explorer.Current())
+                explorer.Next()
+            fillet.Build()
+            if fillet.IsDone():
+                shape = fillet.Shape()
+        path = f"metrics_plate_{nb_holes}.step"
+        step_writer = STEPControl_Writer()
+        step_writer.Transfer(shape, STEPControl_AsIs)
+        assert step_writer.Write(path) == IFSelect_RetDone
+        paths.append(path)
+
+    # 2. Import each file with metrics.
+    # 2. 带指标地导入每个文件。
+    records = []
+    for path in paths:
+        shape, metrics = read_step_with_metrics(path)
+        records.append(metrics)
+        peak = f"+{metrics['peak_rss_delta_mb']:.1f} MB" if metrics["peak_rss_delta_mb"] is not None else "n/a"
+        top_types = ", ".join(f"{name}={count}" for name, count in list(metrics["entities_by_type"].items())[:3])
+        print(f"  {path}: {metrics['status']}, parse {metrics['parse_s']:.3f} s, transfer {metrics['transfer_s']:.3f} s, "
+              f"roots={metrics['nb_roots']}, entities={metrics['nb_entities']} ({top_types}), "
+              f"faces={metrics['nb_faces']}, peak {peak}, warnings={len(metrics['warnings'])}")
+        #   {文件}: {状态}, 解析 ... 秒, 转换 ... 秒, 根=..., 实体=..., 面=..., 峰值内存 +... MB（或 n/a）, 警告=...
+
+    # 3. Verification
+    # 3. 验证
+    assert all(record["status"] == "ok" for record in records)
+    assert records[0]["nb_entities"] < records[1]["nb_entities"] < records[2]["nb_entities"]
+    outliers = flag_outliers(records, "transfer_s")
+    print(f"Outliers by transfer time: {[record['path'] for record in outliers]}")
+    # 按转换时间判定的异常文件：...
+    # Identical face counts with one slightly larger file: only a real jump is flagged.
+    # # 面数完全相同，只有一个文件稍大：只有真正的跳变才会被标记。
+    counts = [{"nb_faces": 100} for _ in range(8)] + [{"nb_faces": 101}, {"nb_faces": 400}]
+    assert flag_outliers(counts, "nb_faces") == [{"nb_faces": 400}]
+    print("Verification successful: every import was measured.")
+    # 验证成功：每次导入都完成了测量。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    for path in paths:
+        os.remove(path)
+
+if __name__ == '__main__':
+    run_metrics_example()
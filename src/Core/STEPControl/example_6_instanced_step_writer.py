@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 6: Instanced STEP Writer
+# STEPControl 示例 6：带实例化的STEP写入器
+
+`STEPControl_Writer.Transfer(shape, STEPControl_AsIs)` writes every solid of a
+compound as separate geometry, even when thousands of them are the same bolt.
+`write_instanced_step` writes each unique part **once** and every occurrence
+as a placement of it, through an XCAF assembly:
+# `STEPControl_Writer.Transfer(shape, STEPControl_AsIs)` 会把组合体中的每个实体都写成独立的几何，
+# 即使其中成千上万个都是同一个螺栓。`write_instanced_step` 通过XCAF装配体，
+# 把每个唯一零件只写**一次**，并把每次出现写成对它的一次放置：
+
+1.  Solids that share a `TShape` are grouped with `find_instances` from
+    `occt_helpers.instances`, as in the GLB exporter. Shells and faces that
+    sit next to the solids are parts of their own.
+    # 1. 与GLB导出器一样，用 `occt_helpers.instances` 中的 `find_instances` 对共享 `TShape` 的实体进行分组。
+    #    与实体并列的壳和面各自作为独立的零件。
+2.  Optionally, groups whose location-free shapes serialize to the same
+    `BinTools` bytes are merged too, which catches copies that were built
+    independently instead of being placed with `Located`.
+    # 2. 还可以选择把无位置形状序列化后 `BinTools` 字节完全相同的组也合并，
+    #    这样可以发现那些独立构建、而不是用 `Located` 放置的副本。
+3.  Each unique part becomes one product in the XCAF document and each
+    occurrence a component with its location; `STEPCAFControl_Writer` writes one product
+    definition per part plus the placements.
+    # 3. 每个唯一零件成为XCAF文档中的一个产品，每次出现成为带有其位置的一个组件；
+    #    `STEPCAFControl_Writer` 为每个零件写出一个产品定义，外加各个放置。
+"""
+
+import os
+import time
+import hashlib
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pln
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.STEPCAFControl import STEPCAFControl_Writer
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.TDocStd import TDocStd_Document
+from OCC.Core.TDataStd import TDataStd_Name
+from OCC.Core.XCAFDoc import XCAFDoc_DocumentTool
+
+from occt_helpers.blobs import shape_to_bytes
+from occt_helpers.instances import find_instances, create_bolt_assembly
+
+def find_unique_parts(shape, by_content=True):
+    """
+    Returns `(parts, placements)` with shared and, optionally, identical parts merged.
+    # 返回 `(parts, placements)`，其中共享的零件以及（可选的）内容相同的零件都已合并。
+
+    `placements` holds one `(part_index, TopLoc_Location)` pair per occurrence.
+    # `placements` 中每次出现对应一个 `(零件编号, TopLoc_Location)` 对。
+    """
+    parts, placements = find_instances(shape)
+    if not by_content:
+        return parts, placements
+
+    unique_parts = []
+    first_by_digest = {}
+    remap = []
+    for part in parts:
+        digest = hashlib.sha256(shape_to_bytes(part)).digest()
+        if digest not in first_by_digest:
+            first_by_digest[digest] = len(unique_parts)
+            unique_parts.append(part)
+        remap.append(first_by_digest[digest])
+    return unique_parts, [(remap[index], location) for index, location in placements]
+
+def write_instanced_step(path, shape, by_content=True, part_name="part", assembly_name="assembly"):
+    """
+    Writes `shape` as a STEP assembly with one product per unique part.
+    # 将 `shape` 写出为STEP装配体，每个唯一零件一个产品。
+
+    Returns a report with the number of parts and instances, the write time
+    and the file size.
+    # 返回一份报告，包含零件数和实例数、写出耗时以及文件大小。
+    """
+    start = time.perf_counter()
+    parts, placements = find_unique_parts(shape, by_content)
+
+    doc = TDocStd_Document("pythonocc-doc-instanced-step")
+    shape_tool = XCAFDoc_DocumentTool.ShapeTool(doc.Main())
+    part_labels = []
+    for i, part in enumerate(parts):
+        label = shape_tool.AddShape(part, False)
+        TDataStd_Name.Set(label, f"{part_name}_{i}")
+        part_labels.append(label)
+    assembly_label = shape_tool.NewShape()
+    TDataStd_Name.Set(assembly_label, assembly_name)
+    for index, location in placements:
+        shape_tool.AddComponent(assembly_label, part_labels[index], location)
+    shape_tool.UpdateAssemblies()
+
+    caf_writer = STEPCAFControl_Writer()
+    caf_writer.SetNameMode(True)
+    if not caf_writer.Transfer(doc, STEPControl_AsIs):
+        raise RuntimeError("STEPCAFControl_Writer failed to transfer the assembly")
+    if caf_writer.Write(path) != IFSelect_RetDone:
+        raise RuntimeError(f"could not write {path}")
+    return {
+        "nb_parts": len(parts),
+        "nb_instances": len(placements),
+        "write_s": time.perf_counter() - start,
+        "file_size": os.path.getsize(path),
+    }
+
+def write_flat_step(path, shape):
+    """
+    Writes `shape` with `STEPControl_AsIs`, the way the other examples do.
+    # 像其他示例一样，用 `STEPControl_AsIs` 写出 `shape`。
+    """
+    start = time.perf_counter()
+    step_writer = STEPControl_Writer()
+    step_writer.Transfer(shape, STEPControl_AsIs)
+    if step_writer.Write(path) != IFSelect_RetDone:
+        raise RuntimeError(f"could not write {path}")
+    return {"write_s": time.perf_counter() - start, "file_size": os.path.getsize(path)}
+
+def run_instanced_writer_example():
+    """
+    Writes a bolt assembly flat and instanced and compares the two files.
+    # 分别以平铺和实例化的方式写出一个螺栓装配体，并比较两个文件。
+    """
+    print("--- Instanced STEP Writer ---")
+    # --- 带实例化的STEP写入器 ---
+
+    # 1. 100 bolts sharing one TShape, 10 bolts built independently and a loose cover plate face.
+    # 1. 100个共享同一个TShape的螺栓、10个独立构建的螺栓，以及一个单独的盖板面。
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    builder.Add(compound, create_bolt_assembly(10, 10))
+    for i in range(10):
+        trsf = gp_Trsf()
+        trsf.SetTranslation(gp_Vec(i * 15.0, -30.0, 0.0))
+        builder.Add(compound, create_bolt_assembly(1, 1).Located(TopLoc_Location(trsf)))
+    builder.Add(compound, BRepBuilderAPI_MakeFace(gp_Pln(), 0.0, 150.0, 0.0, 150.0).Face())
+
+    # 2. Write it flat, instanced by TShape only, and instanced by content.
+    # 2. 分别以平铺、仅按TShape实例化、以及按内容实例化的方式写出。
+    flat = write_flat_step("bolts_flat.step", compound)
+    by_tshape = write_instanced_step("bolts_by_tshape.step", compound, by_content=False, part_name="bolt")
+    by_content = write_instanced_step("bolts_by_content.step", compound, part_name="bolt")
+    print(f"  flat:              {flat['file_size']:>10} bytes, {flat['write_s']:.3f} s")
+    for label, report in (("instanced (TShape)", by_tshape), ("instanced (content)", by_content)):
+        print(f"  {label + ':':<19}{report['file_size']:>10} bytes, {report['write_s']:.3f} s, "
+              f"{report['nb_parts']} part(s) for {report['nb_instances']} instances")
+    print(f"Saved {flat['file_size'] - by_content['file_size']} bytes "
+          f"({1 - by_content['file_size'] / flat['file_size']:.0%}) and "
+          f"{flat['write_s'] - by_content['write_s']:.3f} s.")
+    # 节省了 ... 字节（...%）和 ... 秒。
+
+    # 3. Verification
+    # 3. 验证
+    assert by_tshape["nb_parts"] == 12 and by_content["nb_parts"] == 2
+    assert by_content["nb_instances"] == 111
+    assert by_content["file_size"] < flat["file_size"]
+    print("Verification successful: the bolt geometry was written once and the plate was kept.")
+    # 验证成功：螺栓的几何只写出了一次，盖板也被保留了。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    for path in ("bolts_flat.step", "bolts_by_tshape.step", "bolts_by_content.step"):
+        os.remove(path)
+
+if __name__ == '__main__':
+    run_instanced_writer_example()
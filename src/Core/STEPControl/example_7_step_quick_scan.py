@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 7: Header-only STEP Quick Scan
+# STEPControl 示例 7：仅扫描头部的STEP快速检查
+
+`STEPControl_Reader.ReadFile` builds the whole `StepData` model in memory
+before anything can be asked about the file. To triage files before queuing
+them for a full import, `scan_step_file` streams the text once instead:
+# `STEPControl_Reader.ReadFile` 会先在内存中构建完整的 `StepData` 模型，然后才能查询文件的任何信息。
+# 为了在排队进行完整导入之前对文件进行分诊，`scan_step_file` 改为对文本进行一次流式扫描：
+
+- the HEADER section gives the schema, file name, originating system and
+  timestamp,
+  # HEADER段给出模式、文件名、原始系统和时间戳，
+- every `;`-terminated DATA statement (`#12=TYPE(...);`) is counted by type,
+  without parsing its arguments, however it is wrapped across lines,
+  # DATA段中每一条以 `;` 结尾的语句（`#12=TYPE(...);`）都按类型计数，而不解析其参数，无论它如何跨行折行，
+- product names and length units are picked from the few statements that
+  define them.
+  # 产品名称和长度单位从定义它们的少数几条语句中提取。
+
+No OCCT objects are created, so the scan costs about as much as reading the
+file from disk.
+# 不会创建任何OCCT对象，因此扫描的开销大约与从磁盘读取文件相当。
+"""
+
+import os
+import re
+import time
+from collections import Counter
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.IFSelect import IFSelect_RetDone
+
+# Statements are anchored on the `;` that ends the previous one, so instances
+# wrapped across lines, such as `#5=(\n LENGTH_UNIT() ...)`, are still found.
+# # 语句以前一条语句结尾的 `;` 作为锚点，因此跨行折行的实例（例如 `#5=(\n LENGTH_UNIT() ...)`）也能被找到。
+ENTITY_STATEMENT = re.compile(rb";\s*#\d+\s*=\s*\(?\s*([A-Za-z_]\w*)")
+PRODUCT_STATEMENT = re.compile(rb";\s*#\d+\s*=\s*PRODUCT\s*\(\s*'((?:[^']|'')*)'\s*,\s*'((?:[^']|'')*)'")
+STATEMENT_ID = re.compile(rb"#(\d+)")
+SI_UNIT = re.compile(rb"SI_UNIT\s*\(\s*(\.\w+\.|\$)\s*,\s*\.(\w+)\.")
+CONVERSION_BASED_UNIT = re.compile(rb"CONVERSION_BASED_UNIT\s*\(\s*'((?:[^']|'')*)'\s*,\s*#(\d+)")
+UNIT_CONTEXT = re.compile(rb"GLOBAL_UNIT_ASSIGNED_CONTEXT\s*\(\s*\(([^)]*)\)")
+QUOTED = re.compile(r"'((?:[^']|'')*)'")
+
+# Entity types that indicate how expensive the full transfer will be.
+# # 能反映完整转换开销的实体类型。
+COMPLEXITY_TYPES = {
+    "nb_solids": ("MANIFOLD_SOLID_BREP", "BREP_WITH_VOIDS"),
+    "nb_faces": ("ADVANCED_FACE", "FACE_SURFACE"),
+    "nb_bspline_surfaces": ("B_SPLINE_SURFACE_WITH_KNOTS", "B_SPLINE_SURFACE"),
+    "nb_assembly_occurrences": ("NEXT_ASSEMBLY_USAGE_OCCURRENCE",),
+}
+
+def _unquote(text):
+    """
+    Undoes the `''` escaping of STEP strings.
+    # 还原STEP字符串中 `''` 形式的转义。
+    """
+    return text.replace("''", "'")
+
+def _statements_with(text, keyword):
+    """
+    Yields the `;`-terminated statements of `text` that contain `keyword`.
+    # 逐个生成 `text` 中包含 `keyword` 的、以 `;` 结尾的语句。
+    """
+    end = 0
+    for match in re.finditer(re.escape(keyword), text):
+        if match.start() < end:
+            continue
+        begin = text.rfind(b";", 0, match.start()) + 1
+        end = text.find(b";", match.end())
+        end = len(text) if end < 0 else end
+        yield text[begin:end]
+
+def _length_units(units, conversions, measures, assigned):
+    """
+    Returns the names of the length units the file works in.
+    # 返回文件所使用的长度单位名称。
+
+    The units assigned by `GLOBAL_UNIT_ASSIGNED_CONTEXT` win. Without one,
+    every length unit is reported except the SI units that only serve as the
+    base of a `CONVERSION_BASED_UNIT` (millimetres behind an inch).
+    # 以 `GLOBAL_UNIT_ASSIGNED_CONTEXT` 指定的单位为准。如果没有该上下文，则报告所有长度单位，
+    # 但仅作为 `CONVERSION_BASED_UNIT` 基准的SI单位除外（例如英寸背后的毫米）。
+    """
+    if assigned & set(units):
+        return sorted({units[number] for number in assigned if number in units})
+    bases = {measures.get(measure) for measure in conversions.values()}
+    return sorted({name for number, name in units.items() if number not in bases})
+
+def parse_header(header_text):
+    """
+    Extracts the schema and `FILE_NAME` fields from the text of a HEADER section.
+    # 从HEADER段的文本中提取模式和 `FILE_NAME` 字段。
+    """
+    header = {"schema": [], "file_name": "", "timestamp": "", "originating_system": "", "preprocessor": ""}
+    statements = {}
+    for statement in header_text.split(";"):
+        match = re.match(r"\s*([A-Z_]+)\s*\(", statement)
+        if match:
+            statements[match.group(1)] = statement[match.end():]
+    if "FILE_SCHEMA" in statements:
+        header["schema"] = [_unquote(value) for value in QUOTED.findall(statements["FILE_SCHEMA"])]
+    if "FILE_NAME" in statements:
+        # FILE_NAME(name, time_stamp, (author), (organization), preprocessor, originating_system, authorization)
+        fields = re.sub(r"\([^()]*\)", "()", statements["FILE_NAME"]).split(",")
+        scalars = [QUOTED.search(field) for field in fields]
+        scalars = [_unquote(match.group(1)) if match else "" for match in scalars] + [""] * 6
+        header["file_name"], header["timestamp"] = scalars[0], scalars[1]
+        header["preprocessor"], header["originating_system"] = scalars[4], scalars[5]
+    return header
+
+def scan_step_file(path, block_size=1 << 24):
+    """
+    Streams a STEP file once and returns a triage summary.
+    # 对STEP文件进行一次流式扫描，并返回一份分诊摘要。
+
+    The summary holds the header fields, `entities_by_type`, `nb_entities`,
+    `product_names`, `length_units` and the counts of `COMPLEXITY_TYPES`.
+    Complex instances (`#5=(A() B() ...)`) are counted under their first type.
+    The scan assumes, like most writers, that `;` does not appear inside
+    strings.
+    # 摘要包含头部字段、`entities_by_type`、`nb_entities`、`product_names`、`length_units`
+    # 以及 `COMPLEXITY_TYPES` 中各项的计数。复合实例（`#5=(A() B() ...)`）按其第一个类型计数。
+    # 与大多数写出程序一样，扫描假定字符串中不会出现 `;`。
+    """
+    start = time.perf_counter()
+    counts = Counter()
+    product_names = []
+    units, conversions, measures, assigned = {}, {}, {}, set()
+    header_text = b""
+    in_data = False
+    carry = b""
+
+    with open(path, "rb") as step_file:
+        while True:
+            block = step_file.read(block_size)
+            text = carry + block
+            # Cut after the last `;` and keep that `;` in the carry too, so the
+            # statement that continues into the next block still follows a `;`.
+            # # 在最后一个 `;` 之后切开，并把这个 `;` 也保留在留给下一块的文本中，
+            # # 这样延续到下一块的语句前面仍然有一个 `;`。
+            cut = text.rfind(b";") if block else len(text) - 1
+            text, carry = text[:cut + 1], text[cut:]
+
+            if not in_data:
+                data_start = re.search(rb";\s*DATA\s*;", text)
+                if data_start is None:
+                    header_text += text
+                    text = b""
+                else:
+                    header_text += text[:data_start.start() + 1]
+                    text = text[data_start.end() - 1:]
+                    in_data = True
+
+            counts.update(ENTITY_STATEMENT.findall(text))
+            if b"PRODUCT" in text:
+                product_names += [_unquote(match.group(2).decode("utf-8", "replace"))
+                                  for match in PRODUCT_STATEMENT.finditer(text)]
+            if b"LENGTH_UNIT" in text:
+                for statement in _statements_with(text, b"LENGTH_UNIT"):
+                    number = STATEMENT_ID.search(statement)
+                    si_unit = SI_UNIT.search(statement)
+                    conversion = CONVERSION_BASED_UNIT.search(statement)
+                    if number is None:
+                        continue
+                    if conversion:
+                        units[number.group(1)] = _unquote(conversion.group(1).decode("utf-8", "replace")).upper()
+                        conversions[number.group(1)] = conversion.group(2)
+                    elif si_unit:
+                        prefix = si_unit.group(1).strip(b".").decode() if si_unit.group(1) != b"$" else ""
+                        units[number.group(1)] = (prefix + si_unit.group(2).decode()).upper()
+            if b"LENGTH_MEASURE_WITH_UNIT" in text:
+                for statement in _statements_with(text, b"LENGTH_MEASURE_WITH_UNIT"):
+                    references = STATEMENT_ID.findall(statement)
+                    if len(references) >= 2:
+                        measures[references[0]] = references[1]
+            if b"GLOBAL_UNIT_ASSIGNED_CONTEXT" in text:
+                for match in UNIT_CONTEXT.finditer(text):
+                    assigned.update(STATEMENT_ID.findall(match.group(1)))
+            if not block:
+                break
+
+    counts = Counter({entity_type.decode("ascii").upper(): count for entity_type, count in counts.items()})
+    header_section = re.search(rb"HEADER\s*;(.*?)ENDSEC\s*;", header_text, re.DOTALL)
+    summary = parse_header(header_section.group(1).decode("utf-8", "replace") if header_section else "")
+    summary.update({
+        "path": path,
+        "file_size_mb": os.path.getsize(path) / 2**20,
+        "nb_entities": sum(counts.values()),
+        "entities_by_type": dict(counts.most_common()),
+        "product_names": product_names,
+        "length_units": _length_units(units, conversions, measures, assigned),
+    })
+    for key, types in COMPLEXITY_TYPES.items():
+        summary[key] = sum(counts[entity_type] for entity_type in types)
+    summary["scan_s"] = time.perf_counter() - start
+    return summary
+
+def run_quick_scan_example():
+    """
+    Scans a STEP file and compares the result with a full `ReadFile`.
+    # 扫描一个STEP文件，并将结果与完整的 `ReadFile` 进行比较。
+    """
+    print("--- Header-only STEP Quick Scan ---")
+    # --- 仅扫描头部的STEP快速检查 ---
+
+    # 1. Write a STEP file.
+    # 1. 写出一个STEP文件。
+    box = BRepPrimAPI_MakeBox(100, 80, 40).Shape()
+    cyl = BRepPrimAPI_MakeCylinder(20, 40).Shape()
+    step_file_path = "quick_scan_model.step"
+    step_writer = STEPControl_Writer()
+    step_writer.Transfer(BRepAlgoAPI_Cut(box, cyl).Shape(), STEPControl_AsIs)
+    assert step_writer.Write(step_file_path) == IFSelect_RetDone
+
+    # 2. Quick scan.
+    # 2. 快速扫描。
+    summary = scan_step_file(step_file_path)
+    print(f"Scanned in {summary['scan_s'] * 1000:.2f} ms:")
+    # 扫描用时 ... 毫秒：
+    for key in ("schema", "originating_system", "product_names", "length_units",
+                "nb_entities", "nb_solids", "nb_faces", "nb_bspline_surfaces"):
+        print(f"  {key}: {summary[key]}")
+
+    # 3. Full parse for comparison.
+    # 3. 完整解析以作比较。
+    start = time.perf_counter()
+    step_reader = STEPControl_Reader()
+    assert step_reader.ReadFile(step_file_path) == IFSelect_RetDone
+    nb_entities = step_reader.StepModel().NbEntities()
+    print(f"ReadFile parsed {nb_entities} entities in {(time.perf_counter() - start) * 1000:.2f} ms.")
+    # ReadFile 用时 ... 毫秒解析了 ... 个实体。
+
+    # 4. Verification
+    # 4. 验证
+    assert summary["nb_entities"] == nb_entities
+    assert summary["nb_solids"] == 1 and summary["length_units"] == ["MILLIMETRE"]
+    print("Verification successful: the scan found every entity of the model.")
+    # 验证成功：扫描找到了模型中的每一个实体。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(step_file_path):
+        os.remove(step_file_path)
+
+if __name__ == '__main__':
+    run_quick_scan_example()
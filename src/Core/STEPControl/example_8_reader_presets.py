@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+
+"""
+STEPControl Example 8: STEP Reader Precision and Healing Presets
+# STEPControl 示例 8：STEP读取器的精度与修复预设
+
+`STEPControl_Reader` is configured through global `Interface_Static`
+parameters, and its defaults run shape healing during the transfer. That is
+wasted time for trusted internal files and not strict enough for unknown
+supplier files. This file bundles the relevant parameters into named presets:
+# `STEPControl_Reader` 通过全局的 `Interface_Static` 参数进行配置，其默认设置会在转换期间执行形状修复。
+# 对于可信的内部文件，这是在浪费时间；而对于来源不明的供应商文件，又不够严格。本文件把相关参数打包为命名预设：
+
+- `fast_trusted`: file precision, 2D pcurves taken from the file, every
+  `ShapeFix` mode of the ShapeProcess sequence switched off and no extra
+  SameParameter pass,
+  # `fast_trusted`：使用文件中的精度，直接采用文件中的2D参数曲线，关闭 ShapeProcess 序列中的每个 `ShapeFix` 模式，
+  # 也不额外执行 SameParameter，
+- `default`: the OCCT defaults, captured from `Interface_Static` when this
+  module is imported,
+  # `default`：OCCT 的默认设置，在导入本模块时从 `Interface_Static` 中读取，
+- `paranoid`: tolerances capped by a forced maximum precision, SameParameter
+  after transfer, then `ShapeFix_Shape` and a `BRepCheck_Analyzer` check.
+  # `paranoid`：用强制的最大精度限制公差，转换后执行 SameParameter，然后执行 `ShapeFix_Shape` 和 `BRepCheck_Analyzer` 检查。
+
+The parameters are process-wide, so `reader_preset` restores the previous
+values when it exits. Parameters unknown to the installed OCCT version are
+skipped and reported.
+# 这些参数作用于整个进程，因此 `reader_preset` 在退出时会恢复之前的值。当前安装的OCCT版本不认识的参数会被跳过并报告出来。
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Pnt, gp_Dir, gp_Ax2
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeCylinder
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut
+from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeFillet
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopAbs import TopAbs_EDGE
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.STEPControl import STEPControl_Reader, STEPControl_Writer, STEPControl_AsIs
+from OCC.Core.IFSelect import IFSelect_RetDone
+from OCC.Core.Interface import Interface_Static
+from OCC.Core.DE import DE_ShapeFixParameters
+from OCC.Core.ShapeFix import ShapeFix_Shape
+from OCC.Core.BRepCheck import BRepCheck_Analyzer
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+
+from example_3_step_import_cache import static_settings, static_value
+
+# `ShapeFix` modes of the "FromSTEP" sequence: -1 lets the fixer decide, 0 skips the fix, 1 forces it.
+# # "FromSTEP" 序列中的 `ShapeFix` 模式：-1 由修复器自行决定，0 跳过该修复，1 强制执行。
+SHAPE_FIX_OFF = 0
+SHAPE_FIX_MODES = (
+    "FixFreeShellMode", "FixFreeFaceMode", "FixFreeWireMode", "FixSameParameterMode", "FixSolidMode",
+    "FixShellOrientationMode", "FixShellMode", "FixFaceOrientationMode", "FixFaceMode", "FixWireMode",
+    "FixOrientationMode", "FixAddNaturalBoundMode", "FixMissingSeamMode", "FixSmallAreaWireMode",
+    "FixIntersectingWiresMode", "FixLoopWiresMode", "FixSplitFaceMode", "FixReorderMode", "FixSmallMode",
+    "FixConnectedMode", "FixEdgeCurvesMode", "FixDegeneratedMode", "FixLackingMode", "FixSelfIntersectionMode",
+    "FixVertexToleranceMode",
+)
+
+READER_PRESETS = {
+    "fast_trusted": {
+        "statics": {
+            "read.precision.mode": 0,
+            "read.maxprecision.mode": 0,
+            "read.maxprecision.val": 1.0,
+            "read.stdsameparameter.mode": 0,
+            "read.surfacecurve.mode": 2,
+            "read.step.product.mode": 1,
+        },
+        "shape_fix": {mode: SHAPE_FIX_OFF for mode in SHAPE_FIX_MODES},
+        "heal_after_transfer": False,
+        "validate": False,
+    },
+    "default": {
+        # Filled in below from the values in effect at import time.
+        # # 下面会用导入时生效的值填充。
+        "statics": {},
+        "shape_fix": {},
+        "heal_after_transfer": False,
+        "validate": False,
+    },
+    "paranoid": {
+        "statics": {
+            "read.precision.mode": 0,
+            "read.maxprecision.mode": 1,
+            "read.maxprecision.val": 0.1,
+            "read.stdsameparameter.mode": 1,
+            "read.surfacecurve.mode": 0,
+            "read.step.product.mode": 1,
+            "read.step.sequence": "FromSTEP",
+        },
+        "shape_fix": {},
+        "heal_after_transfer": True,
+        "validate": True,
+    },
+}
+
+def capture_static_defaults():
+    """
+    Returns the current values of every static used by a preset, plus `read.precision.val`.
+    # 返回任一预设所用的每个静态参数以及 `read.precision.val` 的当前值。
+
+    Statics unknown to the installed OCCT version are left out.
+    # 当前安装的OCCT版本不认识的静态参数会被略去。
+    """
+    names = {"read.precision.val": 0.0}
+    for preset in READER_PRESETS.values():
+        names.update(preset["statics"])
+    return {name: static_value(name, like) for name, like in names.items() if Interface_Static.IsPresent(name)}
+
+# Captured before any preset is applied, so "default" tracks the installed
+# OCCT version instead of a copy of its values.
+# # 在应用任何预设之前读取，这样 "default" 跟随当前安装的OCCT版本，而不是其取值的一份副本。
+OCCT_DEFAULTS = capture_static_defaults()
+READER_PRESETS["default"]["statics"] = dict(OCCT_DEFAULTS)
+
+@contextmanager
+def reader_preset(name):
+    """
+    Applies a preset for the duration of a `with` block.
+    # 在 `with` 代码块期间应用一个预设。
+
+    Yields the preset dict, with the names of skipped parameters under
+    `"ignored"`.
+    # 产出预设字典，其中被跳过的参数名称位于 `"ignored"` 下。
+    """
+    preset = dict(READER_PRESETS[name])
+    statics = {key: value for key, value in preset["statics"].items() if Interface_Static.IsPresent(key)}
+    preset["ignored"] = sorted(set(preset["statics"]) - set(statics))
+    with static_settings(statics):
+        yield preset
+
+def apply_shape_fix_modes(step_reader, modes):
+    """
+    Sets `ShapeFix` modes on one reader and returns the names it does not know.
+    # 为一个读取器设置 `ShapeFix` 模式，返回它不认识的模式名称。
+
+    `modes` maps `DE_ShapeFixParameters` fields to -1, 0 or 1. Unlike the
+    statics, the modes belong to the reader and need no restoring.
+    # `modes` 将 `DE_ShapeFixParameters` 的字段映射为 -1、0 或 1。与静态参数不同，这些模式只属于该读取器，无需恢复。
+    """
+    parameters = DE_ShapeFixParameters()
+    unknown = sorted(mode for mode in modes if not hasattr(parameters, mode))
+    for mode, value in modes.items():
+        if mode not in unknown:
+            setattr(parameters, mode, value)
+    step_reader.SetShapeFixParameters(parameters)
+    return unknown
+
+def read_step_with_preset(path, preset_name="default"):
+    """
+    Reads a STEP file with a preset and returns `(shape, report)`.
+    # 使用某个预设读取STEP文件，返回 `(shape, report)`。
+
+    The report holds the parse, transfer and healing times and, when the
+    preset validates, whether the shape passed `BRepCheck_Analyzer`.
+    # 报告包含解析、转换和修复的耗时；如果预设要求验证，还会包含形状是否通过了 `BRepCheck_Analyzer`。
+    """
+    report = {"preset": preset_name, "parse_s": 0.0, "transfer_s": 0.0, "heal_s": 0.0, "valid": None}
+    with reader_preset(preset_name) as preset:
+        step_reader = STEPControl_Reader()
+        report["ignored"] = preset["ignored"]
+        if preset["shape_fix"]:
+            report["ignored"] = report["ignored"] + apply_shape_fix_modes(step_reader, preset["shape_fix"])
+        start = time.perf_counter()
+        if step_reader.ReadFile(path) != IFSelect_RetDone:
+            raise RuntimeError(f"could not read STEP file {path}")
+        report["parse_s"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        step_reader.TransferRoots()
+        shape = step_reader.OneShape()
+        report["transfer_s"] = time.perf_counter() - start
+
+    if preset["heal_after_transfer"]:
+        start = time.perf_counter()
+        fixer = ShapeFix_Shape(shape)
+        fixer.Perform()
+        shape = fixer.Shape()
+        report["heal_s"] = time.perf_counter() - start
+    if preset["validate"]:
+        report["valid"] = BRepCheck_Analyzer(shape).IsValid()
+    return shape, report
+
+def create_bracket():
+    """
+    Creates an L-bracket like the one of the phase 4 analysis: two plates, a hole and an inner fillet.
+    # 创建一个与第四阶段分析中相同的L型支架：两块板、一个孔和一个内侧圆角。
+
+    Raises `RuntimeError` if the inner edge is not found or cannot be filleted.
+    # 如果找不到内侧边或无法对其倒圆角，则抛出 `RuntimeError`。
+    """
+    base_plate = BRepPrimAPI_MakeBox(100, 80, 15).Shape()
+    vertical_plate = BRepPrimAPI_MakeBox(gp_Pnt(0, 0, 15), 15, 80, 85).Shape()
+    bracket = BRepAlgoAPI_Fuse(base_plate, vertical_plate).Shape()
+    hole = BRepPrimAPI_MakeCylinder(gp_Ax2(gp_Pnt(0, 40, 60), gp_Dir(1, 0, 0)), 25, 15).Shape()
+    bracket = BRepAlgoAPI_Cut(bracket, hole).Shape()
+
+    # Fillet the inner corner, the edge along Y at x = z = 15.
+    # # 对内侧拐角（位于 x = z = 15、沿 Y 方向的边）倒圆角。
+    fillet = BRepFilletAPI_MakeFillet(bracket)
+    explorer = TopExp_Explorer(bracket, TopAbs_EDGE)
+    while explorer.More():
+        curve = BRepAdaptor_Curve(explorer.Current())
+        first, last = curve.Value(curve.FirstParameter()), curve.Value(curve.LastParameter())
+        if all(abs(coord - 15.0) < 1e-7 for coord in (first.X(), last.X(), first.Z(), last.Z())):
+            fillet.Add(10.0, explorer.Current())
+            break
+        explorer.Next()
+    if fillet.NbContours() == 0:
+        raise RuntimeError("inner bracket edge not found")
+    fillet.Build()
+    if not fillet.IsDone():
+        raise RuntimeError("could not fillet the inner bracket edge")
+    return fillet.Shape()
+
+def write_step_file(path, shape):
+    """
+    Writes `shape` to a STEP file.
+    # 将 `shape` 写入STEP文件。
+    """
+    step_writer = STEPControl_Writer()
+    step_writer.Transfer(shape, STEPControl_AsIs)
+    assert step_writer.Write(path) == IFSelect_RetDone
+
+def create_bracket_rack_step_file(path, count=25):
+    """
+    Writes `count` copies of the bracket side by side into one STEP file.
+    # 将 `count` 个支架的副本并排写入一个STEP文件。
+    """
+    bracket = create_bracket()
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for i in range(count):
+        trsf = gp_Trsf()
+        trsf.SetTranslation(gp_Vec(120.0 * i, 0.0, 0.0))
+        builder.Add(compound, bracket.Moved(TopLoc_Location(trsf)))
+    write_step_file(path, compound)
+
+def run_presets_example():
+    """
+    Benchmarks the three presets on the L-bracket.
+    # 在L型支架上对三个预设进行基准测试。
+    """
+    print("--- STEP Reader Presets ---")
+    # --- STEP读取器预设 ---
+
+    # 1. A single bracket and a rack of 25 brackets.
+    # 1. 单个支架，以及由25个支架组成的支架组。
+    single_path, rack_path = "preset_bracket.step", "preset_bracket_rack.step"
+    write_step_file(single_path, create_bracket())
+    create_bracket_rack_step_file(rack_path)
+
+    # 2. Read each file with each preset, best of three.
+    # 2. 使用每个预设读取每个文件，取三次中的最好成绩。
+    volumes = {}
+    for path in (single_path, rack_path):
+        print(f"\n{path} ({os.path.getsize(path)} bytes):")
+        for preset_name in READER_PRESETS:
+            reports = []
+            for _ in range(3):
+                shape, report = read_step_with_preset(path, preset_name)
+                reports.append(report)
+            best = min(reports, key=lambda r: r["parse_s"] + r["transfer_s"] + r["heal_s"])
+            props = GProp_GProps()
+            brepgprop.VolumeProperties(shape, props)
+            volumes[path, preset_name] = props.Mass()
+            print(f"  {preset_name:<13} parse {best['parse_s']:.3f} s, transfer {best['transfer_s']:.3f} s, "
+                  f"heal {best['heal_s']:.3f} s, valid={best['valid']}, volume={props.Mass():.2f}"
+                  + (f", ignored={best['ignored']}" if best["ignored"] else ""))
+            #   {预设} 解析 ... 秒, 转换 ... 秒, 修复 ... 秒, 有效=..., 体积=...
+
+    # 3. Verification: every preset reads the same geometry.
+    # 3. 验证：每个预设读到的几何都相同。
+    for (path, preset_name), volume in volumes.items():
+        assert abs(volume - volumes[path, "default"]) <= 1e-6 * volumes[path, "default"]
+    assert capture_static_defaults() == OCCT_DEFAULTS
+    print("\nVerification successful: all presets agree and the global settings were restored.")
+    # 验证成功：所有预设的结果一致，并且全局设置已恢复。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    for path in (single_path, rack_path):
+        os.remove(path)
+
+if __name__ == '__main__':
+    run_presets_example()
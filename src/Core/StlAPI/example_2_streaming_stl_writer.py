@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 2: Streaming Binary STL Writer from NumPy Arrays
+# StlAPI 示例 2：基于 NumPy 数组的流式二进制STL写入器
+
+`StlAPI_Writer.Write` (see `example.py`) needs a meshed `TopoDS_Shape` and
+writes the whole file in one call. This file writes binary STL directly from
+vertex/triangle arrays, or from an iterator of mesh chunks such as
+`iter_mesh_chunks` from `occt_helpers.mesh`:
+# `StlAPI_Writer.Write`（见 `example.py`）需要一个已网格化的 `TopoDS_Shape`，并在一次调用中写出整个文件。
+# 本文件直接从顶点/三角形数组，或从网格数据块迭代器（例如 `occt_helpers.mesh` 中的 `iter_mesh_chunks`）写出二进制STL：
+
+- facets are packed into a NumPy structured array matching the 50-byte STL
+  record and written in large blocks,
+  # 三角面片被打包进与50字节STL记录对应的 NumPy 结构化数组，并按大块写出，
+- facet normals are computed for a whole block at once,
+  # 面片法向一次为整块数据计算，
+- the triangle count in the header is patched when the stream ends, so the
+  total does not need to be known in advance.
+  # 文件头中的三角形数量在数据流结束时回填，因此无需预先知道总数。
+"""
+
+import os
+import struct
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.StlAPI import StlAPI_Reader
+from OCC.Core.TopoDS import TopoDS_Shape
+
+from occt_helpers.mesh import iter_mesh_chunks
+
+# One binary STL facet: normal, three corners and the attribute byte count.
+# # 一个二进制STL面片：法向、三个角点以及属性字节数。
+STL_FACET_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("v0", "<f4", (3,)),
+    ("v1", "<f4", (3,)),
+    ("v2", "<f4", (3,)),
+    ("attr", "<u2"),
+])
+STL_HEADER_SIZE = 80
+
+def facet_normals(corners):
+    """
+    Computes unit normals for an (M, 3, 3) array of triangle corners.
+    # 为 (M, 3, 3) 的三角形角点数组计算单位法向。
+
+    Degenerate triangles get a zero normal instead of NaN.
+    # 退化三角形得到零法向，而不是 NaN。
+    """
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    return normals
+
+def _iter_meshes(meshes):
+    """
+    Normalizes the writer input to an iterator of `(vertices, triangles)`.
+    # 将写入器的输入统一为 `(vertices, triangles)` 的迭代器。
+    """
+    if isinstance(meshes, dict):
+        meshes = [meshes]
+    elif isinstance(meshes, tuple) and len(meshes) == 2 and isinstance(meshes[0], np.ndarray):
+        meshes = [meshes]
+    for mesh in meshes:
+        if isinstance(mesh, dict):
+            yield mesh["vertices"], mesh["triangles"]
+        else:
+            yield mesh
+
+def write_binary_stl(path, meshes, header=b"pyocc streaming STL writer", block_triangles=1 << 20):
+    """
+    Writes binary STL from arrays or from an iterator of mesh chunks.
+    # 从数组或网格数据块迭代器写出二进制STL。
+
+    `meshes` is a `(vertices, triangles)` tuple, a dict with those keys, or an
+    iterable of either. At most `block_triangles` facets are held in memory
+    at a time. Returns the number of triangles written.
+    # `meshes` 可以是 `(vertices, triangles)` 元组、包含这两个键的字典，或二者之一的可迭代对象。
+    # 内存中同时最多只保留 `block_triangles` 个面片。返回写入的三角形数量。
+    """
+    nb_triangles = 0
+    with open(path, "wb") as stl_file:
+        stl_file.write(header[:STL_HEADER_SIZE].ljust(STL_HEADER_SIZE, b" "))
+        stl_file.write(struct.pack("<I", 0))  # Patched at the end / 在结尾处回填
+
+        for vertices, triangles in _iter_meshes(meshes):
+            vertices = np.asarray(vertices, dtype=np.float64)
+            triangles = np.asarray(triangles)
+            for start in range(0, len(triangles), block_triangles):
+                corners = vertices[triangles[start:start + block_triangles]]
+                block = np.zeros(len(corners), dtype=STL_FACET_DTYPE)
+                block["normal"] = facet_normals(corners)
+                block["v0"] = corners[:, 0]
+                block["v1"] = corners[:, 1]
+                block["v2"] = corners[:, 2]
+                stl_file.write(block.tobytes())
+                nb_triangles += len(block)
+
+        # Patch the triangle count now that the total is known.
+        # # 总数已知，回填三角形数量。
+        stl_file.seek(STL_HEADER_SIZE)
+        stl_file.write(struct.pack("<I", nb_triangles))
+    return nb_triangles
+
+def run_streaming_writer_example():
+    """
+    Streams the mesh chunks of a shape straight into a binary STL file.
+    # 将一个形状的网格数据块直接流式写入二进制STL文件。
+    """
+    print("--- Streaming Binary STL Writer ---")
+    # --- 流式二进制STL写入器 ---
+
+    # 1. Create a shape; no need to keep its triangulation around.
+    # 1. 创建一个形状；无需保留其三角化数据。
+    box = BRepPrimAPI_MakeBox(100, 100, 100).Shape()
+    sphere = BRepPrimAPI_MakeSphere(75).Shape()
+    shape = BRepAlgoAPI_Fuse(box, sphere).Shape()
+
+    # 2. Mesh and write chunk by chunk.
+    # 2. 逐块网格化并写入。
+    stl_file_path = "streamed_model.stl"
+    chunks = iter_mesh_chunks(shape, 0.1, max_triangles=5000, release=True)
+    nb_triangles = write_binary_stl(stl_file_path, chunks)
+    print(f"Wrote {nb_triangles} triangles to {stl_file_path}.")
+    # 已向 {stl_file_path} 写入 {nb_triangles} 个三角形。
+
+    # 3. Verification: the file size matches the header and OCCT can read it.
+    # 3. 验证：文件大小与文件头一致，并且OCCT可以读取它。
+    assert os.path.getsize(stl_file_path) == STL_HEADER_SIZE + 4 + nb_triangles * STL_FACET_DTYPE.itemsize
+    shape_to_read = TopoDS_Shape()
+    assert StlAPI_Reader().Read(shape_to_read, stl_file_path)
+    assert not shape_to_read.IsNull()
+    print("Verification successful: StlAPI_Reader read the streamed file.")
+    # 验证成功：StlAPI_Reader 读取了流式写出的文件。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(stl_file_path):
+        os.remove(stl_file_path)
+
+if __name__ == '__main__':
+    run_streaming_writer_example()
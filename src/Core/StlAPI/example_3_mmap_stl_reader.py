@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 3: Memory-mapped Binary STL Reader
+# StlAPI 示例 3：基于内存映射的二进制STL读取器
+
+`StlAPI_Reader.Read` (see `example.py`) builds one `TopoDS_Face` per triangle.
+For a scan with millions of triangles this takes minutes and gigabytes. When
+only the triangles are needed, the file can be mapped into memory and viewed as
+a NumPy structured array without copying anything. An optional, vectorized
+deduplication step then turns the triangle soup into an indexed mesh.
+# `StlAPI_Reader.Read`（见 `example.py`）为每个三角形构建一个 `TopoDS_Face`。
+# 对于拥有数百万三角形的扫描数据，这需要数分钟和数GB内存。如果只需要三角形数据，
+# 可以把文件映射到内存中，以 NumPy 结构化数组的形式查看，而无需任何复制。
+# 之后可选的向量化去重步骤可以把三角形集合转换为索引网格。
+"""
+
+import os
+import time
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeSphere
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.StlAPI import StlAPI_Writer, StlAPI_Reader
+from OCC.Core.TopoDS import TopoDS_Shape
+
+from occt_helpers.blobs import count_faces
+from example_2_streaming_stl_writer import STL_FACET_DTYPE, STL_HEADER_SIZE
+
+def read_binary_stl(path):
+    """
+    Maps a binary STL file and returns its facets as a structured array.
+    # 映射一个二进制STL文件，并以结构化数组的形式返回其面片。
+
+    The result is a read-only `np.memmap` with the fields `normal`, `v0`,
+    `v1`, `v2` and `attr`; no facet data is copied or parsed up front.
+    # 结果是一个只读的 `np.memmap`，包含 `normal`、`v0`、`v1`、`v2` 和 `attr` 字段；
+    # 不会预先复制或解析任何面片数据。
+    """
+    file_size = os.path.getsize(path)
+    if file_size < STL_HEADER_SIZE + 4:
+        raise ValueError(f"{path} is too small to be a binary STL file")
+    with open(path, "rb") as stl_file:
+        stl_file.seek(STL_HEADER_SIZE)
+        nb_triangles = int(np.frombuffer(stl_file.read(4), dtype="<u4")[0])
+
+    # An ASCII file (or a truncated binary one) fails this size check.
+    # # ASCII文件（或被截断的二进制文件）无法通过这个大小检查。
+    expected_size = STL_HEADER_SIZE + 4 + nb_triangles * STL_FACET_DTYPE.itemsize
+    if file_size != expected_size:
+        raise ValueError(f"{path} is not a binary STL file: expected {expected_size} bytes, found {file_size}")
+    if nb_triangles == 0:
+        return np.zeros(0, dtype=STL_FACET_DTYPE)
+    return np.memmap(path, dtype=STL_FACET_DTYPE, mode="r", offset=STL_HEADER_SIZE + 4, shape=(nb_triangles,))
+
+def index_facets(facets):
+    """
+    Deduplicates the corners of STL facets into an indexed mesh.
+    # 将STL面片的角点去重，生成索引网格。
+
+    Corners are merged only when their float32 coordinates are bit-identical,
+    which is how a writer stores a vertex shared by several facets. Returns
+    `(vertices, triangles)` with float64 vertices and int64 indices.
+    # 只有当 float32 坐标按位完全相同时角点才会被合并，这正是写入器存储多个面片共享顶点的方式。
+    # 返回 `(vertices, triangles)`，顶点为 float64，索引为 int64。
+    """
+    corners = np.stack([facets["v0"], facets["v1"], facets["v2"]], axis=1).reshape(-1, 3)
+    corners = np.ascontiguousarray(corners, dtype="<f4")
+
+    # View each corner as one opaque 12-byte key so `np.unique` compares rows.
+    # # 将每个角点视为一个12字节的不透明键，使 `np.unique` 按行比较。
+    keys = corners.view(np.dtype((np.void, corners.dtype.itemsize * 3))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    vertices = corners[first].astype(np.float64)
+    triangles = inverse.reshape(-1, 3).astype(np.int64)
+    return vertices, triangles
+
+def run_mmap_reader_example():
+    """
+    Compares the memory-mapped reader with `StlAPI_Reader`.
+    # 比较内存映射读取器与 `StlAPI_Reader`。
+    """
+    print("--- Memory-mapped STL Reader ---")
+    # --- 内存映射STL读取器 ---
+
+    # 1. Write a binary STL file with OCCT.
+    # 1. 使用OCCT写出一个二进制STL文件。
+    sphere = BRepPrimAPI_MakeSphere(50.0).Shape()
+    BRepMesh_IncrementalMesh(sphere, 0.05)
+    stl_file_path = "mmap_model.stl"
+    stl_writer = StlAPI_Writer()
+    stl_writer.SetASCIIMode(False)
+    assert stl_writer.Write(sphere, stl_file_path)
+
+    # 2. Read it as a zero-copy NumPy view and index it.
+    # 2. 以零复制的 NumPy 视图读取，并建立索引。
+    start = time.perf_counter()
+    facets = read_binary_stl(stl_file_path)
+    vertices, triangles = index_facets(facets)
+    mmap_time = time.perf_counter() - start
+    print(f"mmap reader:   {len(facets)} facets, {len(vertices)} unique vertices in {mmap_time:.3f} s")
+    # mmap读取器：... 个面片，... 个唯一顶点，用时 ... 秒
+
+    # 3. Read it with StlAPI_Reader for comparison.
+    # 3. 使用 StlAPI_Reader 读取以作比较。
+    start = time.perf_counter()
+    shape_to_read = TopoDS_Shape()
+    assert StlAPI_Reader().Read(shape_to_read, stl_file_path)
+    nb_faces = count_faces(shape_to_read)
+    occt_time = time.perf_counter() - start
+    print(f"StlAPI_Reader: {nb_faces} faces in {occt_time:.3f} s")
+    # StlAPI_Reader：... 个面，用时 ... 秒
+
+    # 4. Verification
+    # 4. 验证
+    assert len(facets) == nb_faces == len(triangles)
+    assert len(vertices) < 3 * len(facets)
+    print("Verification successful: both readers found the same triangles.")
+    # 验证成功：两个读取器找到了相同的三角形。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    del facets
+    if os.path.exists(stl_file_path):
+        os.remove(stl_file_path)
+
+if __name__ == '__main__':
+    run_mmap_reader_example()
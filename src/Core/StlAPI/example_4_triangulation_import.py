@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 4: Importing STL into a Single Mesh-backed Face
+# StlAPI 示例 4：将STL导入为单个以网格为载体的面
+
+There is a middle ground between raw NumPy arrays (`example_3_mmap_stl_reader.py`)
+and the face-per-triangle shape built by `StlAPI_Reader`: load the whole file
+into one `Poly_Triangulation` and attach it to a single `TopoDS_Face`, the way
+`RWStl.ReadFile` does it. Only O(1) topology objects are created, yet OCCT
+tools that understand triangulations (bounding boxes, `BRepExtrema`,
+display) can use the result directly.
+# 在原始 NumPy 数组（`example_3_mmap_stl_reader.py`）和 `StlAPI_Reader` 构建的“每个三角形一个面”的形状之间，
+# 还有一种折中方式：像 `RWStl.ReadFile` 那样把整个文件加载到一个 `Poly_Triangulation` 中，并挂到单个 `TopoDS_Face` 上。
+# 这样只创建 O(1) 个拓扑对象，而能够理解三角化数据的OCCT工具（包围盒、`BRepExtrema`、显示）可以直接使用结果。
+"""
+
+import os
+import time
+
+# --- Imports ---
+# --- 导入 ---
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeSphere
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.BRep import BRep_Builder, BRep_Tool
+from OCC.Core.TopAbs import TopAbs_FACE
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.RWStl import rwstl
+from OCC.Core.StlAPI import StlAPI_Writer, StlAPI_Reader
+from OCC.Core.TopoDS import TopoDS_Shape, TopoDS_Face, topods
+
+from occt_helpers.blobs import count_faces
+from occt_helpers.mesh import arrays_to_triangulation
+from example_3_mmap_stl_reader import read_binary_stl, index_facets
+
+def face_from_triangulation(triangulation):
+    """
+    Wraps a `Poly_Triangulation` in a single face without any surface.
+    # 将一个 `Poly_Triangulation` 包装为一个没有曲面的单个面。
+    """
+    face = TopoDS_Face()
+    BRep_Builder().MakeFace(face, triangulation)
+    return face
+
+def triangulation_from_arrays(vertices, triangles):
+    """
+    Builds a `Poly_Triangulation` from an indexed mesh with zero-based indices.
+    # 由零起始索引的索引网格构建 `Poly_Triangulation`。
+    """
+    return arrays_to_triangulation(vertices, triangles + 1)
+
+def read_stl(path, mode="triangulation"):
+    """
+    Reads an STL file in one of four import modes.
+    # 以四种导入模式之一读取STL文件。
+
+    - `"shape"`: `StlAPI_Reader`, one `TopoDS_Face` per triangle.
+      # `"shape"`：`StlAPI_Reader`，每个三角形一个 `TopoDS_Face`。
+    - `"triangulation"` (default): `RWStl.ReadFile`, one face backed by one
+      `Poly_Triangulation`, parsed and filled in C++.
+      # `"triangulation"`（默认）：`RWStl.ReadFile`，一个由单个 `Poly_Triangulation` 支撑的面，解析和填充都在C++中完成。
+    - `"numpy_triangulation"`: the same face, built from the memory-mapped,
+      deduplicated facets. Every node and triangle is set from Python, so
+      this is slower than `"triangulation"` on large files; it is meant for
+      meshes that are already NumPy arrays. Files that are not binary STL are
+      handed to `RWStl.ReadFile`.
+      # `"numpy_triangulation"`：同样的面，由内存映射并去重后的面片构建。每个节点和三角形都在Python中设置，
+      # 因此在大文件上比 `"triangulation"` 慢；它适用于已经是 NumPy 数组的网格。不是二进制STL的文件交给 `RWStl.ReadFile` 处理。
+    - `"arrays"`: memory-mapped binary STL as an indexed `(vertices, triangles)` mesh.
+      # `"arrays"`：内存映射的二进制STL，返回索引网格 `(vertices, triangles)`。
+    """
+    if mode == "shape":
+        shape = TopoDS_Shape()
+        if not StlAPI_Reader().Read(shape, path):
+            raise RuntimeError(f"StlAPI_Reader failed to read {path}")
+        return shape
+    if mode == "numpy_triangulation":
+        try:
+            facets = read_binary_stl(path)
+        except ValueError:
+            return read_stl(path, "triangulation")
+        return face_from_triangulation(triangulation_from_arrays(*index_facets(facets)))
+    if mode == "triangulation":
+        triangulation = rwstl.ReadFile(path)
+        if triangulation is None:
+            raise RuntimeError(f"RWStl failed to read {path}")
+        return face_from_triangulation(triangulation)
+    if mode == "arrays":
+        return index_facets(read_binary_stl(path))
+    raise ValueError(f"Unknown STL import mode: {mode!r}")
+
+def _current_rss_mb():
+    """
+    Returns the current resident memory of this process in MB, or None where
+    `/proc/self/statm` is not available.
+    # 返回当前进程的常驻内存（MB）；如果无法读取 `/proc/self/statm` 则返回 None。
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return None
+
+def run_triangulation_import_example():
+    """
+    Compares the single-face import mode with `StlAPI_Reader`.
+    # 比较单面导入模式与 `StlAPI_Reader`。
+    """
+    print("--- STL Import into a Poly_Triangulation ---")
+    # --- 将STL导入为 Poly_Triangulation ---
+
+    # 1. Write a binary STL file with OCCT.
+    # 1. 使用OCCT写出一个二进制STL文件。
+    sphere = BRepPrimAPI_MakeSphere(50.0).Shape()
+    BRepMesh_IncrementalMesh(sphere, 0.05)
+    stl_file_path = "triangulation_model.stl"
+    stl_writer = StlAPI_Writer()
+    stl_writer.SetASCIIMode(False)
+    assert stl_writer.Write(sphere, stl_file_path)
+
+    # 2. Load it in each mode, measuring time, throughput and (where available) memory growth.
+    # 2. 以每种模式加载，测量耗时、吞吐量和内存增长（如果可用）。
+    nb_facets = len(read_binary_stl(stl_file_path))
+    print(f"  {nb_facets} facets")
+    # ... 个面片
+    results, timings = {}, {}
+    for mode in ("triangulation", "numpy_triangulation", "shape"):
+        rss_before = _current_rss_mb()
+        start = time.perf_counter()
+        results[mode] = read_stl(stl_file_path, mode)
+        timings[mode] = elapsed = time.perf_counter() - start
+        rss_after = _current_rss_mb()
+        growth = f"+{rss_after - rss_before:.1f} MB" if rss_before is not None else "RSS n/a"
+        print(f"  {mode:<20} {elapsed:.3f} s, {nb_facets / elapsed / 1e6:.2f} M facets/s, {growth}, "
+              f"{count_faces(results[mode])} face(s)")
+        #   {模式} ... 秒, ... 百万面片/秒, +... MB（或 RSS 不可用）, ... 个面
+    print(f"  numpy_triangulation / triangulation: {timings['numpy_triangulation'] / timings['triangulation']:.1f}x the time")
+    # numpy_triangulation 与 triangulation 的耗时之比
+
+    # 3. OCCT tools work directly on the mesh-backed face.
+    # 3. OCCT工具可以直接作用于以网格为载体的面。
+    bbox = Bnd_Box()
+    brepbndlib.Add(results["triangulation"], bbox, True)
+    xmin, ymin, zmin, xmax, ymax, zmax = bbox.Get()
+    print(f"\nBounding box of the mesh-backed face: ({xmin:.1f}, {ymin:.1f}, {zmin:.1f}) - ({xmax:.1f}, {ymax:.1f}, {zmax:.1f})")
+    # 以网格为载体的面的包围盒：...
+
+    # 4. Verification
+    # 4. 验证
+    assert count_faces(results["triangulation"]) == 1
+    triangulations = [BRep_Tool.Triangulation(topods.Face(TopExp_Explorer(results[mode], TopAbs_FACE).Current()),
+                                              TopLoc_Location()) for mode in ("triangulation", "numpy_triangulation")]
+    assert triangulations[0].NbTriangles() == triangulations[1].NbTriangles()
+    assert abs(xmax - 50.0) < 1.0
+    print("Verification successful: the STL was loaded into a single face.")
+    # 验证成功：STL已被加载到单个面中。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(stl_file_path):
+        os.remove(stl_file_path)
+
+if __name__ == '__main__':
+    run_triangulation_import_example()
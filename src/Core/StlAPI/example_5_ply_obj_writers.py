@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 5: Indexed PLY and OBJ Mesh Writers
+# StlAPI 示例 5：带索引的 PLY 和 OBJ 网格写入器
+
+Binary STL (see `example_2_streaming_stl_writer.py`) has no shared vertices
+and no per-face data. Simulation tools downstream prefer indexed formats, so
+this file writes the same triangulation arrays as:
+# 二进制STL（见 `example_2_streaming_stl_writer.py`）没有共享顶点，也没有逐面的数据。
+# 下游的仿真工具更喜欢带索引的格式，因此本文件将同样的三角化数组写出为：
+
+- binary PLY, packed directly from NumPy structured arrays, with the B-Rep
+  `face_id` stored as a property of every triangle,
+  # 二进制PLY，直接由 NumPy 结构化数组打包，并将B-Rep的 `face_id` 作为每个三角形的属性存储，
+- ASCII OBJ, formatted a whole block at a time with a single `%` operation
+  instead of one Python string per vertex, with one group per B-Rep face.
+  # ASCII OBJ，每次用一个 `%` 运算格式化一整块数据，而不是为每个顶点生成一个Python字符串，并且每个B-Rep面一个分组。
+"""
+
+import os
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox, BRepPrimAPI_MakeSphere
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+
+from occt_helpers.mesh import build_welded_mesh
+
+PLY_FACE_DTYPE = np.dtype([("count", "u1"), ("vertex_indices", "<i4", (3,)), ("face_id", "<i4")])
+
+def write_ply(path, vertices, triangles, face_ids=None):
+    """
+    Writes an indexed mesh as binary little-endian PLY.
+    # 将索引网格写出为二进制小端序PLY。
+
+    When `face_ids` is given it is stored as an `int face_id` property of the
+    `face` element.
+    # 如果提供了 `face_ids`，它会作为 `face` 元素的 `int face_id` 属性存储。
+    """
+    header = [
+        "ply",
+        "format binary_little_endian 1.0",
+        f"element vertex {len(vertices)}",
+        "property float x",
+        "property float y",
+        "property float z",
+        f"element face {len(triangles)}",
+        "property list uchar int vertex_indices",
+    ]
+    face_dtype = PLY_FACE_DTYPE
+    if face_ids is None:
+        face_dtype = np.dtype(PLY_FACE_DTYPE.descr[:2])
+    else:
+        header.append("property int face_id")
+    header.append("end_header")
+
+    faces = np.empty(len(triangles), dtype=face_dtype)
+    faces["count"] = 3
+    faces["vertex_indices"] = triangles
+    if face_ids is not None:
+        faces["face_id"] = face_ids
+
+    with open(path, "wb") as ply_file:
+        ply_file.write(("\n".join(header) + "\n").encode("ascii"))
+        ply_file.write(np.ascontiguousarray(vertices, dtype="<f4").tobytes())
+        ply_file.write(faces.tobytes())
+
+def _write_rows(text_file, row_format, rows, block_rows=1 << 18):
+    """
+    Formats a 2D array with one `%` operation per block of rows.
+    # 每一块数据行只用一次 `%` 运算来格式化二维数组。
+    """
+    for start in range(0, len(rows), block_rows):
+        block = rows[start:start + block_rows]
+        text_file.write((row_format * len(block)) % tuple(block.ravel().tolist()))
+
+def write_obj(path, vertices, triangles, face_ids=None):
+    """
+    Writes an indexed mesh as ASCII OBJ.
+    # 将索引网格写出为ASCII OBJ。
+
+    OBJ has no per-triangle attributes, so when `face_ids` is given the
+    triangles are grouped by face and each group is named `face_<id>`.
+    # OBJ 没有逐三角形的属性，因此如果提供了 `face_ids`，三角形会按面分组，每组命名为 `face_<id>`。
+    """
+    with open(path, "w") as obj_file:
+        obj_file.write(f"# {len(vertices)} vertices, {len(triangles)} triangles\n")
+        _write_rows(obj_file, "v %.9g %.9g %.9g\n", np.asarray(vertices, dtype=np.float64))
+
+        # OBJ indices are one-based.
+        # # OBJ 的索引从1开始。
+        faces = np.asarray(triangles, dtype=np.int64) + 1
+        if face_ids is None or len(faces) == 0:
+            # Without triangles there are no groups to split.
+            # # 没有三角形时也就没有需要拆分的组。
+            _write_rows(obj_file, "f %d %d %d\n", faces)
+            return
+
+        order = np.argsort(face_ids, kind="stable")
+        sorted_ids = np.asarray(face_ids)[order]
+        boundaries = np.flatnonzero(np.diff(sorted_ids)) + 1
+        for group in np.split(order, boundaries):
+            obj_file.write(f"g face_{face_ids[group[0]]}\n")
+            _write_rows(obj_file, "f %d %d %d\n", faces[group])
+
+def run_ply_obj_example():
+    """
+    Writes the welded mesh of a shape as PLY and OBJ.
+    # 将一个形状的焊接网格写出为PLY和OBJ。
+    """
+    print("--- Indexed PLY / OBJ Writers ---")
+    # --- 带索引的 PLY / OBJ 写入器 ---
+
+    # 1. Create, mesh and weld a shape.
+    # 1. 创建、网格化并焊接一个形状。
+    box = BRepPrimAPI_MakeBox(100, 100, 100).Shape()
+    sphere = BRepPrimAPI_MakeSphere(75).Shape()
+    shape = BRepAlgoAPI_Fuse(box, sphere).Shape()
+    BRepMesh_IncrementalMesh(shape, 0.1)
+    mesh = build_welded_mesh(shape)
+    vertices, triangles, face_ids = mesh["vertices"], mesh["triangles"], mesh["face_ids"]
+
+    # 2. Write both formats.
+    # 2. 写出两种格式。
+    ply_file_path, obj_file_path = "indexed_model.ply", "indexed_model.obj"
+    write_ply(ply_file_path, vertices, triangles, face_ids)
+    write_obj(obj_file_path, vertices, triangles, face_ids)
+    for path in (ply_file_path, obj_file_path):
+        print(f"Wrote {path}: {os.path.getsize(path)} bytes")
+        # 已写出 {path}：... 字节
+
+    # 3. Verification: the binary payload has the expected size.
+    # 3. 验证：二进制数据的大小符合预期。
+    with open(ply_file_path, "rb") as ply_file:
+        header_size = ply_file.read().index(b"end_header\n") + len(b"end_header\n")
+    expected = header_size + 12 * len(vertices) + PLY_FACE_DTYPE.itemsize * len(triangles)
+    assert os.path.getsize(ply_file_path) == expected
+    with open(obj_file_path) as obj_file:
+        assert sum(1 for line in obj_file if line.startswith("f ")) == len(triangles)
+    print("Verification successful: both files contain the whole mesh.")
+    # 验证成功：两个文件都包含完整的网格。
+
+    # --- Clean up the created files ---
+    # --- 清理创建的文件 ---
+    for path in (ply_file_path, obj_file_path):
+        os.remove(path)
+
+if __name__ == '__main__':
+    run_ply_obj_example()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 6: Fast Chunked ASCII STL Parser
+# StlAPI 示例 6：快速的分块ASCII STL解析器
+
+Suppliers still send ASCII STL, and parsing a 1 GB text file facet by facet is
+slow. This parser works on large blocks instead:
+# 供应商仍然会发送ASCII STL，而逐个面片地解析1GB的文本文件非常慢。这个解析器改为按大块处理：
+
+1.  The file is cut into segments whose boundaries fall right after an
+    `endfacet` keyword, so no facet is split.
+    # 1. 文件被切分为若干段，每段的边界都紧跟在 `endfacet` 关键字之后，因此不会拆开任何面片。
+2.  In each segment the keywords are stripped and the remaining numbers are
+    split and converted in one `np.array` call.
+    # 2. 在每一段中去掉关键字，剩下的数字通过一次 `np.array` 调用完成拆分和转换。
+3.  Segments are parsed in parallel worker processes (the tokenizer holds the
+    GIL, so threads would not run concurrently).
+    # 3. 各段在并行的工作进程中解析（分词器会持有GIL，因此线程无法真正并发）。
+
+The result is the same structured facet array as the binary reader in
+`example_3_mmap_stl_reader.py`, so `index_facets` and
+`triangulation_from_arrays` work on it unchanged.
+# 结果与 `example_3_mmap_stl_reader.py` 中二进制读取器返回的结构化面片数组相同，
+# 因此 `index_facets` 和 `triangulation_from_arrays` 可以直接使用。
+"""
+
+import os
+import re
+import mmap
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeSphere
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.StlAPI import StlAPI_Writer, StlAPI_Reader
+from OCC.Core.TopoDS import TopoDS_Shape
+
+from example_2_streaming_stl_writer import STL_FACET_DTYPE
+from occt_helpers.blobs import count_faces
+from example_3_mmap_stl_reader import index_facets
+from example_4_triangulation_import import triangulation_from_arrays, face_from_triangulation
+
+# Multi-word keywords are split into single tokens, so any whitespace may separate them.
+# # 多词关键字被拆分为单个记号，因此它们之间可以是任意空白。
+STL_KEYWORDS = frozenset((b"facet", b"normal", b"outer", b"loop", b"vertex", b"endloop", b"endfacet"))
+SOLID_LINE = re.compile(rb"(?:end)?solid[^\n]*")
+
+def find_segments(path, nb_segments):
+    """
+    Returns `(start, end)` byte ranges that each hold whole facets.
+    # 返回若干 `(start, end)` 字节范围，每个范围都只包含完整的面片。
+    """
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as stl_file, mmap.mmap(stl_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for i in range(1, nb_segments):
+            position = data.find(b"endfacet", max(boundaries[-1], size * i // nb_segments))
+            if position < 0:
+                break
+            boundaries.append(position + len(b"endfacet"))
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+def _parse_segment(job):
+    """
+    Worker: tokenizes one segment into an (N, 12) float32 array.
+    # 工作进程：将一段文本分词为 (N, 12) 的 float32 数组。
+
+    Each row holds the facet normal followed by its three vertices.
+    # 每一行依次为面片法向及其三个顶点。
+    """
+    path, start, end = job
+    with open(path, "rb") as stl_file, mmap.mmap(stl_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        text = data[start:end].lower()
+
+    # Drop `solid name` / `endsolid name` lines; names may contain digits.
+    # # 去掉 `solid name` / `endsolid name` 行；名称中可能包含数字。
+    if b"solid" in text:
+        text = SOLID_LINE.sub(b" ", text)
+
+    # `split()` handles tabs and repeated spaces and leaves nothing for a
+    # segment holding only `endsolid`; a stray token raises instead of being
+    # silently dropped.
+    # # `split()` 能处理制表符和连续空格，对于只包含 `endsolid` 的段不会留下任何内容；
+    # # 多余的记号会直接报错，而不会被悄悄丢弃。
+    tokens = [token for token in text.split() if token not in STL_KEYWORDS]
+    if not tokens:
+        return np.empty((0, 12), dtype=np.float32)
+    try:
+        values = np.array(tokens, dtype=np.float32)
+    except ValueError as error:
+        raise ValueError(f"malformed ASCII STL between bytes {start} and {end} of {path}: {error}") from None
+    if len(values) % 12:
+        raise ValueError(f"malformed ASCII STL between bytes {start} and {end} of {path}")
+    return values.reshape(-1, 12)
+
+def read_ascii_stl(path, workers=None, nb_segments=None):
+    """
+    Parses an ASCII STL file into the structured facet array of the binary reader.
+    # 将ASCII STL文件解析为与二进制读取器相同的结构化面片数组。
+
+    `workers=1` parses in the current process. By default the file is split
+    into a few segments per worker so that uneven segments balance out.
+    # `workers=1` 时在当前进程中解析。默认情况下，每个工作进程会分到几段，以平衡各段的不均匀。
+    """
+    workers = workers or os.cpu_count()
+    nb_segments = nb_segments or workers * 4
+    jobs = [(path, start, end) for start, end in find_segments(path, nb_segments)]
+    if workers == 1:
+        parts = [_parse_segment(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_parse_segment, jobs))
+
+    rows = np.concatenate(parts) if parts else np.empty((0, 12), dtype=np.float32)
+    facets = np.zeros(len(rows), dtype=STL_FACET_DTYPE)
+    facets["normal"] = rows[:, 0:3]
+    facets["v0"] = rows[:, 3:6]
+    facets["v1"] = rows[:, 6:9]
+    facets["v2"] = rows[:, 9:12]
+    return facets
+
+def run_ascii_parser_example():
+    """
+    Parses an ASCII STL file and compares it with `StlAPI_Reader`.
+    # 解析一个ASCII STL文件，并与 `StlAPI_Reader` 进行比较。
+    """
+    print("--- Fast ASCII STL Parser ---")
+    # --- 快速ASCII STL解析器 ---
+
+    # 1. Write an ASCII STL file with OCCT.
+    # 1. 使用OCCT写出一个ASCII STL文件。
+    sphere = BRepPrimAPI_MakeSphere(50.0).Shape()
+    BRepMesh_IncrementalMesh(sphere, 0.05)
+    stl_file_path = "ascii_model.stl"
+    stl_writer = StlAPI_Writer()
+    stl_writer.SetASCIIMode(True)
+    assert stl_writer.Write(sphere, stl_file_path)
+    print(f"Wrote {stl_file_path}: {os.path.getsize(stl_file_path)} bytes")
+    # 已写出 {stl_file_path}：... 字节
+
+    # 2. Parse it in parallel segments.
+    # 2. 以并行分段的方式解析。
+    start = time.perf_counter()
+    facets = read_ascii_stl(stl_file_path)
+    parse_time = time.perf_counter() - start
+    print(f"Chunked parser: {len(facets)} facets in {parse_time:.3f} s")
+    # 分块解析器：... 个面片，用时 ... 秒
+
+    # 3. Feed the same outputs as the binary reader.
+    # 3. 输出与二进制读取器相同的结果。
+    vertices, triangles = index_facets(facets)
+    face = face_from_triangulation(triangulation_from_arrays(vertices, triangles))
+
+    start = time.perf_counter()
+    shape_to_read = TopoDS_Shape()
+    assert StlAPI_Reader().Read(shape_to_read, stl_file_path)
+    nb_faces = count_faces(shape_to_read)
+    print(f"StlAPI_Reader:  {nb_faces} faces in {time.perf_counter() - start:.3f} s")
+    # StlAPI_Reader：... 个面，用时 ... 秒
+
+    # 4. A tiny file split into more segments than it has facets.
+    # 4. 一个很小的文件，被切分成比面片数更多的段。
+    tiny_path = "ascii_tiny.stl"
+    with open(tiny_path, "w") as tiny_file:
+        tiny_file.write("solid tiny\n")
+        for i in range(2):
+            tiny_file.write(f"facet normal 0 0 1\nouter loop\nvertex {i} 0 0\nvertex 1 1 0\nvertex 0 1 0\n"
+                            "endloop\nendfacet\n")
+        tiny_file.write("endsolid tiny\n")
+    tiny_facets = read_ascii_stl(tiny_path, workers=1, nb_segments=8)
+    os.remove(tiny_path)
+
+    # 5. Verification
+    # 5. 验证
+    assert len(facets) == nb_faces
+    assert not face.IsNull()
+    assert len(tiny_facets) == 2 and tiny_facets["v0"][1, 0] == 1.0
+    print("Verification successful: both parsers found the same facets.")
+    # 验证成功：两个解析器找到了相同的面片。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(stl_file_path):
+        os.remove(stl_file_path)
+
+if __name__ == '__main__':
+    run_ascii_parser_example()
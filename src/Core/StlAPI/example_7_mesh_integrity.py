@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+StlAPI Example 7: Vectorized Mesh Integrity Checker
+# StlAPI 示例 7：向量化的网格完整性检查器
+
+Before sewing or repairing a scanned STL we need fast diagnostics. Running
+`BRepCheck_Analyzer` on the face-per-triangle shape of `StlAPI_Reader` does not
+finish on large scans, so this file checks the indexed arrays directly. Every
+check is a sort or a hash-join on integer edge keys, with no Python loop over
+triangles:
+# 在缝合或修复扫描得到的STL之前，我们需要快速的诊断。在 `StlAPI_Reader` 生成的“每个三角形一个面”的形状上运行
+# `BRepCheck_Analyzer`，对于大型扫描数据根本无法完成，因此本文件直接检查索引数组。
+# 每项检查都是对整数边键的排序或哈希连接，没有任何针对三角形的Python循环：
+
+- degenerate triangles (repeated vertex or zero area),
+  # 退化三角形（顶点重复或面积为零），
+- duplicate facets (same three vertices, in any order),
+  # 重复面片（三个顶点相同，顺序不限），
+- boundary edges (used once) and non-manifold edges (used more than twice),
+  # 边界边（只被使用一次）和非流形边（被使用超过两次），
+- inconsistent winding (a manifold edge traversed twice in the same direction),
+  # 绕向不一致（一条流形边被以相同方向遍历两次），
+- connected components.
+  # 连通分量。
+"""
+
+import os
+import time
+
+# --- Imports ---
+# --- 导入 ---
+import numpy as np
+
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeSphere
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.StlAPI import StlAPI_Writer
+
+from example_3_mmap_stl_reader import read_binary_stl, index_facets
+
+def _edge_keys(triangles, nb_vertices):
+    """
+    Returns the directed half-edges of all triangles and their undirected keys.
+    # 返回所有三角形的有向半边及其无向键。
+    """
+    starts = triangles.ravel()
+    ends = triangles[:, [1, 2, 0]].ravel()
+    keys = np.minimum(starts, ends) * nb_vertices + np.maximum(starts, ends)
+    return starts, ends, keys
+
+def connected_components(triangles, nb_vertices):
+    """
+    Labels the connected components of a mesh with vectorized union-find.
+    # 使用向量化的并查集标记网格的连通分量。
+
+    Each round hooks the larger root of every edge onto the smaller one and
+    then compresses the paths by pointer jumping. Returns a label per triangle.
+    # 每一轮都把每条边上较大的根挂到较小的根上，然后通过指针跳跃压缩路径。返回每个三角形的标签。
+    """
+    parent = np.arange(nb_vertices)
+    u = triangles[:, [0, 1]].ravel()
+    v = triangles[:, [1, 2]].ravel()
+    while True:
+        pu, pv = parent[u], parent[v]
+        differ = pu != pv
+        if not differ.any():
+            break
+        np.minimum.at(parent, np.maximum(pu, pv)[differ], np.minimum(pu, pv)[differ])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return parent[triangles[:, 0]]
+
+def check_mesh(vertices, triangles, area_tolerance=0.0):
+    """
+    Runs all integrity checks on an indexed mesh and returns a report.
+    # 对索引网格运行所有完整性检查，并返回一份报告。
+
+    The report holds counts (`nb_*`) plus index arrays of the offending
+    triangles or edges, so a repair step can act on them directly.
+    # 报告包含各项计数（`nb_*`）以及有问题的三角形或边的索引数组，修复步骤可以直接使用它们。
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    nb_vertices = len(vertices)
+    if len(triangles) == 0:
+        # Nothing to check; an empty mesh does not count as closed.
+        # # 没有可检查的内容；空网格不算作封闭网格。
+        no_triangles, no_edges = np.empty(0, dtype=np.int64), np.empty((0, 2), dtype=np.int64)
+        return {
+            "nb_vertices": nb_vertices, "nb_triangles": 0, "nb_degenerate": 0, "nb_duplicate_facets": 0,
+            "nb_boundary_edges": 0, "nb_non_manifold_edges": 0, "nb_inconsistent_winding": 0,
+            "nb_components": 0, "is_closed_manifold": False,
+            "degenerate_triangles": no_triangles, "duplicate_triangles": no_triangles,
+            "boundary_edges": no_edges, "non_manifold_edges": no_edges, "inconsistent_edges": no_edges,
+        }
+
+    # Degenerate triangles: repeated index or (near) zero area.
+    # # 退化三角形：索引重复或面积（接近）为零。
+    corners = vertices[triangles]
+    doubled_area = np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1)
+    repeated = ((triangles[:, 0] == triangles[:, 1]) | (triangles[:, 1] == triangles[:, 2])
+                | (triangles[:, 2] == triangles[:, 0]))
+    degenerate = np.flatnonzero(repeated | (doubled_area <= 2 * area_tolerance))
+
+    # Duplicate facets: identical sorted vertex triples end up next to each other.
+    # # 重复面片：排序后相同的顶点三元组会相邻排列。
+    sorted_triangles = np.sort(triangles, axis=1)
+    row_order = np.lexsort(sorted_triangles.T[::-1])
+    same_as_previous = np.all(np.diff(sorted_triangles[row_order], axis=0) == 0, axis=1)
+    duplicates = np.sort(row_order[1:][same_as_previous])
+
+    # Edge usage: sort the undirected keys once and measure the runs.
+    # # 边的使用情况：对无向键排序一次，然后测量每段的长度。
+    starts, ends, keys = _edge_keys(triangles, nb_vertices)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    run_starts = np.concatenate([[0], np.flatnonzero(np.diff(sorted_keys)) + 1])
+    run_counts = np.diff(np.append(run_starts, len(sorted_keys)))
+    unique_keys = sorted_keys[run_starts]
+    boundary_edges = unique_keys[run_counts == 1]
+    non_manifold_edges = unique_keys[run_counts > 2]
+
+    # Winding: the two half-edges of a manifold edge must run in opposite directions.
+    # # 绕向：一条流形边的两条半边必须方向相反。
+    forward = (starts < ends)[order]
+    manifold = run_counts == 2
+    same_direction = forward[run_starts[manifold]] == forward[run_starts[manifold] + 1]
+    flipped_edges = unique_keys[manifold][same_direction]
+
+    labels = connected_components(triangles, nb_vertices)
+
+    def decode(edge_keys):
+        return np.stack([edge_keys // nb_vertices, edge_keys % nb_vertices], axis=1)
+
+    return {
+        "nb_vertices": nb_vertices,
+        "nb_triangles": len(triangles),
+        "nb_degenerate": len(degenerate),
+        "nb_duplicate_facets": len(duplicates),
+        "nb_boundary_edges": len(boundary_edges),
+        "nb_non_manifold_edges": len(non_manifold_edges),
+        "nb_inconsistent_winding": len(flipped_edges),
+        "nb_components": len(np.unique(labels)),
+        "is_closed_manifold": len(boundary_edges) == 0 and len(non_manifold_edges) == 0 and len(flipped_edges) == 0,
+        "degenerate_triangles": degenerate,
+        "duplicate_triangles": duplicates,
+        "boundary_edges": decode(boundary_edges),
+        "non_manifold_edges": decode(non_manifold_edges),
+        "inconsistent_edges": decode(flipped_edges),
+    }
+
+def run_integrity_example():
+    """
+    Checks a clean STL mesh, then a copy with injected defects.
+    # 检查一个干净的STL网格，然后检查一个注入了缺陷的副本。
+    """
+    print("--- Vectorized Mesh Integrity Checker ---")
+    # --- 向量化网格完整性检查器 ---
+
+    # 1. Write and read back a binary STL of a sphere.
+    # 1. 写出并读回一个球体的二进制STL。
+    sphere = BRepPrimAPI_MakeSphere(50.0).Shape()
+    BRepMesh_IncrementalMesh(sphere, 0.05)
+    stl_file_path = "integrity_model.stl"
+    stl_writer = StlAPI_Writer()
+    stl_writer.SetASCIIMode(False)
+    assert stl_writer.Write(sphere, stl_file_path)
+    vertices, triangles = index_facets(read_binary_stl(stl_file_path))
+
+    # 2. Check the clean mesh.
+    # 2. 检查干净的网格。
+    start = time.perf_counter()
+    report = check_mesh(vertices, triangles)
+    print(f"Clean mesh checked in {time.perf_counter() - start:.3f} s:")
+    # 干净网格检查用时 ... 秒：
+    for key, value in report.items():
+        if key.startswith(("nb_", "is_")):
+            print(f"  {key}: {value}")
+
+    # 3. Inject defects: a hole, a duplicate and a flipped triangle.
+    # 3. 注入缺陷：一个孔、一个重复面片和一个翻转的三角形。
+    damaged = triangles[1:].copy()
+    damaged = np.vstack([damaged, damaged[:1]])
+    damaged[10] = damaged[10, ::-1]
+    damaged_report = check_mesh(vertices, damaged)
+    print("\nDamaged mesh:")
+    # 损坏的网格：
+    for key, value in damaged_report.items():
+        if key.startswith(("nb_", "is_")):
+            print(f"  {key}: {value}")
+
+    # 4. Verification
+    # 4. 验证
+    assert report["is_closed_manifold"] and report["nb_components"] == 1
+    assert damaged_report["nb_duplicate_facets"] == 1
+    assert damaged_report["nb_boundary_edges"] >= 3
+    assert damaged_report["nb_inconsistent_winding"] >= 1
+    print("\nVerification successful: all injected defects were detected.")
+    # 验证成功：所有注入的缺陷都被检测到了。
+
+    # --- Clean up the created file ---
+    # --- 清理创建的文件 ---
+    if os.path.exists(stl_file_path):
+        os.remove(stl_file_path)
+
+if __name__ == '__main__':
+    run_integrity_example()
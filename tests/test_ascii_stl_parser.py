@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the chunked ASCII STL parser in `src/Core/StlAPI/example_6_ascii_stl_parser.py`.
+# `src/Core/StlAPI/example_6_ascii_stl_parser.py` 中分块ASCII STL解析器的测试。
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "Core", "StlAPI"))
+
+# The repository's `OCC/` documentation tree shadows a missing pythonocc install, so the
+# skip is keyed on importing the example itself.
+# # 仓库中的 `OCC/` 文档目录会遮蔽未安装的 pythonocc，因此以能否导入示例本身来决定是否跳过。
+parser = pytest.importorskip("example_6_ascii_stl_parser", exc_type=ImportError)
+find_segments, read_ascii_stl = parser.find_segments, parser.read_ascii_stl
+
+def _write_facets(path, nb_facets):
+    with open(path, "w") as stl_file:
+        stl_file.write("solid part_42\n")
+        for i in range(nb_facets):
+            stl_file.write(f"  facet normal 0 0 1\n    outer loop\n      vertex {i} 0 0\n"
+                           "      vertex 1 1 0\n      vertex 0 1 0\n    endloop\n  endfacet\n")
+        stl_file.write("endsolid part_42\n")
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_more_segments_than_facets(tmp_path, workers):
+    path = str(tmp_path / "cube.stl")
+    _write_facets(path, 12)
+    assert len(find_segments(path, 48)) > 12
+    facets = read_ascii_stl(path, workers=workers, nb_segments=48)
+    assert len(facets) == 12
+    assert facets["v0"][:, 0].tolist() == list(range(12))
+
+def test_default_segments_on_small_file(tmp_path):
+    path = str(tmp_path / "one.stl")
+    _write_facets(path, 1)
+    assert len(read_ascii_stl(path)) == 1
+
+def test_malformed_file_raises(tmp_path):
+    path = str(tmp_path / "bad.stl")
+    _write_facets(path, 2)
+    with open(path, "a") as stl_file:
+        stl_file.write("vertex 1 2\n")
+    with pytest.raises(ValueError, match="malformed ASCII STL"):
+        read_ascii_stl(path, workers=1)
+
+def test_keywords_separated_by_any_whitespace(tmp_path):
+    path = str(tmp_path / "tabs.stl")
+    with open(path, "w") as stl_file:
+        stl_file.write("solid tabs\n  facet  normal 0 0 1\n    outer\tloop\n      vertex 0 0 0\n"
+                       "      vertex\t1 0 0\n      vertex 0 1 0\n    endloop\n  endfacet\nendsolid tabs\n")
+    facets = read_ascii_stl(path, workers=1)
+    assert len(facets) == 1
+    assert facets["normal"][0].tolist() == [0, 0, 1]
+    assert facets["v1"][0].tolist() == [1, 0, 0]
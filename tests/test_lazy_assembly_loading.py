@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for `LazyStepAssembly` in `src/Core/STEPControl/example_4_lazy_assembly_loading.py`.
+# `src/Core/STEPControl/example_4_lazy_assembly_loading.py` 中 `LazyStepAssembly` 的测试。
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "Core", "STEPControl"))
+
+# The repository's `OCC/` documentation tree shadows a missing pythonocc install, so the
+# skip is keyed on importing the example itself.
+# # 仓库中的 `OCC/` 文档目录会遮蔽未安装的 pythonocc，因此以能否导入示例本身来决定是否跳过。
+lazy = pytest.importorskip("example_4_lazy_assembly_loading", exc_type=ImportError)
+
+# An assembly whose usage occurrence has no context-dependent shape representation.
+# # 一个装配体，其使用实例没有对应的上下文相关形状表示。
+UNPLACED_ASSEMBLY = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION((''),'2;1');
+FILE_NAME('unplaced.step','2026-01-01T00:00:00',(''),(''),'','','');
+FILE_SCHEMA(('AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1 }'));
+ENDSEC;
+DATA;
+#1=APPLICATION_CONTEXT('automotive design');
+#2=PRODUCT_CONTEXT('',#1,'mechanical');
+#3=PRODUCT_DEFINITION_CONTEXT('part definition',#1,'design');
+#4=PRODUCT('asm','asm','',(#2));
+#5=PRODUCT_DEFINITION_FORMATION('','',#4);
+#6=PRODUCT_DEFINITION('design','',#5,#3);
+#7=PRODUCT('part','part','',(#2));
+#8=PRODUCT_DEFINITION_FORMATION('','',#7);
+#9=PRODUCT_DEFINITION('design','',#8,#3);
+#10=NEXT_ASSEMBLY_USAGE_OCCURRENCE('1','','',#6,#9,$);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+def test_written_assembly_has_no_warnings(tmp_path):
+    path = str(tmp_path / "plant.step")
+    lazy.create_plant_step_file(path)
+    assert lazy.LazyStepAssembly(path).warnings == []
+
+def test_unresolved_placement_is_reported(tmp_path):
+    path = tmp_path / "unplaced.step"
+    path.write_text(UNPLACED_ASSEMBLY)
+    assembly = lazy.LazyStepAssembly(str(path))
+    assert len(assembly.warnings) == 1
+    assert "'part' in 'asm'" in assembly.warnings[0]
+    assert "no transformation found" in assembly.warnings[0]
+    (child, placement), = assembly.products[6]["usages"]
+    assert child == 9 and placement.TranslationPart().Modulus() == 0.0
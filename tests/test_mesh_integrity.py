@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the mesh integrity checker in `src/Core/StlAPI/example_7_mesh_integrity.py`.
+# `src/Core/StlAPI/example_7_mesh_integrity.py` 中网格完整性检查器的测试。
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "Core", "StlAPI"))
+
+# The repository's `OCC/` documentation tree shadows a missing pythonocc install, so the
+# skip is keyed on importing the example itself.
+# # 仓库中的 `OCC/` 文档目录会遮蔽未安装的 pythonocc，因此以能否导入示例本身来决定是否跳过。
+integrity = pytest.importorskip("example_7_mesh_integrity", exc_type=ImportError)
+check_mesh = integrity.check_mesh
+
+@pytest.mark.parametrize("triangles", [[], np.empty((0, 3), dtype=np.int64)])
+def test_empty_mesh(triangles):
+    report = check_mesh(np.zeros((4, 3)), triangles)
+    assert report["nb_triangles"] == 0
+    assert report["nb_components"] == 0
+    assert not report["is_closed_manifold"]
+    assert report["boundary_edges"].shape == (0, 2)
+
+def test_single_triangle_is_open():
+    report = check_mesh(np.eye(3), [[0, 1, 2]])
+    assert report["nb_boundary_edges"] == 3
+    assert report["nb_components"] == 1
+    assert not report["is_closed_manifold"]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the statement-based STEP quick scan in `src/Core/STEPControl/example_7_step_quick_scan.py`.
+# `src/Core/STEPControl/example_7_step_quick_scan.py` 中基于语句的STEP快速扫描的测试。
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "Core", "STEPControl"))
+
+# The repository's `OCC/` documentation tree shadows a missing pythonocc install, so the
+# skip is keyed on importing the example itself.
+# # 仓库中的 `OCC/` 文档目录会遮蔽未安装的 pythonocc，因此以能否导入示例本身来决定是否跳过。
+quick_scan = pytest.importorskip("example_7_step_quick_scan", exc_type=ImportError)
+
+INCH_STEP = """ISO-10303-21;
+HEADER;
+FILE_DESCRIPTION(('Open CASCADE Model'),'2;1');
+FILE_NAME('bracket','2024-01-01T00:00:00',('Author'),(
+    'Open CASCADE'),'Open CASCADE STEP processor 7.9','Open CASCADE 7.9'
+  ,'Unknown');
+FILE_SCHEMA(('AUTOMOTIVE_DESIGN { 1 0 10303 214 1 1 1 1 }'));
+ENDSEC;
+DATA;
+#7 = PRODUCT
+  ('bracket','it''s a bracket','',(#8));
+#10 = ( GEOMETRIC_REPRESENTATION_CONTEXT(3)
+GLOBAL_UNCERTAINTY_ASSIGNED_CONTEXT((#14)) GLOBAL_UNIT_ASSIGNED_CONTEXT(
+(#11,#15)) REPRESENTATION_CONTEXT('Context #1','3D Context') );
+#11 = (
+ CONVERSION_BASED_UNIT('INCH',#12) LENGTH_UNIT() NAMED_UNIT(#13) );
+#12 = LENGTH_MEASURE_WITH_UNIT(LENGTH_MEASURE(25.4),#17);
+#13 = DIMENSIONAL_EXPONENTS(1.,0.,0.,0.,0.,0.,0.);
+#14 = UNCERTAINTY_MEASURE_WITH_UNIT(LENGTH_MEASURE(1.E-07),#11,
+  'distance_accuracy_value','confusion accuracy');
+#15 = ( NAMED_UNIT(*) PLANE_ANGLE_UNIT() SI_UNIT($,.RADIAN.) );
+#17 = ( LENGTH_UNIT() NAMED_UNIT(*) SI_UNIT(.MILLI.,.METRE.) );
+#18 = MANIFOLD_SOLID_BREP('',#19);
+ENDSEC;
+END-ISO-10303-21;
+"""
+
+@pytest.mark.parametrize("block_size", [7, 64, 1 << 24])
+@pytest.mark.parametrize("with_context", [True, False])
+def test_wrapped_statements_and_conversion_units(tmp_path, block_size, with_context):
+    text = INCH_STEP if with_context else INCH_STEP.replace("GLOBAL_UNIT_ASSIGNED_CONTEXT(\n(#11,#15)) ", "")
+    path = tmp_path / "inch.step"
+    path.write_text(text)
+    summary = quick_scan.scan_step_file(str(path), block_size=block_size)
+    assert summary["nb_entities"] == 9
+    assert summary["entities_by_type"]["CONVERSION_BASED_UNIT"] == 1
+    assert summary["product_names"] == ["it's a bracket"]
+    assert summary["length_units"] == ["INCH"]
+    assert summary["nb_solids"] == 1
+    assert summary["originating_system"] == "Open CASCADE 7.9"